@@ -6,48 +6,114 @@ This script automates the process of building a standalone executable using PyIn
 It ensures all dependencies are installed, runs the build process, and verifies the output.
 
 Usage:
-    python build.py [--clean] [--onefile] [--console]
+    python build_exe.py [--clean] [--deep-clean] [--onefile] [--console]
 
 Options:
-    --clean     Clean build artifacts before building
-    --onefile   Build as a single executable file (default)
+    --clean     Clean build artifacts before building (keeps the PyInstaller cache)
+    --deep-clean
+                Also wipe PyInstaller's .pyinstaller-cache/ for a fully fresh build
+    --onefile   Build a single self-extracting file (default is a faster-starting
+                one-folder bundle in dist/tetris/)
     --console   Show console window (for debugging)
 """
 
 import argparse
+import importlib.metadata
+import importlib.util
 import os
-import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-try:
-    import PyInstaller  # pylint: disable=unused-import
-except ImportError:
-    PyInstaller = None  # Will be installed if needed
+# Importable module name -> pip package name (pinned in requirements-build.txt)
+BUILD_DEPENDENCIES = {"PyInstaller": "pyinstaller", "pygame": "pygame"}
+BUILD_REQUIREMENTS = "requirements-build.txt"
+
+# PyInstaller work directory. Kept at a fixed path (cached between CI runs) so warm
+# builds reuse the module analysis and compiled archives instead of redoing them.
+PYINSTALLER_CACHE = Path(".pyinstaller-cache")
+PYINSTALLER_WORKPATH = PYINSTALLER_CACHE / "build"
+
+# First PyInstaller release with the --optimize option (requirements allow older ones)
+PYINSTALLER_OPTIMIZE_VERSION = (6, 6)
 
 
 def check_dependencies():
-    """Check if required build dependencies are installed."""
-    if PyInstaller is None:
-        print("✗ PyInstaller not found. Installing...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-        print("✓ PyInstaller installed")
+    """Check if required build dependencies are installed.
+
+    Modules are looked up with importlib.util.find_spec, which locates them without
+    importing (and initializing) them. Anything missing is installed from
+    requirements-build.txt in a single pip invocation, so a cold setup pays for one
+    resolver run instead of one per package.
+    """
+    missing = [
+        package
+        for module, package in BUILD_DEPENDENCIES.items()
+        if importlib.util.find_spec(module) is None
+    ]
+
+    if missing:
+        print(f"✗ Missing build dependencies: {', '.join(missing)}. Installing...")
+        if Path(BUILD_REQUIREMENTS).exists():
+            cmd = [sys.executable, "-m", "pip", "install", "-r", BUILD_REQUIREMENTS]
+        else:
+            cmd = [sys.executable, "-m", "pip", "install", "--upgrade", *missing]
+        subprocess.check_call(cmd)
+        # Make freshly installed packages importable in this process
+        importlib.invalidate_caches()
+        print("✓ Build dependencies installed")
         return
 
-    print("✓ PyInstaller is installed")
+    print("✓ PyInstaller and pygame are installed")
+
+
+def _fast_rmtree(path):
+    """Delete a directory tree using os.scandir.
+
+    DirEntry caches the file type from the directory listing, so unlike shutil.rmtree
+    no extra stat call is issued per entry. This matters for PyInstaller's work
+    tree, which holds thousands of small files. Directories are walked iteratively
+    and removed once their contents are gone.
+
+    Args:
+        path: Directory to remove
+    """
+    stack = [(os.fspath(path), False)]
+    while stack:
+        current, emptied = stack.pop()
+        if emptied:
+            os.rmdir(current)
+            continue
+
+        stack.append((current, True))
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, False))
+                else:
+                    os.unlink(entry.path)
+
+
+def clean_build_artifacts(deep=False):
+    """Remove previous build artifacts.
 
+    PyInstaller's work directory (.pyinstaller-cache/) holds its module analysis and
+    compiled PYZ caches, which let warm rebuilds skip re-analysing the import graph.
+    It is therefore kept unless a deep clean is requested.
 
-def clean_build_artifacts():
-    """Remove previous build artifacts."""
+    Args:
+        deep: Also remove the PyInstaller cache (and a legacy build/ directory)
+    """
     print("\nCleaning build artifacts...")
-    artifacts = ["build", "dist", "__pycache__"]
+    artifacts = ["dist", "__pycache__"]
+    if deep:
+        artifacts[:0] = [str(PYINSTALLER_CACHE), "build"]
 
     for artifact in artifacts:
         artifact_path = Path(artifact)
         if artifact_path.exists():
             print(f"  Removing {artifact}/")
-            shutil.rmtree(artifact_path)
+            _fast_rmtree(artifact_path)
 
     # Remove auto-generated spec files, keep tetris.spec
     for spec_file in Path(".").glob("*.spec"):
@@ -58,28 +124,49 @@ def clean_build_artifacts():
     print("✓ Build artifacts cleaned")
 
 
-def build_executable(use_spec=True, show_console=False):
+def build_executable(use_spec=True, show_console=False, onefile=False):
     """Build the executable using PyInstaller.
 
     Args:
         use_spec: Use the tetris.spec file (recommended)
         show_console: Show console window in the executable
+        onefile: Build a single self-extracting file instead of a one-folder bundle.
+            Onefile executables unpack themselves to a temp directory on every launch,
+            so only use this for distribution convenience.
     """
     print("\nBuilding executable...")
 
     if use_spec and Path("tetris.spec").exists():
         # Use the spec file for consistent builds
-        cmd = [sys.executable, "-m", "PyInstaller", "tetris.spec"]
+        # --noconfirm replaces dist/ output without prompting; --clean is deliberately
+        # omitted so PyInstaller reuses its cache in the work directory
+        pyinstaller_args = [
+            "--noconfirm",
+            "--workpath",
+            str(PYINSTALLER_WORKPATH),
+            "--distpath",
+            "dist",
+            "tetris.spec",
+        ]
+        # tetris.spec reads the bundle mode from the environment
+        os.environ["TETRIS_ONEFILE"] = "1" if onefile else "0"
         if show_console:
             print("  Note: To enable console, edit tetris.spec and set console=True")
         print("  Using tetris.spec configuration")
     else:
         # Fallback to command-line build
-        cmd = [
-            sys.executable,
-            "-m",
-            "PyInstaller",
-            "--onefile",
+        pyinstaller_args = [
+            "--noconfirm",
+            "--onefile" if onefile else "--onedir",
+            "--workpath",
+            str(PYINSTALLER_WORKPATH),
+            "--distpath",
+            "dist",
+            # Keep the generated spec inside the cache instead of the project root
+            "--specpath",
+            str(PYINSTALLER_CACHE),
+            # Skip UPX so binaries are not decompressed in memory at every launch
+            "--noupx",
             "--name",
             "tetris",
             "--hidden-import",
@@ -92,30 +179,85 @@ def build_executable(use_spec=True, show_console=False):
             "src.tetromino",
         ]
 
+        # Strip asserts and docstrings from the bundled bytecode, as tetris.spec does;
+        # older PyInstaller versions reject the option, so they simply skip it
+        if pyinstaller_version() >= PYINSTALLER_OPTIMIZE_VERSION:
+            pyinstaller_args.extend(["--optimize", "2"])
+
         if not show_console:
-            cmd.append("--windowed")
+            pyinstaller_args.append("--windowed")
 
-        cmd.append("src/tetris.py")
+        pyinstaller_args.append("src/tetris.py")
         print("  Using command-line configuration")
 
-    print(f"  Running: {' '.join(cmd)}")
+    print(f"  Running: pyinstaller {' '.join(pyinstaller_args)}")
 
-    try:
-        subprocess.check_call(cmd)
+    returncode = run_pyinstaller(pyinstaller_args)
+    if returncode == 0:
         print("\n✓ Build completed successfully!")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"\n✗ Build failed with error code {e.returncode}")
-        return False
+
+    print(f"\n✗ Build failed with error code {returncode}")
+    return False
 
 
-def verify_build():
-    """Verify the build output exists."""
+def pyinstaller_version():
+    """Get the installed PyInstaller version without importing PyInstaller.
+
+    Returns:
+        Tuple of the (major, minor) version numbers
+    """
+    version = importlib.metadata.version(BUILD_DEPENDENCIES["PyInstaller"])
+    return tuple(int(part) for part in version.split(".")[:2])
+
+
+def run_pyinstaller(pyinstaller_args):
+    """Run PyInstaller with the given command-line arguments.
+
+    PyInstaller runs in this process through PyInstaller.__main__.run, which saves
+    starting and initializing a second interpreter. Versions without that entry point
+    are run as `python -m PyInstaller` in a subprocess instead.
+
+    Args:
+        pyinstaller_args: Arguments as they would follow `pyinstaller` on the command line
+
+    Returns:
+        Exit code: 0 on success, non-zero on failure
+    """
+    try:
+        import PyInstaller.__main__ as pyinstaller_main  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        pyinstaller_main = None
+
+    run = getattr(pyinstaller_main, "run", None)
+    if run is None:
+        return subprocess.call([sys.executable, "-m", "PyInstaller", *pyinstaller_args])
+
+    try:
+        run(pyinstaller_args)
+    except SystemExit as e:
+        # PyInstaller reports errors (and sometimes success) by exiting
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except Exception as e:  # pylint: disable=broad-except
+        print(f"  PyInstaller raised {type(e).__name__}: {e}")
+        return 1
+    return 0
+
+
+def verify_build(onefile=False):
+    """Verify the build output exists.
+
+    Args:
+        onefile: Whether a single-file executable was built
+    """
     # Platform-specific executable name
-    if sys.platform == "win32":
-        exe_path = Path("dist/tetris.exe")
+    exe_name = "tetris.exe" if sys.platform == "win32" else "tetris"
+    if onefile:
+        exe_path = Path("dist") / exe_name
     else:
-        exe_path = Path("dist/tetris")
+        exe_path = Path("dist/tetris") / exe_name
 
     if exe_path.exists():
         size_mb = exe_path.stat().st_size / (1024 * 1024)
@@ -133,11 +275,15 @@ def main():
     parser.add_argument(
         "--clean", action="store_true", help="Clean build artifacts before building"
     )
+    parser.add_argument(
+        "--deep-clean",
+        action="store_true",
+        help="Also remove PyInstaller's .pyinstaller-cache/ (slower, fully fresh build)",
+    )
     parser.add_argument(
         "--onefile",
         action="store_true",
-        default=True,
-        help="Build as single executable file (default)",
+        help="Build a single self-extracting file (slower startup; default is dist/tetris/)",
     )
     parser.add_argument(
         "--console", action="store_true", help="Show console window (for debugging)"
@@ -161,22 +307,26 @@ def main():
     check_dependencies()
 
     # Clean if requested
-    if args.clean:
-        clean_build_artifacts()
+    if args.clean or args.deep_clean:
+        clean_build_artifacts(deep=args.deep_clean)
 
     # Build executable
     use_spec = not args.no_spec
-    success = build_executable(use_spec=use_spec, show_console=args.console)
+    success = build_executable(use_spec=use_spec, show_console=args.console, onefile=args.onefile)
 
     if success:
         # Verify build
-        if verify_build():
+        if verify_build(onefile=args.onefile):
             print("\n" + "=" * 60)
             print("Build Process Complete!")
             print("=" * 60)
             print("\nNext steps:")
-            print("1. Test the executable: dist/tetris.exe")
-            print("2. Distribute the executable to users")
+            if args.onefile:
+                print("1. Test the executable: dist/tetris.exe")
+                print("2. Distribute the executable to users")
+            else:
+                print("1. Test the executable: dist/tetris/tetris.exe")
+                print("2. Distribute the whole dist/tetris/ folder to users")
             print("\nNote: The executable is standalone and doesn't require Python")
             return 0
 
@@ -12,7 +12,6 @@ Usage:
 import sys
 
 from src.config import GameConfig
-from src.tetris import TetrisGame
 
 
 class QuickDemoConfig(GameConfig):
@@ -73,6 +72,9 @@ def main():
     print("=" * 70)
     print()
 
+    # Imported here so the banner shows before pygame finishes loading
+    from src.tetris import TetrisGame  # pylint: disable=import-outside-toplevel
+
     try:
         game = TetrisGame(QuickDemoConfig)
         game.run()
@@ -3,6 +3,7 @@ Setup configuration for Tetris Ultimate Edition
 """
 
 import os
+import re
 
 from setuptools import find_packages, setup
 
@@ -11,9 +12,13 @@ this_directory = os.path.abspath(os.path.dirname(__file__))
 with open(os.path.join(this_directory, "README.md"), encoding="utf-8") as f:
     long_description = f.read()
 
+# The version is kept in one place, src/__init__.py; read it without importing the package
+with open(os.path.join(this_directory, "src", "__init__.py"), encoding="utf-8") as f:
+    version = re.search(r'^__version__ = "([^"]+)"', f.read(), re.MULTILINE).group(1)
+
 setup(
     name="tetris-ultimate",
-    version="1.2.0",
+    version=version,
     author="GitHub Copilot",
     author_email="",
     description="A modern Tetris game with advanced features",
@@ -38,7 +43,7 @@ setup(
     ],
     entry_points={
         "console_scripts": [
-            "tetris=src.tetris:main",
+            "tetris=src.__main__:main",
         ],
     },
     keywords="tetris game puzzle pygame",
@@ -1,3 +1,4 @@
 """Tetris Ultimate Edition - A modern Tetris game with advanced features."""
 
-__version__ = "1.0.0"
+# Single source of the package version; setup.py and pyproject.toml read it from here
+__version__ = "1.2.0"
@@ -6,10 +6,35 @@ This allows the game to be run with:
     python -m src.tetris
 
 This file ensures proper module imports when the package is run as a script
-or bundled into an executable.
+or bundled into an executable. The game module (and with it pygame) is only
+imported after the command line has been parsed, so --help and --version
+return without loading pygame. Arguments it does not know (for example ones
+passed through by a launcher) are ignored.
 """
 
-from src.tetris import main
+import argparse
+from typing import List, Optional
+
+from src import __version__
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parse command-line options, then import and run the game.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="Tetris Ultimate Edition")
+    parser.add_argument(
+        "--version", action="version", version=f"Tetris Ultimate Edition {__version__}"
+    )
+    parser.parse_known_args(argv)
+
+    # Deferred: importing the game loads and initializes pygame
+    from src.tetris import main as run_game  # pylint: disable=import-outside-toplevel
+
+    run_game()
+
 
 if __name__ == "__main__":
     main()
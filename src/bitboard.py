@@ -0,0 +1,343 @@
+"""
+Row-bitmask board kernels used by the demo AI search.
+
+A board is a list of integers, one per row from top to bottom, where bit x is
+set when column x is filled. Pieces are described by per-row masks of their
+footprint. The functions here take only ints, tuples and lists, and bind
+everything they need to locals, so the tight loops in the AI search run
+without attribute lookups or method dispatch.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.config import Cells
+
+
+def _popcount_fallback(value: int) -> int:
+    """Count set bits on Python versions without int.bit_count (before 3.10)."""
+    return bin(value).count("1")
+
+
+# Number of set bits in a non-negative int: int.bit_count maps to the CPU's
+# popcount instruction where available
+popcount: Callable[[int], int] = getattr(int, "bit_count", _popcount_fallback)
+
+# Piece footprint as row bitmasks: ((row_offset, column_bits), ...), plus the
+# leftmost and rightmost column offsets used by the cells
+PieceMasks = Tuple[Tuple[Tuple[int, int], ...], int, int]
+
+# Per column, the first filled row at or below each row: table[col][row], with
+# grid_height meaning "none down to the floor" (row grid_height is included)
+NextFilled = Tuple[Tuple[int, ...], ...]
+# Packed board with its metrics: (row masks, column heights, filled cell count,
+# full rows, near-full row count, next-filled table). The row masks are a tuple
+# so a board can be used as a dictionary key.
+Board = Tuple[Tuple[int, ...], Tuple[int, ...], int, Tuple[int, ...], int, NextFilled]
+# Metrics after placing a piece: (landing row, column heights, filled cell count,
+# full rows, near-full row count)
+Placed = Tuple[int, List[int], int, Tuple[int, ...], int]
+
+_PIECE_MASKS_CACHE: Dict[Cells, PieceMasks] = {}
+
+
+def piece_row_masks(cells: Cells) -> PieceMasks:
+    """Get the row bitmasks of a piece footprint.
+
+    Bit x of a mask is set when the piece covers column offset x in that row.
+    Results are cached per cells tuple, so each rotation is converted once.
+
+    Args:
+        cells: Filled (col, row) offsets of the piece
+
+    Returns:
+        Tuple of (row_masks, min_dx, max_dx)
+    """
+    masks = _PIECE_MASKS_CACHE.get(cells)
+    if masks is None:
+        rows: Dict[int, int] = {}
+        for dx, dy in cells:
+            rows[dy] = rows.get(dy, 0) | (1 << dx)
+        columns = [dx for dx, _ in cells]
+        masks = (tuple(sorted(rows.items())), min(columns), max(columns))
+        _PIECE_MASKS_CACHE[cells] = masks
+    return masks
+
+
+def grid_to_rows(grid: Sequence[Sequence[Optional[object]]]) -> List[int]:
+    """Convert a grid of cells (None when empty) into one bitmask per row.
+
+    Args:
+        grid: Grid to convert, top to bottom
+
+    Returns:
+        List of row masks; bit x is set when column x is filled
+    """
+    rows = []
+    for row in grid:
+        # Empty and full rows are decided by C-level list scans
+        empty = row.count(None)
+        if empty == len(row):
+            rows.append(0)
+            continue
+        if not empty:
+            rows.append((1 << len(row)) - 1)
+            continue
+        mask = 0
+        bit = 1
+        for cell in row:
+            if cell is not None:
+                mask |= bit
+            bit <<= 1
+        rows.append(mask)
+    return rows
+
+
+def piece_fits(rows: Sequence[int], masks: PieceMasks, x: int, y: int, width: int) -> bool:
+    """Check a piece footprint against the walls, the floor and the board.
+
+    Rows above the board (negative y) are open, like the game's spawn area.
+
+    Args:
+        rows: Board row masks
+        masks: Piece footprint from piece_row_masks
+        x: Piece column
+        y: Piece row
+        width: Board width in columns
+
+    Returns:
+        True if no piece cell leaves the board sides or bottom or overlaps a block
+    """
+    row_masks, min_dx, max_dx = masks
+    if x + min_dx < 0 or x + max_dx >= width:
+        return False
+    height = len(rows)
+    for dy, mask in row_masks:
+        row = y + dy
+        if row >= height:
+            return False
+        # x can be negative when the footprint has empty leading columns
+        if row >= 0 and rows[row] & (mask << x if x >= 0 else mask >> -x):
+            return False
+    return True
+
+
+def next_filled_rows(rows: Sequence[int], width: int) -> NextFilled:
+    """Build the per-column "next filled row at or below" tables of a board.
+
+    Args:
+        rows: Board row masks, top to bottom
+        width: Board width in columns
+
+    Returns:
+        table[col][row]: the first filled row >= row in that column, or the
+        board height if there is none
+    """
+    grid_height = len(rows)
+    tables = []
+    for column in range(width):
+        bit = 1 << column
+        table = [grid_height] * (grid_height + 1)
+        below = grid_height
+        for row in range(grid_height - 1, -1, -1):
+            if rows[row] & bit:
+                below = row
+            table[row] = below
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+def landing_row(
+    rows: Sequence[int], next_filled: NextFilled, cells: Cells, x: int, width: int
+) -> int:
+    """Find where a piece dropped from row 0 comes to rest, without stepping.
+
+    Moving down from row y to y + 1 needs every cell's next row to be empty,
+    so a cell at offset dy can descend until the first filled row below it:
+    the landing row is min(next_filled[col][dy + 1] - dy - 1) over the cells.
+    If that is 0 the piece never moved, and row 0 itself must be free. This
+    gives the same result as stepping the piece down row by row, in O(cells)
+    instead of O(height).
+
+    Args:
+        rows: Board row masks, top to bottom
+        next_filled: Tables from next_filled_rows for the same board
+        cells: Filled (col, row) offsets of the piece (row offsets >= 0)
+        x: Piece column
+        width: Board width in columns
+
+    Returns:
+        Landing row of the piece, or -1 if it cannot be placed in this column
+    """
+    _, min_dx, max_dx = masks = piece_row_masks(cells)
+    if x + min_dx < 0 or x + max_dx >= width:
+        return -1
+    y = min(next_filled[x + dx][dy + 1] - dy - 1 for dx, dy in cells)
+    if y == 0:
+        for dy, mask in masks[0]:
+            if rows[dy] & (mask << x):
+                return -1
+    return y
+
+
+def fall_distance(next_filled: NextFilled, cells: Cells, x: int, y: int) -> int:
+    """Count the rows a piece at (x, y) can move straight down, without stepping.
+
+    Each cell can descend until the first filled row (or the floor) below it,
+    so the distance is min(next_filled[col][row + 1] - row - 1) over the cells.
+    Rows above the board are open, so cells there look up the table from row 0.
+    The piece must lie within the board's sides and above its floor.
+
+    Args:
+        next_filled: Tables from next_filled_rows for the board
+        cells: Filled (col, row) offsets of the piece
+        x: Piece column
+        y: Piece row
+
+    Returns:
+        Number of rows the piece can fall
+    """
+    return min(next_filled[x + dx][max(y + dy + 1, 0)] - (y + dy) - 1 for dx, dy in cells)
+
+
+def full_rows(rows: Sequence[int], width: int) -> List[int]:
+    """Get the indices of completely filled rows.
+
+    Args:
+        rows: Board row masks
+        width: Board width in columns
+
+    Returns:
+        Row indices, top to bottom, whose mask has every column bit set
+    """
+    full = (1 << width) - 1
+    return [y for y, row in enumerate(rows) if row == full]
+
+
+def count_near_full_rows(rows: Sequence[int], width: int) -> int:
+    """Count rows with at most one empty column.
+
+    A row qualifies when its missing columns form zero or one bit, which is a
+    single AND per row instead of counting its filled cells.
+
+    Args:
+        rows: Board row masks
+        width: Board width in columns
+
+    Returns:
+        Number of full or one-short rows
+    """
+    full = (1 << width) - 1
+    count = 0
+    for row in rows:
+        gaps = full ^ row
+        if not gaps & (gaps - 1):
+            count += 1
+    return count
+
+
+def rows_to_columns(rows: List[int], width: int) -> List[int]:
+    """Transpose row masks into one bitmask per column.
+
+    Bit r of a column mask is set when the cell r rows above the floor is
+    filled, so a column's height is simply its bit_length().
+
+    Args:
+        rows: Board row masks, top to bottom
+        width: Board width in columns
+
+    Returns:
+        List of column masks, left to right
+    """
+    columns = [0] * width
+    bit = 1 << len(rows)
+    for row in rows:
+        bit >>= 1
+        while row:
+            lowest = row & -row
+            columns[lowest.bit_length() - 1] |= bit
+            row ^= lowest
+    return columns
+
+
+def count_cells(rows: List[int]) -> int:
+    """Count the filled cells of a board.
+
+    Args:
+        rows: Board row (or column) masks
+
+    Returns:
+        Number of set bits over all masks
+    """
+    return sum(map(popcount, rows))
+
+
+def pack_board(rows: Sequence[int], width: int) -> Board:
+    """Pack row masks together with the metrics the AI scores.
+
+    Args:
+        rows: Board row masks, top to bottom
+        width: Board width in columns
+
+    Returns:
+        Packed board (see Board)
+    """
+    rows = list(rows)
+    heights = tuple(column.bit_length() for column in rows_to_columns(rows, width))
+    return (
+        tuple(rows),
+        heights,
+        count_cells(rows),
+        tuple(full_rows(rows, width)),
+        count_near_full_rows(rows, width),
+        next_filled_rows(rows, width),
+    )
+
+
+def place_piece(board: Board, cells: Cells, x: int, width: int) -> Optional[Placed]:
+    """Drop a piece onto a packed board and patch the board's metrics.
+
+    The landing row is looked up with landing_row. Only the rows and columns
+    the piece lands in are touched: a block raises
+    its column to its own height if it is higher, and the empty-cell mask of
+    each touched row decides whether the row became full or near-full. The
+    board itself is not modified.
+
+    Args:
+        board: Packed board from pack_board
+        cells: Filled (col, row) offsets of the piece
+        x: Piece column
+        width: Board width in columns
+
+    Returns:
+        Metrics of the board with the piece placed (see Placed), or None if
+        the piece cannot be placed in this column
+    """
+    rows, heights, filled, lines, near_full, next_filled = board
+
+    y = landing_row(rows, next_filled, cells, x, width)
+    if y < 0:
+        return None
+
+    grid_height = len(rows)
+    new_heights = list(heights)
+    for dx, dy in cells:
+        row = y + dy
+        if row >= 0:
+            filled += 1
+            if grid_height - row > new_heights[x + dx]:
+                new_heights[x + dx] = grid_height - row
+
+    full = (1 << width) - 1
+    new_lines = []
+    for dy, mask in piece_row_masks(cells)[0]:
+        row = y + dy
+        if row >= 0:
+            before = full ^ rows[row]
+            after = before & ~(mask << x)
+            if not after:
+                new_lines.append(row)
+            near_full += (not after & (after - 1)) - (not before & (before - 1))
+    if new_lines:
+        lines = tuple(sorted(lines + tuple(new_lines)))
+
+    return (y, new_heights, filled, lines, near_full)
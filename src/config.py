@@ -2,6 +2,17 @@
 Game configuration constants and settings.
 """
 
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+
+# Immutable tetromino shape matrix: rows of 0/1 entries
+Shape = Tuple[Tuple[int, ...], ...]
+# Filled-cell offsets of a tetromino shape: ((col, row), ...)
+Cells = Tuple[Tuple[int, int], ...]
+# Per-shape values indexed by rotation (0-3)
+CellsTable = Dict[str, Tuple[Cells, ...]]
+BoundsTable = Dict[str, Tuple[Tuple[int, int], ...]]
+
 
 class GameConfig:
     """Centralized game configuration.
@@ -16,6 +27,7 @@ class GameConfig:
         BLOCK_SIZE: Size of each tetromino block in pixels (30)
         GRID_X: X position of the game grid on screen in pixels (250)
         GRID_Y: Y position of the game grid on screen in pixels (50)
+        USE_ALPHA_BLOCKS: Cache block sprites with per-pixel alpha instead of a color key
         GRID_WIDTH: Number of columns in the game grid (10)
         GRID_HEIGHT: Number of rows in the game grid (20)
         INITIAL_FALL_SPEED: Starting piece fall speed in milliseconds (1000)
@@ -30,6 +42,14 @@ class GameConfig:
         CYAN, YELLOW, PURPLE, GREEN, RED, BLUE, ORANGE: Tetromino colors
         SHAPES: Dictionary mapping shape types to their grid patterns
         COLORS: Dictionary mapping shape types to RGB color tuples
+
+    Note:
+        The configuration is deliberately a mutable class, not an instance.
+        Variants are made by subclassing (see demo_rising_lines.py), and the
+        config menu changes difficulty values on the active class at runtime,
+        so a frozen instance would not work here. Class attribute reads are
+        served from CPython's per-type attribute cache, so subclass depth does
+        not add per-read cost. Hot loops bind the values they need to locals.
     """
 
     # Display settings
@@ -38,6 +58,11 @@ class GameConfig:
     BLOCK_SIZE = 30
     GRID_X = 250
     GRID_Y = 120  # Increased from 50 to avoid overlap with demo banner
+    # Cached block sprites are opaque display-format surfaces with the gaps between
+    # blocks color-keyed out, which blit much faster than per-pixel alpha. Only
+    # translucent effects (power-up glows, warnings) use alpha surfaces. Set to True
+    # to cache block sprites with per-pixel alpha instead.
+    USE_ALPHA_BLOCKS = False
 
     # Grid settings
     GRID_WIDTH = 10
@@ -191,3 +216,113 @@ class GameConfig:
     # Survival Mode (when RISING_MODE = "survival")
     RISING_SURVIVAL_INTERVAL = 12000  # 12 seconds
     RISING_SURVIVAL_MIN_INTERVAL = 8000  # 8 seconds minimum
+
+    @classmethod
+    def fall_speed_for_level(cls, level: int) -> int:
+        """Get the fall speed for a level under the current difficulty values.
+
+        Args:
+            level: Game level (1 or higher)
+
+        Returns:
+            Time between automatic falls in milliseconds
+        """
+        table = level_table(cls.INITIAL_FALL_SPEED, cls.LEVEL_SPEED_DECREASE, cls.MIN_FALL_SPEED)
+        return table[min(level, len(table)) - 1]
+
+    @classmethod
+    def rising_interval_for_level(cls, level: int) -> int:
+        """Get the pressure-mode rising line interval for a level.
+
+        Args:
+            level: Game level (1 or higher)
+
+        Returns:
+            Time between rising lines in milliseconds
+        """
+        table = level_table(
+            cls.RISING_INITIAL_INTERVAL, cls.RISING_INTERVAL_DECREASE, cls.RISING_MIN_INTERVAL
+        )
+        return table[min(level, len(table)) - 1]
+
+
+@lru_cache(maxsize=None)
+def level_table(initial: int, decrease: int, minimum: int) -> Tuple[int, ...]:
+    """Precompute a per-level timing curve that decreases linearly to a floor.
+
+    Entry i holds max(initial - i * decrease, minimum), the value for level
+    i + 1. The table stops at the first level that reaches the floor; higher
+    levels use the last entry. Tables are cached per (initial, decrease,
+    minimum), so every difficulty setting is computed once even when the
+    config menu switches between them at runtime.
+
+    Args:
+        initial: Value at level 1
+        decrease: Amount subtracted per level (non-negative)
+        minimum: Floor the value never goes below
+
+    Returns:
+        Tuple of per-level values, starting at level 1
+    """
+    values = [max(initial, minimum)]
+    if decrease > 0:
+        while values[-1] > minimum:
+            values.append(max(values[-1] - decrease, minimum))
+    return tuple(values)
+
+
+def shape_cells(shape: Sequence[Sequence[int]]) -> Cells:
+    """Get the filled-cell offsets of a shape matrix.
+
+    Args:
+        shape: 2D pattern where truthy entries are filled blocks
+
+    Returns:
+        Tuple of (col, row) offsets, row-major, one per filled block
+    """
+    return tuple((x, y) for y, row in enumerate(shape) for x, cell in enumerate(row) if cell)
+
+
+def shape_rotations(shape: Sequence[Sequence[int]]) -> Tuple[Shape, ...]:
+    """Precompute the four clockwise rotations of a shape matrix.
+
+    Uses the same rule as a single clockwise turn (transpose of the
+    vertically flipped matrix), applied 0-3 times.
+
+    Args:
+        shape: 2D pattern where truthy entries are filled blocks
+
+    Returns:
+        Tuple of 4 immutable matrices indexed by rotation (0-3, number of
+        clockwise turns from the given orientation)
+    """
+    rotations = [tuple(tuple(row) for row in shape)]
+    for _ in range(3):
+        rotations.append(tuple(zip(*rotations[-1][::-1])))
+    return tuple(rotations)
+
+
+def _build_shape_tables() -> Tuple[CellsTable, BoundsTable]:
+    """Precompute per-rotation cell offsets and bounding boxes for every shape.
+
+    Returns:
+        Tuple of (cells, bounds) dictionaries keyed by shape type. Each value is
+        indexed by rotation (0-3, number of clockwise turns from spawn).
+    """
+    cells = {}
+    bounds = {}
+    for shape_type, rotations in SHAPE_ROTATIONS.items():
+        cells[shape_type] = tuple(shape_cells(shape) for shape in rotations)
+        bounds[shape_type] = tuple((len(shape[0]), len(shape)) for shape in rotations)
+    return cells, bounds
+
+
+# Shape tables derived from GameConfig.SHAPES at import time, so rotating,
+# spawning and drawing pieces never rebuild matrices or measure them:
+# SHAPE_ROTATIONS[shape][rotation] -> immutable shape matrix
+# SHAPE_CELLS[shape][rotation] -> filled (col, row) offsets
+# SHAPE_BOUNDS[shape][rotation] -> (width, height) of the shape matrix
+SHAPE_ROTATIONS: Dict[str, Tuple[Shape, ...]] = {
+    shape_type: shape_rotations(shape) for shape_type, shape in GameConfig.SHAPES.items()
+}
+SHAPE_CELLS, SHAPE_BOUNDS = _build_shape_tables()
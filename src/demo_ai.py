@@ -2,8 +2,11 @@
 Demo AI for auto-playing demo mode.
 """
 
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from operator import sub
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Sequence, Tuple
 
+from src.bitboard import Board, grid_to_rows, pack_board, piece_fits, piece_row_masks, place_piece
+from src.config import Cells
 from src.tetromino import Tetromino
 
 if TYPE_CHECKING:
@@ -12,6 +15,31 @@ if TYPE_CHECKING:
 # Type alias for grid representation
 Grid = List[List[Optional[Tuple[int, int, int]]]]
 
+# Evaluation reward for clearing 1-4 lines with one placement
+LINE_CLEAR_SCORES = {1: 100, 2: 300, 3: 500, 4: 800}
+
+# Memoized placement outcome: (landing_y, score without power-up bonus, cleared rows)
+Placement = Tuple[int, float, Tuple[int, ...]]
+
+# Column offsets tried as last-moment slides from every drop column
+SLIDE_OFFSETS = (-1, 1, -2, 2)
+
+# Placement outcomes and searched moves kept per AI; each memo is reset once it
+# grows past its size
+PLACEMENT_CACHE_SIZE = 4096
+MOVE_CACHE_SIZE = 1024
+
+# Value of target_x, target_rotation and current_piece_id while unset
+UNSET = -1
+
+# Move phases of make_next_move's state machine
+PHASE_PLANNING = 0
+PHASE_HOLDING = 1
+PHASE_ROTATING = 2
+PHASE_MOVING = 3
+PHASE_DROPPING = 4
+PHASE_WAITING = 5
+
 
 class DemoAI:
     """AI player for demo mode that plays optimally.
@@ -21,6 +49,22 @@ class DemoAI:
     heuristics including line clears, height, holes, and smoothness.
     """
 
+    __slots__ = (
+        "game",
+        "target_x",
+        "target_rotation",
+        "target_use_hold",
+        "move_phase",
+        "rotation_count",
+        "movement_delay",
+        "current_piece_id",
+        "_search_board",
+        "_board",
+        "_board_grid",
+        "_placement_cache",
+        "_move_cache",
+    )
+
     def __init__(self, game: "TetrisGame") -> None:
         """Initialize the demo AI.
 
@@ -28,13 +72,22 @@ class DemoAI:
             game: The TetrisGame instance to control
         """
         self.game = game
-        self.target_x: Optional[int] = None
-        self.target_rotation: Optional[int] = None
+        self.target_x = UNSET
+        self.target_rotation = UNSET
         self.target_use_hold = False
-        self.move_phase = "planning"  # planning, holding, rotating, moving, dropping, waiting
+        self.move_phase = PHASE_PLANNING  # One of the PHASE_* constants
         self.rotation_count = 0
         self.movement_delay = 0
-        self.current_piece_id: Optional[int] = None  # Track which piece we're working on
+        self.current_piece_id = UNSET  # Track which piece we're working on
+        # Packed game grid, valid for the duration of one search
+        self._search_board: Optional[Board] = None
+        # Last packed game grid and a copy of the grid it was packed from
+        self._board: Optional[Board] = None
+        self._board_grid: Optional[Grid] = None
+        # Placement outcomes keyed by (board rows, piece cells, x)
+        self._placement_cache: Dict[Tuple[Tuple[int, ...], Cells, int], Placement] = {}
+        # find_best_move results keyed by _search_key
+        self._move_cache: Dict[Tuple[Hashable, ...], Tuple[int, int, bool]] = {}
 
     def evaluate_placement(
         self, piece: Tetromino, x: int, rotation: int
@@ -65,94 +118,195 @@ class DemoAI:
             +50: Completed line progress
 
         Note:
-            Grid is only copied once per evaluation. For performance-critical
-            applications, consider using a more efficient grid representation
-            (e.g., bitboard), but for Tetris AI at 60 FPS, this is sufficient.
+            The drop is simulated against per-row bitmasks of the grid, which
+            find_best_move packs once per search, so each collision test is one
+            AND per piece row. The board's metrics are computed once per search
+            and only patched for the rows and columns the piece touches.
+            Outcomes are memoized per (board,
+            footprint, x); the power-up bonus is added on every call since it
+            depends on live power-up state. The list grid is only copied once
+            per evaluation, to build the returned grid; use
+            evaluate_placement_score when only the score is needed.
         """
-        # Create a copy of the piece to simulate
-        test_piece = piece.copy()
+        # Footprint of the rotated piece, straight from the rotation tables
+        cells = piece.rotated_cells(rotation)
+        y, score, lines_cleared = self._placement(cells, x)
+        if y < 0:
+            return (float("-inf"), None)
+        if lines_cleared:
+            score += self._powerup_line_bonus(lines_cleared)
 
-        # Apply rotation
-        for _ in range(rotation % 4):
-            test_piece.rotate_clockwise()
+        # Build the resulting grid: shallow copy of rows since we only modify
+        # specific cells (list.copy mapped in C, no per-row slice in Python)
+        simulated_grid = list(map(list.copy, self.game.grid))
+        for dx, dy in cells:
+            if y + dy >= 0:
+                simulated_grid[y + dy][x + dx] = piece.color
 
-        # Position the piece at target x
-        test_piece.x = x
+        return (score, simulated_grid)
 
-        # Drop to find landing position
-        test_piece.y = 0
-        while self._is_valid_position_in_grid(test_piece, self.game.grid, 0, 1):
-            test_piece.y += 1
+    def evaluate_placement_score(self, piece: Tetromino, x: int, rotation: int) -> float:
+        """Score a potential piece placement without building its grid.
 
-        # Check if final position is valid
-        if not self._is_valid_position_in_grid(test_piece, self.game.grid):
-            return (float("-inf"), None)
+        Same score as evaluate_placement, for callers (like the move search)
+        that discard the resulting grid.
 
-        # Calculate score directly on a temporary grid state
-        # We use shallow copy of rows since we only modify specific cells
-        # This is more memory-efficient than deep copying the entire structure
-        simulated_grid = [row[:] for row in self.game.grid]
-        for block_x, block_y in test_piece.get_blocks():
-            if 0 <= block_y < self.game.config.GRID_HEIGHT:
-                simulated_grid[block_y][block_x] = test_piece.color
+        Args:
+            piece: The piece to place
+            x: Target x position
+            rotation: Number of clockwise rotations (0-3)
+
+        Returns:
+            Placement score, or -inf if the placement is invalid
+        """
+        y, score, lines_cleared = self._placement(piece.rotated_cells(rotation), x)
+        if y < 0:
+            return float("-inf")
+        if lines_cleared:
+            score += self._powerup_line_bonus(lines_cleared)
+        return score
 
-        # Calculate score based on grid state
-        score = self._evaluate_grid_state(simulated_grid)
+    def _placement(self, cells: Cells, x: int) -> Placement:
+        """Get the memoized outcome of dropping a footprint in a column.
 
-        return (score, simulated_grid)
+        Args:
+            cells: Filled (col, row) offsets of the rotated piece
+            x: Target x position
 
-    def _evaluate_grid_state(self, grid: Grid) -> float:
+        Returns:
+            Placement outcome from _simulate_placement
+        """
+        board = self._search_board
+        if board is None:
+            board = self._game_board()
+
+        # The outcome only depends on the board, the piece footprint and the
+        # column, so repeated placements (slide offsets, symmetric rotations,
+        # re-planning on an unchanged grid) are served from the memo
+        key = (board[0], cells, x)
+        placement = self._placement_cache.get(key)
+        if placement is None:
+            placement = self._simulate_placement(board, cells, x)
+            if len(self._placement_cache) >= PLACEMENT_CACHE_SIZE:
+                self._placement_cache.clear()
+            self._placement_cache[key] = placement
+        return placement
+
+    def _simulate_placement(self, board: Board, cells: Cells, x: int) -> Placement:
+        """Drop a piece footprint onto a packed board and score the result.
+
+        The drop and the metric updates run in bitboard.place_piece, a kernel
+        over plain ints and tuples; only the heuristic weights live here.
+
+        Args:
+            board: Packed grid from _pack_grid
+            cells: Filled (col, row) offsets of the rotated piece
+            x: Target x position
+
+        Returns:
+            Tuple of (landing_y, score, cleared_rows). landing_y is -1 and the
+            score -inf when the placement is invalid. The score leaves out the
+            power-up bonus of cleared_rows, which depends on live game state.
+        """
+        placed = place_piece(board, cells, x, self.game.config.GRID_WIDTH)
+        if placed is None:
+            return (-1, float("-inf"), ())
+        y, heights, filled, lines_cleared, near_full = placed
+        score = self._score_metrics(heights, filled, len(lines_cleared), near_full)
+        return (y, score, lines_cleared)
+
+    def _evaluate_grid_state(self, grid: Grid, rows: Optional[List[int]] = None) -> float:
         """Evaluate the quality of a grid state.
 
         Args:
             grid: The grid state to evaluate
+            rows: Row bitmasks of the same grid (computed from grid if omitted)
 
         Returns:
             Score representing grid quality (higher is better)
         """
-        score = 0.0
+        if rows is None:
+            rows = grid_to_rows(grid)
+        _, heights, filled, lines_cleared, near_full, _ = pack_board(
+            rows, self.game.config.GRID_WIDTH
+        )
+        score = self._score_metrics(heights, filled, len(lines_cleared), near_full)
+        return score + self._powerup_line_bonus(lines_cleared)
 
-        # Check for line clears
-        lines_cleared = 0
-        lines_with_powerups = []
-        for y in range(self.game.config.GRID_HEIGHT):
-            if all(grid[y][col] is not None for col in range(self.game.config.GRID_WIDTH)):
-                lines_cleared += 1
-                lines_with_powerups.append(y)
+    def _pack_grid(self, grid: Grid) -> Board:
+        """Pack a grid into row masks and compute its base metrics.
 
-        # Reward line clears heavily
-        line_clear_scores = {1: 100, 2: 300, 3: 500, 4: 800}
-        score += line_clear_scores.get(lines_cleared, 0)
+        Args:
+            grid: Grid to pack
 
-        # Bonus for clearing lines with power-ups
-        if self.game.config.CHARGED_BLOCKS_ENABLED and lines_cleared > 0:
-            for line_y in lines_with_powerups:
-                powerups_in_line = self.game.powerup_manager.get_powerups_in_line(line_y)
-                # Award bonus points for each power-up in cleared line
-                score += len(powerups_in_line) * 50
+        Returns:
+            Packed board for evaluate_placement and _simulate_placement
+        """
+        return pack_board(grid_to_rows(grid), self.game.config.GRID_WIDTH)
+
+    def _game_board(self) -> Board:
+        """Get the packed game grid, repacking only when the grid changed.
 
-        # Calculate grid metrics
-        heights = self._get_column_heights(grid)
-        holes = self._count_holes(grid)
-        bumpiness = self._calculate_bumpiness(heights)
+        The grid only changes on lock, line clear and rising lines, while the
+        AI re-plans on the same grid (e.g. after a hold). Comparing against a
+        copy of the last packed grid is a C-level list compare and, like the
+        grid surface cache in TetrisGame, also catches direct edits to the grid.
+
+        Returns:
+            Packed board of game.grid with its base metrics
+        """
+        grid = self.game.grid
+        if self._board is None or grid != self._board_grid:
+            self._board_grid = list(map(list.copy, grid))
+            self._board = self._pack_grid(self._board_grid)
+        return self._board
 
-        # Penalize aggregate height
-        score -= sum(heights) * 1.0
+    def _score_metrics(
+        self, heights: Sequence[int], filled: int, lines_cleared: int, near_full: int
+    ) -> float:
+        """Score a grid state from its metrics.
 
-        # Heavily penalize holes
-        score -= holes * 500
+        Since every filled cell sits at or below its column top, the holes
+        are the aggregate height minus the filled cells.
 
-        # Penalize bumpiness
-        score -= bumpiness * 50
+        Args:
+            heights: Height of each column
+            filled: Number of filled cells in the grid
+            lines_cleared: Number of full rows
+            near_full: Number of rows with at most one empty cell
+
+        Returns:
+            Score representing grid quality (higher is better), without the
+            power-up bonus for the full rows (see _powerup_line_bonus)
+        """
+        # Reward line clears heavily
+        score = float(LINE_CLEAR_SCORES.get(lines_cleared, 0))
+
+        # Penalize aggregate height, holes (heavily) and bumpiness
+        aggregate_height = sum(heights)
+        holes = aggregate_height - filled
+        score -= aggregate_height + holes * 500 + self._calculate_bumpiness(heights) * 50
 
         # Bonus for near-complete lines
-        for y in range(self.game.config.GRID_HEIGHT):
-            filled = sum(1 for cell in grid[y] if cell is not None)
-            if filled >= self.game.config.GRID_WIDTH - 1:
-                score += 50
+        score += near_full * 50
 
         return score
 
+    def _powerup_line_bonus(self, lines_cleared: Sequence[int]) -> int:
+        """Get the bonus for power-up blocks in the rows a placement clears.
+
+        Args:
+            lines_cleared: Indices of the cleared rows
+
+        Returns:
+            50 points per power-up in the cleared rows (0 if charged blocks are off)
+        """
+        if not self.game.config.CHARGED_BLOCKS_ENABLED:
+            return 0
+        get_powerups_in_line = self.game.powerup_manager.get_powerups_in_line
+        # Award bonus points for each power-up in cleared line
+        return sum(len(get_powerups_in_line(line_y)) for line_y in lines_cleared) * 50
+
     def _is_valid_position_in_grid(
         self,
         piece: Tetromino,
@@ -170,64 +324,21 @@ class DemoAI:
 
         Returns:
             True if position is valid, False otherwise
-        """
-        for x, y in piece.get_blocks():
-            new_x = x + offset_x
-            new_y = y + offset_y
-
-            # Check boundaries
-            if (
-                new_x < 0
-                or new_x >= self.game.config.GRID_WIDTH
-                or new_y >= self.game.config.GRID_HEIGHT
-            ):
-                return False
-
-            # Check collision with placed blocks
-            if new_y >= 0 and grid[new_y][new_x] is not None:
-                return False
-
-        return True
-
-    def _get_column_heights(self, grid: Grid) -> List[int]:
-        """Get the height of each column.
-
-        Args:
-            grid: Grid to analyze
-
-        Returns:
-            List of heights for each column
-        """
-        heights = []
-        for x in range(self.game.config.GRID_WIDTH):
-            height = 0
-            for y in range(self.game.config.GRID_HEIGHT):
-                if grid[y][x] is not None:
-                    height = self.game.config.GRID_HEIGHT - y
-                    break
-            heights.append(height)
-        return heights
-
-    def _count_holes(self, grid: Grid) -> int:
-        """Count holes (empty cells with blocks above them).
-
-        Args:
-            grid: Grid to analyze
 
-        Returns:
-            Number of holes
+        Note:
+            The check is one AND per piece row against the row bitmasks of
+            the grid; the game grid's masks are reused while it is unchanged.
         """
-        holes = 0
-        for x in range(self.game.config.GRID_WIDTH):
-            found_block = False
-            for y in range(self.game.config.GRID_HEIGHT):
-                if grid[y][x] is not None:
-                    found_block = True
-                elif found_block:
-                    holes += 1
-        return holes
-
-    def _calculate_bumpiness(self, heights: List[int]) -> int:
+        rows = self._game_board()[0] if grid is self.game.grid else grid_to_rows(grid)
+        return piece_fits(
+            rows,
+            piece_row_masks(piece.cells),
+            piece.x + offset_x,
+            piece.y + offset_y,
+            self.game.config.GRID_WIDTH,
+        )
+
+    def _calculate_bumpiness(self, heights: Sequence[int]) -> int:
         """Calculate bumpiness (sum of height differences between adjacent columns).
 
         Args:
@@ -236,10 +347,7 @@ class DemoAI:
         Returns:
             Total bumpiness value
         """
-        bumpiness = 0
-        for i in range(len(heights) - 1):
-            bumpiness += abs(heights[i] - heights[i + 1])
-        return bumpiness
+        return sum(map(abs, map(sub, heights, heights[1:])))
 
     def find_best_move(self) -> Tuple[int, int, bool]:
         """Find optimal position and rotation for current piece.
@@ -256,6 +364,64 @@ class DemoAI:
         if self.game.current_piece is None:
             return (self.game.config.GRID_WIDTH // 2, 0, False)
 
+        # Every placement in this search sees the same grid, so pack it once
+        # (or reuse the board packed for an unchanged grid)
+        board = self._game_board()
+
+        # The same position (grid, pieces, hold state and power-up rows) always
+        # yields the same move, so recurring positions skip the search
+        key = self._search_key(board)
+        move = self._move_cache.get(key)
+        if move is not None:
+            return move
+
+        self._search_board = board
+        try:
+            move = self._search_best_move()
+        finally:
+            self._search_board = None
+
+        if len(self._move_cache) >= MOVE_CACHE_SIZE:
+            self._move_cache.clear()
+        self._move_cache[key] = move
+        return move
+
+    def _search_key(self, board: Board) -> Tuple[Hashable, ...]:
+        """Build the find_best_move cache key for the current game position.
+
+        Args:
+            board: Packed game grid
+
+        Returns:
+            Tuple of everything the search result depends on: the grid rows,
+            (type, rotation, x) of the current, hold and next pieces, whether
+            hold is allowed, and the rows holding power-ups (they add to line
+            clear scores)
+        """
+        game = self.game
+
+        def piece_key(piece: Optional[Tetromino]) -> Optional[Tuple[str, int, int]]:
+            return None if piece is None else (piece.type, piece.rotation, piece.x)
+
+        if game.config.CHARGED_BLOCKS_ENABLED:
+            powerup_rows = tuple(sorted(y for _, y, _ in game.powerup_manager.powerup_blocks))
+        else:
+            powerup_rows = ()
+        return (
+            board[0],
+            piece_key(game.current_piece),
+            piece_key(game.hold_piece),
+            piece_key(game.next_piece),
+            game.can_hold,
+            powerup_rows,
+        )
+
+    def _search_best_move(self) -> Tuple[int, int, bool]:
+        """Search current/hold placements for find_best_move.
+
+        Returns:
+            Tuple of (x_position, num_rotations, use_hold) for best placement
+        """
         best_score = float("-inf")
         best_x = self.game.current_piece.x
         best_rotation = 0
@@ -303,6 +469,17 @@ class DemoAI:
 
         Returns:
             Tuple of (best_score, best_x, best_rotation)
+
+        Note:
+            Each (rotation, x) placement is evaluated once into a flat table.
+            The slide candidates (x +/- 1, x +/- 2 plus DEMO_SLIDE_BONUS) are
+            read back from that table in the original order, so ties resolve
+            exactly as before. The candidates are independent, but scoring is
+            pure Python and holds the GIL, so they are not spread over threads.
+            A rotation whose best score plus the slide bonus cannot strictly
+            beat the best so far is skipped, which cannot change the result.
+            Columns where the piece would cross a wall are never simulated,
+            and neither are rotations repeating an earlier footprint.
         """
         if piece is None:
             # Return safe defaults if piece is None
@@ -312,17 +489,44 @@ class DemoAI:
         best_x = piece.x
         best_rotation = 0
 
-        # Try all rotations
-        for rotation in range(4):
-            # Create test piece
-            test_piece = piece.copy()
-            for _ in range(rotation):
-                test_piece.rotate_clockwise()
+        # Score every (rotation, x) candidate once in a single flat pass; the
+        # slide candidates below reuse these. Entry rotation * width + x.
+        width = self.game.config.GRID_WIDTH
+        evaluate_placement_score = self.evaluate_placement_score
+        scores = [float("-inf")] * (4 * width)
+
+        # Symmetric pieces repeat footprints (O has one, I/S/Z have two). A
+        # repeated footprint scores exactly like its first rotation, and an equal
+        # score never strictly beats the best, so only the first is searched.
+        footprints = [piece.rotated_cells(rotation) for rotation in range(4)]
+        rotations = [
+            rotation for rotation in range(4) if footprints[rotation] not in footprints[:rotation]
+        ]
+
+        for rotation in rotations:
+            # Only columns that keep the footprint inside the walls can score;
+            # the rest stay -inf without being simulated
+            column_offsets = [dx for dx, _ in footprints[rotation]]
+            base = rotation * width
+            for x in range(-min(column_offsets), width - max(column_offsets)):
+                scores[base + x] = evaluate_placement_score(piece, x, rotation)
+        slide_bonus = self.game.config.DEMO_SLIDE_BONUS
+
+        # Upper bound of any candidate over a rotation's plain score: the slide bonus
+        slide_gain = max(slide_bonus, 0)
+
+        # Try all distinct rotations
+        for rotation in rotations:
+            base = rotation * width
+
+            # No candidate of this rotation can beat the best so far: skip it
+            if max(scores[base : base + width]) + slide_gain <= best_score:
+                continue
 
             # Try all x positions
-            for x in range(self.game.config.GRID_WIDTH):
+            for x in range(width):
                 # Standard drop evaluation
-                score, _ = self.evaluate_placement(piece, x, rotation)
+                score = scores[base + x]
 
                 if score > best_score:
                     best_score = score
@@ -332,12 +536,11 @@ class DemoAI:
                 # Also try last-moment insertions
                 # This simulates dropping to near-bottom, then sliding horizontally
                 # Try positions that might be reachable by sliding under overhangs
-                for slide_offset in [-1, 1, -2, 2]:
+                for slide_offset in SLIDE_OFFSETS:
                     slide_x = x + slide_offset
-                    if 0 <= slide_x < self.game.config.GRID_WIDTH:
-                        slide_score, _ = self.evaluate_placement(piece, slide_x, rotation)
+                    if 0 <= slide_x < width:
                         # Bonus for using advanced technique
-                        slide_score += self.game.config.DEMO_SLIDE_BONUS
+                        slide_score = scores[base + slide_x] + slide_bonus
                         if slide_score > best_score:
                             best_score = slide_score
                             best_x = slide_x
@@ -354,7 +557,7 @@ class DemoAI:
         """
         if self.game.current_piece is None:
             # No piece to control, wait for next one
-            self.move_phase = "waiting"
+            self.move_phase = PHASE_WAITING
             return
 
         # Check if we got a new piece
@@ -362,21 +565,22 @@ class DemoAI:
         if piece_id != self.current_piece_id:
             # New piece, start planning
             self.current_piece_id = piece_id
-            self.move_phase = "planning"
+            self.move_phase = PHASE_PLANNING
 
         # Execute appropriate phase handler
-        phase_handlers = {
-            "planning": self._handle_planning_phase,
-            "holding": self._handle_holding_phase,
-            "rotating": self._handle_rotating_phase,
-            "moving": self._handle_moving_phase,
-            "dropping": self._handle_dropping_phase,
-            "waiting": self._handle_waiting_phase,
-        }
-
-        handler = phase_handlers.get(self.move_phase)
-        if handler:
-            handler()
+        phase = self.move_phase
+        if phase == PHASE_PLANNING:
+            self._handle_planning_phase()
+        elif phase == PHASE_HOLDING:
+            self._handle_holding_phase()
+        elif phase == PHASE_ROTATING:
+            self._handle_rotating_phase()
+        elif phase == PHASE_MOVING:
+            self._handle_moving_phase()
+        elif phase == PHASE_DROPPING:
+            self._handle_dropping_phase()
+        elif phase == PHASE_WAITING:
+            self._handle_waiting_phase()
 
     def _handle_planning_phase(self) -> None:
         """Handle the planning phase - decide what move to make."""
@@ -385,18 +589,18 @@ class DemoAI:
 
         # If we should use hold, do that first
         if self.target_use_hold:
-            self.move_phase = "holding"
+            self.move_phase = PHASE_HOLDING
             self.movement_delay = self.game.config.DEMO_MOVE_DELAY
         else:
-            self.move_phase = "rotating"
+            self.move_phase = PHASE_ROTATING
             self.movement_delay = self.game.config.DEMO_ROTATION_DELAY
 
     def _handle_holding_phase(self) -> None:
         """Handle the holding phase - use the hold feature."""
         self.game.hold_current_piece()
         # After holding, we need to re-plan for the new piece
-        self.move_phase = "planning"
-        self.current_piece_id = id(self.game.current_piece) if self.game.current_piece else None
+        self.move_phase = PHASE_PLANNING
+        self.current_piece_id = id(self.game.current_piece) if self.game.current_piece else UNSET
         self.movement_delay = self.game.config.DEMO_MOVE_DELAY
 
     def _handle_rotating_phase(self) -> None:
@@ -406,7 +610,7 @@ class DemoAI:
             self.rotation_count += 1
             self.movement_delay = self.game.config.DEMO_ROTATION_DELAY
         else:
-            self.move_phase = "moving"
+            self.move_phase = PHASE_MOVING
             self.movement_delay = self.game.config.DEMO_MOVE_DELAY_H
 
     def _handle_moving_phase(self) -> None:
@@ -419,7 +623,7 @@ class DemoAI:
             self.game.move_piece(-1, 0)
             self.movement_delay = self.game.config.DEMO_MOVE_DELAY_H
         else:
-            self.move_phase = "dropping"
+            self.move_phase = PHASE_DROPPING
             self.movement_delay = self.game.config.DEMO_DROP_DELAY
 
     def _handle_dropping_phase(self) -> None:
@@ -432,7 +636,7 @@ class DemoAI:
         else:
             # Can't move down, piece will lock on next auto-fall
             # Wait for the piece to lock
-            self.move_phase = "waiting"
+            self.move_phase = PHASE_WAITING
             self.movement_delay = self.game.config.DEMO_MOVE_DELAY
 
     def _handle_waiting_phase(self) -> None:
@@ -2,16 +2,95 @@
 Game state classes implementing the State pattern for different game modes.
 """
 
-from typing import TYPE_CHECKING, Optional
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 import pygame
+from pygame.locals import (
+    K_DOWN,
+    K_ESCAPE,
+    K_LEFT,
+    K_RETURN,
+    K_RIGHT,
+    K_SPACE,
+    K_UP,
+    K_b,
+    K_c,
+    K_d,
+    K_g,
+    K_m,
+    K_p,
+    K_r,
+)
 
 from src.config import GameConfig
+from src.demo_ai import DemoAI
 
 if TYPE_CHECKING:
-    from src.demo_ai import DemoAI
     from src.tetris import TetrisGame
 
+# Difficulty by initial fall speed, for the config menu's preselection (the
+# first listed difficulty wins if two share a speed)
+SPEED_TO_DIFFICULTY = {
+    settings["initial_speed"]: difficulty
+    for difficulty, settings in reversed(list(GameConfig.DIFFICULTY_SETTINGS.items()))
+}
+
+
+# A rendered text and where to blit it
+TextDraw = Tuple[pygame.Surface, Tuple[float, float]]
+
+
+@lru_cache(maxsize=128)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text, memoized per font, text and color.
+
+    Args:
+        font: Font to render with
+        text: Text to render
+        color: RGB text color
+
+    Returns:
+        Rendered text surface, shared between callers and not to be modified
+    """
+    return font.render(text, True, color)
+
+
+@lru_cache(maxsize=128)
+def _convert_centered(text: pygame.Surface, screen_width: int) -> Tuple[pygame.Surface, int]:
+    """Convert a rendered text to the display format and find its centered x.
+
+    Memoized per text surface, which render_text shares for equal texts,
+    so rebuilding a menu's labels reuses the conversions and positions.
+
+    Args:
+        text: Rendered text surface
+        screen_width: Screen width in pixels
+
+    Returns:
+        Tuple of (converted text, left x centering it on the screen)
+    """
+    converted = text.convert_alpha()
+    return converted, screen_width // 2 - converted.get_width() // 2
+
+
+def centered_text(text: pygame.Surface, game: "TetrisGame", y: float) -> TextDraw:
+    """Pair a rendered text with its horizontally centered screen position.
+
+    The text is converted to the display's pixel format so repeated blits
+    of the cached pair skip per-frame format conversion.
+
+    Args:
+        text: Rendered text surface
+        game: The TetrisGame instance providing the screen width
+        y: Top of the text in pixels
+
+    Returns:
+        Tuple of (text, position) for Surface.blits
+    """
+    converted, x = _convert_centered(text, game.config.SCREEN_WIDTH)
+    return (converted, (x, y))
+
 
 class GameState:
     """Base class for game states using the State pattern.
@@ -21,6 +100,8 @@ class GameState:
     game logic, and draw state-specific UI elements differently.
     """
 
+    __slots__ = ()
+
     def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
         """Handle input events for this state.
 
@@ -53,6 +134,8 @@ class PlayingState(GameState):
     all normal gameplay mechanics are active.
     """
 
+    __slots__ = ()
+
     def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
         """Handle input during active gameplay.
 
@@ -77,38 +160,65 @@ class PlayingState(GameState):
             B: Activate Line Bomb (if available)
             R: Manual rising line trigger (if manual mode enabled)
         """
-        key = event.key
-
-        # Movement controls
-        if key == pygame.K_LEFT:
-            game.move_piece(-1, 0)
-        elif key == pygame.K_RIGHT:
-            game.move_piece(1, 0)
-        elif key == pygame.K_DOWN:
-            if game.move_piece(0, 1):
-                game.score += game.config.SOFT_DROP_BONUS
-        elif key == pygame.K_UP:
-            game.rotate_piece()
-        elif key == pygame.K_SPACE:
-            game.hard_drop()
-        # Piece management
-        elif key == pygame.K_c:
-            game.hold_current_piece()
-        elif key == pygame.K_g:
-            game.show_ghost = not game.show_ghost
-        # Game state changes
-        elif key == pygame.K_p:
-            game.state = PausedState()
-        elif key == pygame.K_d:
-            game.reset_game()
-            game.state = DemoState()
-        elif key == pygame.K_m:
-            game.state = ConfigMenuState()
-        # Power-ups and special actions
-        elif key == pygame.K_b:
-            self._handle_line_bomb(game)
-        elif key == pygame.K_r:
-            game.manual_trigger_rise()
+        # One dictionary probe instead of a chain of key comparisons
+        handler = self._KEY_HANDLERS.get(event.key)
+        if handler is not None:
+            handler(self, game)
+
+    # Movement controls
+
+    def _move_left(self, game: "TetrisGame") -> None:
+        """Move the piece one column left."""
+        game.move_piece(-1, 0)
+
+    def _move_right(self, game: "TetrisGame") -> None:
+        """Move the piece one column right."""
+        game.move_piece(1, 0)
+
+    def _soft_drop(self, game: "TetrisGame") -> None:
+        """Move the piece one row down, scoring the soft drop bonus."""
+        if game.move_piece(0, 1):
+            game.score += game.config.SOFT_DROP_BONUS
+
+    def _rotate(self, game: "TetrisGame") -> None:
+        """Rotate the piece clockwise."""
+        game.rotate_piece()
+
+    def _hard_drop(self, game: "TetrisGame") -> None:
+        """Drop the piece instantly."""
+        game.hard_drop()
+
+    # Piece management
+
+    def _hold(self, game: "TetrisGame") -> None:
+        """Hold the current piece."""
+        game.hold_current_piece()
+
+    def _toggle_ghost(self, game: "TetrisGame") -> None:
+        """Toggle ghost piece visibility."""
+        game.show_ghost = not game.show_ghost
+
+    # Game state changes
+
+    def _pause(self, game: "TetrisGame") -> None:
+        """Pause the game."""
+        game.state = PAUSED_STATE
+
+    def _start_demo(self, game: "TetrisGame") -> None:
+        """Reset the game and enter demo mode."""
+        game.reset_game()
+        game.state = DemoState()
+
+    def _open_config_menu(self, game: "TetrisGame") -> None:
+        """Open the configuration menu."""
+        CONFIG_MENU_STATE.reset()
+        game.state = CONFIG_MENU_STATE
+
+    # Power-ups and special actions
+
+    def _manual_rise(self, game: "TetrisGame") -> None:
+        """Trigger a rising line (manual rising mode only)."""
+        game.manual_trigger_rise()
 
     def _handle_line_bomb(self, game: "TetrisGame") -> None:
         """Handle Line Bomb power-up activation."""
@@ -116,6 +226,22 @@ class PlayingState(GameState):
             if game.powerup_manager.use_powerup("line_bomb"):
                 game._clear_bottom_line()
 
+    # Key to handler; handlers are plain functions taking (state, game)
+    _KEY_HANDLERS: Dict[int, Callable[["PlayingState", "TetrisGame"], None]] = {
+        K_LEFT: _move_left,
+        K_RIGHT: _move_right,
+        K_DOWN: _soft_drop,
+        K_UP: _rotate,
+        K_SPACE: _hard_drop,
+        K_c: _hold,
+        K_g: _toggle_ghost,
+        K_p: _pause,
+        K_d: _start_demo,
+        K_m: _open_config_menu,
+        K_b: _handle_line_bomb,
+        K_r: _manual_rise,
+    }
+
     def update(self, delta_time: int, game: "TetrisGame") -> None:
         """Update active gameplay.
 
@@ -130,13 +256,13 @@ class PlayingState(GameState):
         # Auto-fall
         game.fall_time += delta_time
 
-        # Apply time dilator effect (slows fall speed by 50%)
-        effective_fall_speed = game.fall_speed
-        if game.powerup_manager.is_active("time_dilator"):
-            effective_fall_speed *= 2  # Double the time needed = 50% slower
+        # Fall speed with the time dilator effect (slows falling by 50%)
+        effective_fall_speed = game.get_effective_fall_speed()
 
         if game.fall_time >= effective_fall_speed:
-            game.fall_time = 0
+            # Keep the overshoot toward the next fall, dropping whole
+            # intervals missed during a stall instead of catching up
+            game.fall_time %= effective_fall_speed
             if not game.move_piece(0, 1):
                 # Piece has landed
                 if not game.piece_has_landed:
@@ -170,6 +296,12 @@ class PausedState(GameState):
     is displayed. Only unpause input is processed.
     """
 
+    __slots__ = ()
+
+    # Static texts and their positions with the font they were rendered for,
+    # shared by all instances
+    _static_draws: Tuple[Optional[pygame.font.Font], List[TextDraw]] = (None, [])
+
     def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
         """Handle input while paused.
 
@@ -182,8 +314,8 @@ class PausedState(GameState):
         Key bindings:
             P: Unpause and return to playing state
         """
-        if event.key == pygame.K_p:
-            game.state = PlayingState()
+        if event.key == K_p:
+            game.state = PLAYING_STATE
 
     def update(self, delta_time: int, game: "TetrisGame") -> None:
         """No updates while paused.
@@ -202,22 +334,22 @@ class PausedState(GameState):
         Args:
             game: The TetrisGame instance providing screen and rendering context
         """
-        overlay = pygame.Surface((game.config.SCREEN_WIDTH, game.config.SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(game.config.BLACK)
-        game.screen.blit(overlay, (0, 0))
-
-        pause_text = game.font.render("PAUSED", True, game.config.WHITE)
-        continue_text = game.small_font.render("Press P to Continue", True, game.config.WHITE)
+        # Re-rendered only for another game's font
+        font, text_draws = PausedState._static_draws
+        if font is not game.font:
+            text_draws = [
+                centered_text(render_text(game.font, "PAUSED", game.config.WHITE), game, 250),
+                centered_text(
+                    render_text(game.small_font, "Press P to Continue", game.config.WHITE),
+                    game,
+                    320,
+                ),
+            ]
+            PausedState._static_draws = (game.font, text_draws)
 
-        game.screen.blit(
-            pause_text,
-            (game.config.SCREEN_WIDTH // 2 - pause_text.get_width() // 2, 250),
-        )
-        game.screen.blit(
-            continue_text,
-            (game.config.SCREEN_WIDTH // 2 - continue_text.get_width() // 2, 320),
-        )
+        # Overlay and texts in one batched blit
+        overlay = game.get_overlay(game.config.SCREEN_HEIGHT, 180)
+        game.screen.blits(((overlay, (0, 0)), *text_draws), doreturn=False)
 
 
 class LineClearingState(GameState):
@@ -228,6 +360,8 @@ class LineClearingState(GameState):
     processed during the animation.
     """
 
+    __slots__ = ("previous_state", "previous_state_cls")
+
     def __init__(self, previous_state: Optional[GameState] = None) -> None:
         """Initialize line clearing state.
 
@@ -237,6 +371,8 @@ class LineClearingState(GameState):
         """
         super().__init__()
         self.previous_state = previous_state
+        # Class of the state to return to, compared by identity on completion
+        self.previous_state_cls = PlayingState if previous_state is None else type(previous_state)
 
     def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
         """No input handling during line clearing.
@@ -263,18 +399,12 @@ class LineClearingState(GameState):
         game.clear_animation_time += delta_time
         if game.clear_animation_time >= game.clear_animation_duration:
             game.finish_clearing_animation()
-            # Return to appropriate state
-            if self.previous_state is not None:
-                # Create a new instance of the same state type
-                if isinstance(self.previous_state, DemoState):
-                    game.state = DemoState()
-                elif isinstance(self.previous_state, PlayingState):
-                    game.state = PlayingState()
-                else:
-                    # Fallback to the stored instance for other states
-                    game.state = self.previous_state
+            # Return to the shared playing state, or resume the stored state
+            # (e.g. a demo, keeping its AI and saved rising lines setting)
+            if self.previous_state_cls is PlayingState or self.previous_state is None:
+                game.state = PLAYING_STATE
             else:
-                game.state = PlayingState()
+                game.state = self.previous_state
 
     def draw(self, game: "TetrisGame") -> None:
         """No additional drawing needed - animation handled in draw_grid.
@@ -294,10 +424,26 @@ class GameOverState(GameState):
     Shows final score and allows restarting.
     """
 
+    __slots__ = (
+        "game_over_time",
+        "_update",
+        "_score",
+        "_score_draw",
+    )
+
+    # Static texts and their positions with the font they were rendered for,
+    # shared by all instances
+    _static_draws: Tuple[Optional[pygame.font.Font], List[TextDraw]] = (None, [])
+
     def __init__(self) -> None:
         """Initialize game over state."""
         super().__init__()
         self.game_over_time = 0
+        # Update step, chosen from the config on the first update
+        self._update: Callable[[int, "TetrisGame"], None] = self._bind_update
+        # Final score text, re-rendered only when the score changes
+        self._score: Optional[int] = None
+        self._score_draw: Optional[TextDraw] = None
 
     def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
         """Handle input in game over state.
@@ -311,24 +457,53 @@ class GameOverState(GameState):
         Key bindings:
             R: Reset game and return to playing state
         """
-        if event.key == pygame.K_r:
+        if event.key == K_r:
             game.reset_game()
-            game.state = PlayingState()
+            game.state = PLAYING_STATE
 
     def update(self, delta_time: int, game: "TetrisGame") -> None:
         """Update game over state.
 
         Tracks time and transitions to demo mode after delay if configured.
 
+        Args:
+            delta_time: Time elapsed in milliseconds
+            game: The TetrisGame instance
+        """
+        self._update(delta_time, game)
+
+    def _bind_update(self, delta_time: int, game: "TetrisGame") -> None:
+        """Choose the update step from the config once, then run it.
+
         Args:
             delta_time: Time elapsed in milliseconds
             game: The TetrisGame instance
         """
         if game.config.DEMO_AFTER_GAME_OVER:
-            self.game_over_time += delta_time
-            if self.game_over_time >= game.config.DEMO_GAME_OVER_DELAY:
-                game.reset_game()
-                game.state = DemoState()
+            self._update = self._update_demo_timeout
+        else:
+            self._update = self._update_idle
+        self._update(delta_time, game)
+
+    def _update_demo_timeout(self, delta_time: int, game: "TetrisGame") -> None:
+        """Start demo mode once the game over delay has passed.
+
+        Args:
+            delta_time: Time elapsed in milliseconds
+            game: The TetrisGame instance
+        """
+        self.game_over_time += delta_time
+        if self.game_over_time >= game.config.DEMO_GAME_OVER_DELAY:
+            game.reset_game()
+            game.state = DemoState()
+
+    def _update_idle(self, delta_time: int, game: "TetrisGame") -> None:
+        """Wait for a restart without demo mode.
+
+        Args:
+            delta_time: Time elapsed in milliseconds
+            game: The TetrisGame instance
+        """
 
     def draw(self, game: "TetrisGame") -> None:
         """Draw game over overlay.
@@ -339,26 +514,31 @@ class GameOverState(GameState):
         Args:
             game: The TetrisGame instance providing screen and rendering context
         """
-        overlay = pygame.Surface((game.config.SCREEN_WIDTH, game.config.SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(game.config.BLACK)
-        game.screen.blit(overlay, (0, 0))
-
-        game_over_text = game.font.render("GAME OVER", True, game.config.RED)
-        score_text = game.font.render(f"Final Score: {game.score}", True, game.config.WHITE)
-        restart_text = game.small_font.render("Press R to Restart", True, game.config.WHITE)
-
-        game.screen.blit(
-            game_over_text,
-            (game.config.SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 250),
-        )
-        game.screen.blit(
-            score_text,
-            (game.config.SCREEN_WIDTH // 2 - score_text.get_width() // 2, 320),
-        )
-        game.screen.blit(
-            restart_text,
-            (game.config.SCREEN_WIDTH // 2 - restart_text.get_width() // 2, 400),
+        font, text_draws = GameOverState._static_draws
+        if font is not game.font:
+            text_draws = [
+                centered_text(render_text(game.font, "GAME OVER", game.config.RED), game, 250),
+                centered_text(
+                    render_text(game.small_font, "Press R to Restart", game.config.WHITE),
+                    game,
+                    400,
+                ),
+            ]
+            GameOverState._static_draws = (game.font, text_draws)
+        if self._score != game.score or self._score_draw is None:
+            self._score = game.score
+            self._score_draw = centered_text(
+                render_text(game.font, f"Final Score: {game.score}", game.config.WHITE), game, 320
+            )
+
+        # Overlay and texts in one batched blit
+        game.screen.blits(
+            (
+                (game.get_overlay(game.config.SCREEN_HEIGHT, 200), (0, 0)),
+                *text_draws,
+                self._score_draw,
+            ),
+            doreturn=False,
         )
 
 
@@ -369,12 +549,22 @@ class DemoState(GameState):
     gameplay. Any key press exits demo mode and starts a new game.
     """
 
+    __slots__ = ("ai", "clock_ms", "next_move_at", "previous_rising_state", "_update")
+
+    # Top banner with its texts baked in and the font they were rendered for,
+    # shared by all instances
+    _banner: Tuple[Optional[pygame.font.Font], Optional[pygame.Surface]] = (None, None)
+
     def __init__(self) -> None:
         """Initialize demo state."""
         super().__init__()
-        self.ai: Optional["DemoAI"] = None
-        self.move_timer = 0
+        self.ai: Optional[DemoAI] = None
+        # Demo time elapsed and the time the AI's next move is due (milliseconds)
+        self.clock_ms = 0
+        self.next_move_at = 0
         self.previous_rising_state = None  # Store previous state to restore later
+        # Update step, replaced by the AI-driven step on the first update
+        self._update: Callable[[int, "TetrisGame"], None] = self._start
 
     def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
         """Handle input during demo mode.
@@ -396,7 +586,7 @@ class DemoState(GameState):
 
         # Any key exits demo mode
         game.reset_game()
-        game.state = PlayingState()
+        game.state = PLAYING_STATE
 
     def update(self, delta_time: int, game: "TetrisGame") -> None:
         """Update demo mode.
@@ -408,35 +598,47 @@ class DemoState(GameState):
             delta_time: Time elapsed since last update in milliseconds
             game: The TetrisGame instance to update
         """
-        # Initialize AI if needed and ensure rising lines are enabled
-        if self.ai is None:
-            # Import here to avoid circular dependencies
-            from src.demo_ai import DemoAI  # pylint: disable=import-outside-toplevel
+        self._update(delta_time, game)
 
-            # Store previous rising lines state and enable it for demo
-            self.previous_rising_state = game.config.RISING_LINES_ENABLED
-            game.config.RISING_LINES_ENABLED = True
+    def _start(self, delta_time: int, game: "TetrisGame") -> None:
+        """Create the AI and enable rising lines once, then run the update.
 
-            self.ai = DemoAI(game)
+        Args:
+            delta_time: Time elapsed since last update in milliseconds
+            game: The TetrisGame instance to update
+        """
+        # Store previous rising lines state and enable it for demo
+        self.previous_rising_state = game.config.RISING_LINES_ENABLED
+        game.config.RISING_LINES_ENABLED = True
 
-        # AI decision making
-        self.move_timer += delta_time
-        ai_delay = self.ai.get_movement_delay()
+        ai = self.ai = DemoAI(game)
+        self._update = partial(self._update_with_ai, ai)
+        self._update(delta_time, game)
 
-        if self.move_timer >= ai_delay:
-            self.move_timer = 0
-            self.ai.make_next_move()
+    def _update_with_ai(self, ai: DemoAI, delta_time: int, game: "TetrisGame") -> None:
+        """Let the AI move when due and apply automatic falling.
+
+        Args:
+            ai: The demo's AI player
+            delta_time: Time elapsed since last update in milliseconds
+            game: The TetrisGame instance to update
+        """
+        # AI decision making, scheduled from the previous move's due time so
+        # frame overshoot does not slow the AI down; at most one move per
+        # update, and a schedule that fell behind restarts from now
+        clock_ms = self.clock_ms = self.clock_ms + delta_time
+        if clock_ms >= self.next_move_at:
+            ai.make_next_move()
+            self.next_move_at = max(self.next_move_at + ai.get_movement_delay(), clock_ms)
 
         # Auto-fall (same as PlayingState)
         game.fall_time += delta_time
 
-        # Apply time dilator effect (slows fall speed by 50%)
-        effective_fall_speed = game.fall_speed
-        if game.powerup_manager.is_active("time_dilator"):
-            effective_fall_speed *= 2  # Double the time needed = 50% slower
+        # Fall speed with the time dilator effect (slows falling by 50%)
+        effective_fall_speed = game.get_effective_fall_speed()
 
         if game.fall_time >= effective_fall_speed:
-            game.fall_time = 0
+            game.fall_time %= effective_fall_speed
             if not game.move_piece(0, 1):
                 # Piece has landed
                 if not game.piece_has_landed:
@@ -464,24 +666,25 @@ class DemoState(GameState):
         Args:
             game: The TetrisGame instance providing screen and rendering context
         """
-        # Semi-transparent overlay at top
-        overlay = pygame.Surface((game.config.SCREEN_WIDTH, 100))
-        overlay.set_alpha(200)
-        overlay.fill(game.config.BLACK)
-        game.screen.blit(overlay, (0, 0))
-
-        # Demo mode text
-        demo_text = game.font.render("DEMO MODE", True, game.config.CYAN)
-        prompt_text = game.small_font.render("Press any key to play", True, game.config.WHITE)
-
-        game.screen.blit(
-            demo_text,
-            (game.config.SCREEN_WIDTH // 2 - demo_text.get_width() // 2, 20),
-        )
-        game.screen.blit(
-            prompt_text,
-            (game.config.SCREEN_WIDTH // 2 - prompt_text.get_width() // 2, 65),
-        )
+        # Semi-transparent top overlay with the demo mode texts composited
+        # onto it, rebuilt only for another game's font
+        font, banner = DemoState._banner
+        if banner is None or font is not game.font:
+            banner = game.get_overlay(100, 200).copy()
+            banner.blits(
+                (
+                    centered_text(render_text(game.font, "DEMO MODE", game.config.CYAN), game, 20),
+                    centered_text(
+                        render_text(game.small_font, "Press any key to play", game.config.WHITE),
+                        game,
+                        65,
+                    ),
+                ),
+                doreturn=False,
+            )
+            DemoState._banner = (game.font, banner)
+
+        game.screen.blit(banner, (0, 0))
 
 
 class ConfigMenuState(GameState):
@@ -494,19 +697,35 @@ class ConfigMenuState(GameState):
     - Rising Lines feature toggle
     """
 
+    __slots__ = (
+        "selected_option",
+        "options",
+        "difficulty_levels",
+        "current_difficulty",
+        "_label_draws",
+        "_labels_key",
+    )
+
     def __init__(self) -> None:
         """Initialize config menu state."""
         super().__init__()
-        self.selected_option = 0
         self.options = ["difficulty", "charged_blocks", "hold_blocks", "rising_lines", "back"]
         self.difficulty_levels = ["easy", "medium", "hard", "expert"]
+        self.reset()
+
+        # Rendered labels with their positions, and the menu state they show
+        self._label_draws: List[TextDraw] = []
+        self._labels_key: Optional[Tuple[object, ...]] = None
 
-        # Get current difficulty based on fall speed
-        self.current_difficulty = "medium"  # default
-        for difficulty, settings in GameConfig.DIFFICULTY_SETTINGS.items():
-            if GameConfig.INITIAL_FALL_SPEED == settings["initial_speed"]:
-                self.current_difficulty = difficulty
-                break
+    def reset(self) -> None:
+        """Select the first option and the difficulty matching the current fall speed.
+
+        Called when the shared menu is reopened, so it starts from the
+        current settings like a new menu would.
+        """
+        self.selected_option = 0
+        # Get current difficulty based on fall speed (medium by default)
+        self.current_difficulty = SPEED_TO_DIFFICULTY.get(GameConfig.INITIAL_FALL_SPEED, "medium")
 
     def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
         """Handle input in config menu.
@@ -521,18 +740,46 @@ class ConfigMenuState(GameState):
             ENTER/SPACE: Apply changes and return to game
             ESC: Return to game without changes
         """
-        if event.key == pygame.K_UP:
-            self.selected_option = (self.selected_option - 1) % len(self.options)
-        elif event.key == pygame.K_DOWN:
-            self.selected_option = (self.selected_option + 1) % len(self.options)
-        elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
-            self._change_option(event.key == pygame.K_RIGHT, game)
-        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-            if self.options[self.selected_option] == "back":
-                self._apply_settings(game)
-                game.state = PlayingState()
-        elif event.key == pygame.K_ESCAPE:
-            game.state = PlayingState()
+        handler = self._KEY_HANDLERS.get(event.key)
+        if handler is not None:
+            handler(self, game)
+
+    def _select_previous(self, _game: "TetrisGame") -> None:
+        """Select the option above, wrapping to the last one."""
+        self.selected_option = (self.selected_option - 1) % len(self.options)
+
+    def _select_next(self, _game: "TetrisGame") -> None:
+        """Select the option below, wrapping to the first one."""
+        self.selected_option = (self.selected_option + 1) % len(self.options)
+
+    def _decrease_option(self, game: "TetrisGame") -> None:
+        """Decrease or disable the selected option."""
+        self._change_option(False, game)
+
+    def _increase_option(self, game: "TetrisGame") -> None:
+        """Increase or enable the selected option."""
+        self._change_option(True, game)
+
+    def _confirm(self, game: "TetrisGame") -> None:
+        """Apply the settings and return to the game when "back" is selected."""
+        if self.options[self.selected_option] == "back":
+            self._apply_settings(game)
+            game.state = PLAYING_STATE
+
+    def _cancel(self, game: "TetrisGame") -> None:
+        """Return to the game without applying the difficulty."""
+        game.state = PLAYING_STATE
+
+    # Key to handler; handlers are plain functions taking (state, game)
+    _KEY_HANDLERS: Dict[int, Callable[["ConfigMenuState", "TetrisGame"], None]] = {
+        K_UP: _select_previous,
+        K_DOWN: _select_next,
+        K_LEFT: _decrease_option,
+        K_RIGHT: _increase_option,
+        K_RETURN: _confirm,
+        K_SPACE: _confirm,
+        K_ESCAPE: _cancel,
+    }
 
     def _change_option(self, increase: bool, game: "TetrisGame") -> None:
         """Change the value of the selected option.
@@ -575,10 +822,7 @@ class ConfigMenuState(GameState):
         game.config.RISING_MIN_INTERVAL = settings["rising_min_interval"]
 
         # Recalculate fall speed for current level
-        new_speed = (
-            game.config.INITIAL_FALL_SPEED - (game.level - 1) * game.config.LEVEL_SPEED_DECREASE
-        )
-        game.fall_speed = max(new_speed, game.config.MIN_FALL_SPEED)
+        game.fall_speed = game.config.fall_speed_for_level(game.level)
 
         # Recalculate rising interval for current level
         game.rising_interval = game.calculate_rising_interval()
@@ -599,81 +843,63 @@ class ConfigMenuState(GameState):
         Args:
             game: The TetrisGame instance providing screen and rendering context
         """
-        # Semi-transparent overlay
-        overlay = pygame.Surface((game.config.SCREEN_WIDTH, game.config.SCREEN_HEIGHT))
-        overlay.set_alpha(230)
-        overlay.fill(game.config.BLACK)
-        game.screen.blit(overlay, (0, 0))
+        # Labels only change with the selection, a setting or another game's
+        # font, so they are re-rendered only then
+        labels_key = (
+            game.font,
+            self.selected_option,
+            self.current_difficulty,
+            game.config.CHARGED_BLOCKS_ENABLED,
+            game.config.HOLD_ENABLED,
+            game.config.RISING_LINES_ENABLED,
+        )
+        if labels_key != self._labels_key:
+            self._rebuild_text(game)
+            self._labels_key = labels_key
+
+        # Semi-transparent overlay, then the labels, in one batched blit
+        overlay = game.get_overlay(game.config.SCREEN_HEIGHT, 230)
+        game.screen.blits(((overlay, (0, 0)), *self._label_draws), doreturn=False)
 
+    def _rebuild_text(self, game: "TetrisGame") -> None:
+        """Render the menu labels and their centered positions.
+
+        Args:
+            game: The TetrisGame instance providing fonts and settings
+
+        Side effects:
+            Replaces self._label_draws with (surface, position) pairs to blit
+        """
         # Title
-        title_text = game.font.render("CONFIGURATION", True, game.config.WHITE)
-        game.screen.blit(
-            title_text,
-            (game.config.SCREEN_WIDTH // 2 - title_text.get_width() // 2, 100),
-        )
+        draws = [
+            centered_text(render_text(game.font, "CONFIGURATION", game.config.WHITE), game, 100)
+        ]
 
         # Menu options
         y_start = 200
         y_spacing = 60
 
-        # Difficulty option
-        difficulty_color = game.config.CYAN if self.selected_option == 0 else game.config.WHITE
-        difficulty_text = game.small_font.render(
-            f"Difficulty: < {self.current_difficulty.upper()} >",
-            True,
-            difficulty_color,
-        )
-        game.screen.blit(
-            difficulty_text,
-            (game.config.SCREEN_WIDTH // 2 - difficulty_text.get_width() // 2, y_start),
-        )
-
-        # Charged Blocks option
-        charged_color = game.config.CYAN if self.selected_option == 1 else game.config.WHITE
-        charged_status = "ON" if game.config.CHARGED_BLOCKS_ENABLED else "OFF"
-        charged_text = game.small_font.render(
-            f"Charged Blocks: < {charged_status} >",
-            True,
-            charged_color,
-        )
-        game.screen.blit(
-            charged_text,
-            (game.config.SCREEN_WIDTH // 2 - charged_text.get_width() // 2, y_start + y_spacing),
-        )
-
-        # Hold Blocks option
-        hold_color = game.config.CYAN if self.selected_option == 2 else game.config.WHITE
-        hold_status = "ON" if game.config.HOLD_ENABLED else "OFF"
-        hold_text = game.small_font.render(
-            f"Hold Blocks: < {hold_status} >",
-            True,
-            hold_color,
-        )
-        game.screen.blit(
-            hold_text,
-            (game.config.SCREEN_WIDTH // 2 - hold_text.get_width() // 2, y_start + y_spacing * 2),
-        )
+        def option_color(index: int) -> Tuple[int, int, int]:
+            color: Tuple[int, int, int] = (
+                game.config.CYAN if self.selected_option == index else game.config.WHITE
+            )
+            return color
 
-        # Rising Lines option
-        rising_color = game.config.CYAN if self.selected_option == 3 else game.config.WHITE
-        rising_status = "ON" if game.config.RISING_LINES_ENABLED else "OFF"
-        rising_text = game.small_font.render(
-            f"Rising Lines: < {rising_status} >",
-            True,
-            rising_color,
-        )
-        game.screen.blit(
-            rising_text,
-            (game.config.SCREEN_WIDTH // 2 - rising_text.get_width() // 2, y_start + y_spacing * 3),
-        )
+        def on_off(enabled: bool) -> str:
+            return "ON" if enabled else "OFF"
 
-        # Back option
-        back_color = game.config.CYAN if self.selected_option == 4 else game.config.WHITE
-        back_text = game.small_font.render("< APPLY & BACK >", True, back_color)
-        game.screen.blit(
-            back_text,
-            (game.config.SCREEN_WIDTH // 2 - back_text.get_width() // 2, y_start + y_spacing * 4.5),
-        )
+        labels = [
+            f"Difficulty: < {self.current_difficulty.upper()} >",
+            f"Charged Blocks: < {on_off(game.config.CHARGED_BLOCKS_ENABLED)} >",
+            f"Hold Blocks: < {on_off(game.config.HOLD_ENABLED)} >",
+            f"Rising Lines: < {on_off(game.config.RISING_LINES_ENABLED)} >",
+            "< APPLY & BACK >",
+        ]
+        # The back option sits half a row lower than the settings
+        rows = [0, 1, 2, 3, 4.5]
+        for index, (label, row) in enumerate(zip(labels, rows)):
+            text = render_text(game.small_font, label, option_color(index))
+            draws.append(centered_text(text, game, y_start + y_spacing * row))
 
         # Instructions
         instructions = [
@@ -685,11 +911,14 @@ class ConfigMenuState(GameState):
 
         y_instructions = y_start + y_spacing * 6
         for i, instruction in enumerate(instructions):
-            instruction_text = game.small_font.render(instruction, True, game.config.GRAY)
-            game.screen.blit(
-                instruction_text,
-                (
-                    game.config.SCREEN_WIDTH // 2 - instruction_text.get_width() // 2,
-                    y_instructions + i * 25,
-                ),
-            )
+            instruction_text = render_text(game.small_font, instruction, game.config.GRAY)
+            draws.append(centered_text(instruction_text, game, y_instructions + i * 25))
+
+        self._label_draws = draws
+
+
+# Shared instances of the states that keep no per-visit data; transitions reuse
+# them instead of allocating a new state each time
+PLAYING_STATE = PlayingState()
+PAUSED_STATE = PausedState()
+CONFIG_MENU_STATE = ConfigMenuState()
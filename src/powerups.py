@@ -6,6 +6,7 @@ power-ups to the game without breaking core Tetris mechanics.
 """
 
 import random
+from bisect import bisect_right
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
@@ -24,10 +25,26 @@ class PowerUpManager:
 
     Attributes:
         config: Game configuration class
-        powerup_blocks: List of (x, y, powerup_type) for blocks in the grid
+        powerup_blocks: List of (x, y, powerup_type) for blocks in the grid;
+            assigning a new list rebuilds the manager's indexes, while in-place
+            changes should go through the manager's methods
         active_powerups: Dict mapping powerup type to remaining time/uses
     """
 
+    __slots__ = (
+        "config",
+        "_powerup_blocks",
+        "active_powerups",
+        "_by_cell",
+        "_by_row",
+        "_powerup_type_list",
+        "_display_names",
+        "_color_by_type",
+        "_kind_by_type",
+        "_display_shown",
+        "_display_info",
+    )
+
     def __init__(self, config: "GameConfig") -> None:
         """Initialize the power-up manager.
 
@@ -35,14 +52,58 @@ class PowerUpManager:
             config: Game configuration class providing power-up settings
         """
         self.config = config
-        self.powerup_blocks: List[Tuple[int, int, str]] = []
+        self._powerup_blocks: List[Tuple[int, int, str]] = []
         self.active_powerups: Dict[str, Union[int, float]] = {}
+        # Indexes of powerup_blocks: first power-up type per cell, and types per row
+        self._by_cell: Dict[Tuple[int, int], str] = {}
+        self._by_row: Dict[int, List[str]] = {}
+
+        # Per-type display name, color and kind ("duration", "uses" or None),
+        # derived once from the fixed set of configured power-up types
+        power_up_types = config.POWER_UP_TYPES
+        self._powerup_type_list = list(power_up_types)
+        self._display_names = {
+            powerup_type: powerup_type.replace("_", " ").title() for powerup_type in power_up_types
+        }
+        self._color_by_type: Dict[str, Tuple[int, int, int]] = {
+            powerup_type: settings.get("color", (255, 255, 255))
+            for powerup_type, settings in power_up_types.items()
+        }
+        self._kind_by_type: Dict[str, Optional[str]] = {
+            powerup_type: (
+                "duration" if "duration" in settings else "uses" if "uses" in settings else None
+            )
+            for powerup_type, settings in power_up_types.items()
+        }
+        # Last display list and the (powerup_type, shown number) pairs it shows
+        self._display_shown: Tuple[Tuple[str, int], ...] = ()
+        self._display_info: List[Tuple[str, str, Tuple[int, int, int]]] = []
+
+    @property
+    def powerup_blocks(self) -> List[Tuple[int, int, str]]:
+        """List of (x, y, powerup_type) for power-up blocks in the grid."""
+        return self._powerup_blocks
+
+    @powerup_blocks.setter
+    def powerup_blocks(self, blocks: List[Tuple[int, int, str]]) -> None:
+        self._powerup_blocks = blocks
+        # The lookups go through the indexes, so they must follow the new list
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild the cell and row indexes from powerup_blocks."""
+        self._by_cell = {}
+        self._by_row = {}
+        for x, y, powerup_type in self._powerup_blocks:
+            self._by_cell.setdefault((x, y), powerup_type)
+            self._by_row.setdefault(y, []).append(powerup_type)
 
     def should_spawn_powerup(self) -> bool:
         """Determine if a block should become a power-up.
 
         Uses configured spawn chance to randomly decide if a block
-        should be a power-up block.
+        should be a power-up block. The feature flag is read on every call,
+        since the config menu toggles it while the game runs.
 
         Returns:
             True if block should be a power-up, False otherwise
@@ -59,7 +120,7 @@ class PowerUpManager:
         Returns:
             Power-up type name (e.g., 'time_dilator', 'score_amplifier')
         """
-        return random.choice(list(self.config.POWER_UP_TYPES.keys()))
+        return random.choice(self._powerup_type_list)
 
     def add_powerup_block(self, x: int, y: int, powerup_type: str) -> None:
         """Add a power-up block at the specified location.
@@ -69,7 +130,9 @@ class PowerUpManager:
             y: Grid y coordinate
             powerup_type: Type of power-up to place
         """
-        self.powerup_blocks.append((x, y, powerup_type))
+        self._powerup_blocks.append((x, y, powerup_type))
+        self._by_cell.setdefault((x, y), powerup_type)
+        self._by_row.setdefault(y, []).append(powerup_type)
 
     def get_powerups_in_line(self, line_y: int) -> List[str]:
         """Get all power-ups in a specific line.
@@ -80,11 +143,7 @@ class PowerUpManager:
         Returns:
             List of power-up types found in the line
         """
-        powerups = []
-        for _, y, powerup_type in self.powerup_blocks:
-            if y == line_y:
-                powerups.append(powerup_type)
-        return powerups
+        return list(self._by_row.get(line_y, ()))
 
     def remove_powerups_in_lines(self, lines: List[int]) -> List[str]:
         """Remove power-ups from cleared lines and return activated types.
@@ -96,11 +155,13 @@ class PowerUpManager:
             List of power-up types that were activated
         """
         lines_set = set(lines)
+        if not any(y in self._by_row for y in lines_set):
+            return []
         activated = []
 
         # Find power-ups in cleared lines
         remaining_blocks = []
-        for x, y, powerup_type in self.powerup_blocks:
+        for x, y, powerup_type in self._powerup_blocks:
             if y in lines_set:
                 activated.append(powerup_type)
             else:
@@ -118,17 +179,57 @@ class PowerUpManager:
         if not lines_cleared:
             return
 
-        # Sort lines in descending order
-        sorted_lines = sorted(lines_cleared, reverse=True)
-        shifted_blocks = []
+        # Sort lines in ascending order
+        sorted_lines = sorted(lines_cleared)
+        line_count = len(sorted_lines)
+
+        # Each block moves down by the number of cleared lines below it
+        self.powerup_blocks = [
+            (x, y + line_count - bisect_right(sorted_lines, y), powerup_type)
+            for x, y, powerup_type in self._powerup_blocks
+        ]
+
+    def clear_and_shift(self, lines: List[int]) -> List[str]:
+        """Remove power-ups from cleared lines and shift the rest down in one pass.
+
+        Equivalent to remove_powerups_in_lines followed by shift_powerups_down,
+        for when the grid drops the lines at once rather than after an animation.
+
+        Args:
+            lines: List of line y coordinates being cleared
+
+        Returns:
+            List of power-up types that were in the cleared lines
+        """
+        if not lines or not self._powerup_blocks:
+            return []
 
-        for x, y, powerup_type in self.powerup_blocks:
-            # Count how many cleared lines were below this block
-            shift_amount = sum(1 for line in sorted_lines if line > y)
-            new_y = y + shift_amount
-            shifted_blocks.append((x, new_y, powerup_type))
+        lines_set = set(lines)
+        sorted_lines = sorted(lines_set)
+        line_count = len(sorted_lines)
+        activated = []
 
-        self.powerup_blocks = shifted_blocks
+        # Drop blocks in cleared lines; others move down by the cleared lines below them
+        remaining_blocks = []
+        for x, y, powerup_type in self._powerup_blocks:
+            if y in lines_set:
+                activated.append(powerup_type)
+            else:
+                remaining_blocks.append(
+                    (x, y + line_count - bisect_right(sorted_lines, y), powerup_type)
+                )
+
+        self.powerup_blocks = remaining_blocks
+        return activated
+
+    def shift_powerups_up(self) -> None:
+        """Shift power-up blocks up one row after a line rises from the bottom.
+
+        Power-ups in the top row are pushed off the grid and lost.
+        """
+        self.powerup_blocks = [
+            (x, y - 1, powerup_type) for x, y, powerup_type in self._powerup_blocks if y > 0
+        ]
 
     def activate_powerup(self, powerup_type: str) -> None:
         """Activate a power-up effect.
@@ -136,16 +237,14 @@ class PowerUpManager:
         Args:
             powerup_type: Type of power-up to activate
         """
-        config = self.config.POWER_UP_TYPES.get(powerup_type, {})
-
-        if "duration" in config:
-            # Duration-based power-up (time in milliseconds)
-            current = self.active_powerups.get(powerup_type, 0)
-            self.active_powerups[powerup_type] = current + config["duration"]
-        elif "uses" in config:
-            # Use-based power-up (number of uses)
+        # Duration-based power-ups add time in milliseconds, use-based ones
+        # add uses; types with neither are ignored
+        kind = self._kind_by_type.get(powerup_type)
+        if kind is not None:
             current = self.active_powerups.get(powerup_type, 0)
-            self.active_powerups[powerup_type] = current + config["uses"]
+            self.active_powerups[powerup_type] = (
+                current + self.config.POWER_UP_TYPES[powerup_type][kind]
+            )
 
     def update(self, delta_time: int) -> None:
         """Update active power-up timers.
@@ -153,23 +252,30 @@ class PowerUpManager:
         Args:
             delta_time: Time elapsed since last update in milliseconds
         """
-        expired = []
+        active_powerups = self.active_powerups
+        if not active_powerups:
+            return
 
-        for powerup_type, value in self.active_powerups.items():
-            config = self.config.POWER_UP_TYPES.get(powerup_type, {})
+        kind_by_type = self._kind_by_type
+        # Allocated only on the rare tick where something expires
+        expired: Optional[List[str]] = None
 
-            if "duration" in config:
-                # Duration-based power-up
+        for powerup_type, value in active_powerups.items():
+            # Use-based power-ups (and types missing from the config) don't decay
+            if kind_by_type.get(powerup_type) == "duration":
                 new_value = value - delta_time
-                if new_value <= 0:
-                    expired.append(powerup_type)
+                if new_value > 0:
+                    # Replacing a value keeps the dict's keys, so iteration goes on
+                    active_powerups[powerup_type] = new_value
+                elif expired is None:
+                    expired = [powerup_type]
                 else:
-                    self.active_powerups[powerup_type] = new_value
-            # Use-based power-ups don't decay with time
+                    expired.append(powerup_type)
 
         # Remove expired power-ups
-        for powerup_type in expired:
-            del self.active_powerups[powerup_type]
+        if expired is not None:
+            for powerup_type in expired:
+                del active_powerups[powerup_type]
 
     def is_active(self, powerup_type: str) -> bool:
         """Check if a power-up is currently active.
@@ -185,29 +291,54 @@ class PowerUpManager:
     def get_active_powerups_display(self) -> List[Tuple[str, str, Tuple[int, int, int]]]:
         """Get display information for active power-ups.
 
+        Timers only show whole seconds, so the texts change about once a
+        second; until then the previous list is returned as is.
+
         Returns:
-            List of tuples (powerup_type, display_text, color) for rendering
+            List of tuples (powerup_type, display_text, color) for rendering,
+            shared between calls and not to be modified
         """
-        display_info = []
+        kind_by_type = self._kind_by_type
+
+        # Whole seconds left for duration-based power-ups, uses left otherwise
+        shown = tuple(
+            (
+                powerup_type,
+                (
+                    int(value / 1000) + 1
+                    if kind_by_type.get(powerup_type) == "duration"
+                    else int(value)
+                ),
+            )
+            for powerup_type, value in self.active_powerups.items()
+        )
+        if shown == self._display_shown:
+            return self._display_info
 
-        for powerup_type, value in self.active_powerups.items():
-            config = self.config.POWER_UP_TYPES.get(powerup_type, {})
-            color = config.get("color", (255, 255, 255))
+        display_info = []
+        display_names = self._display_names
+        color_by_type = self._color_by_type
 
-            # Create display name
-            display_name = powerup_type.replace("_", " ").title()
+        for powerup_type, number in shown:
+            # Types missing from the config are shown by name, in white
+            display_name = display_names.get(powerup_type)
+            if display_name is None:
+                display_name = powerup_type.replace("_", " ").title()
 
             # Create display text based on type
-            if "duration" in config:
-                seconds_left = int(value / 1000) + 1
-                display_text = f"{display_name}: {seconds_left}s"
-            elif "uses" in config:
-                display_text = f"{display_name}: {int(value)}x"
+            kind = kind_by_type.get(powerup_type)
+            if kind == "duration":
+                display_text = f"{display_name}: {number}s"
+            elif kind == "uses":
+                display_text = f"{display_name}: {number}x"
             else:
                 display_text = display_name
 
+            color = color_by_type.get(powerup_type, (255, 255, 255))
             display_info.append((powerup_type, display_text, color))
 
+        self._display_shown = shown
+        self._display_info = display_info
         return display_info
 
     def use_powerup(self, powerup_type: str) -> bool:
@@ -222,8 +353,7 @@ class PowerUpManager:
         if powerup_type not in self.active_powerups:
             return False
 
-        config = self.config.POWER_UP_TYPES.get(powerup_type, {})
-        if "uses" not in config:
+        if self._kind_by_type.get(powerup_type) != "uses":
             return False
 
         uses = self.active_powerups[powerup_type]
@@ -238,9 +368,6 @@ class PowerUpManager:
     def get_powerup_at(self, x: int, y: int) -> Optional[str]:
         """Get power-up type at a specific grid location.
 
-        Uses linear search which is acceptable given the small number
-        of power-up blocks typically present (<20 in a standard game).
-
         Args:
             x: Grid x coordinate
             y: Grid y coordinate
@@ -248,12 +375,11 @@ class PowerUpManager:
         Returns:
             Power-up type if present, None otherwise
         """
-        for px, py, powerup_type in self.powerup_blocks:
-            if px == x and py == y:
-                return powerup_type
-        return None
+        return self._by_cell.get((x, y))
 
     def clear_all(self) -> None:
         """Clear all power-up data (for game reset)."""
-        self.powerup_blocks.clear()
+        self._powerup_blocks.clear()
         self.active_powerups.clear()
+        self._by_cell.clear()
+        self._by_row.clear()
@@ -3,19 +3,32 @@ Tetris Game - A complete implementation with modern features
 Features: Ghost piece, hold piece, next piece preview, scoring, levels
 """
 
+import colorsys
+import math
 import random
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
-from src.config import GameConfig
+from src.bitboard import (
+    NextFilled,
+    fall_distance,
+    full_rows,
+    grid_to_rows,
+    next_filled_rows,
+    piece_row_masks,
+)
+from src.config import Cells, GameConfig
 from src.game_states import (
+    PLAYING_STATE,
     DemoState,
     GameOverState,
     GameState,
     LineClearingState,
     PausedState,
     PlayingState,
+    render_text,
 )
 from src.powerups import PowerUpManager
 from src.tetromino import Tetromino
@@ -47,6 +60,57 @@ ORANGE = GameConfig.ORANGE
 SHAPES = GameConfig.SHAPES
 COLORS = GameConfig.COLORS
 
+# Transparent color of opaque piece sprites; no block fill or highlight uses it
+SPRITE_COLORKEY = (255, 0, 254)
+
+# Frequent event types the game loop never handles; blocked while it runs so SDL
+# does not queue them (the game only reacts to QUIT and KEYDOWN)
+IGNORED_EVENT_TYPES = [
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.KEYUP,
+    pygame.TEXTINPUT,
+    pygame.TEXTEDITING,
+    pygame.FINGERMOTION,
+    pygame.FINGERDOWN,
+    pygame.FINGERUP,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.CONTROLLERAXISMOTION,
+]
+
+# Event types the game loop dequeues each frame; anything else still queued
+# (window events and the like) is discarded unprocessed
+HANDLED_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN)
+
+# Fully saturated rainbow color per whole degree of hue, for the power-up glows
+RAINBOW_COLORS: Tuple[Tuple[int, int, int], ...] = tuple(
+    (int(r * 255), int(g * 255), int(b * 255))
+    for r, g, b in (colorsys.hsv_to_rgb(hue / 360.0, 1.0, 1.0) for hue in range(360))
+)
+
+# Alpha (100-255) of the pulsing glows and warning bar per whole degree of pulse phase
+PULSE_ALPHAS: Tuple[int, ...] = tuple(
+    int(100 + 155 * (1 + math.cos(math.radians(phase))) / 2) for phase in range(360)
+)
+
+
+@lru_cache(maxsize=None)
+def _block_colors(color: Tuple[int, int, int]) -> Tuple[pygame.Color, pygame.Color]:
+    """Get the fill and 3D-highlight colors of a block, converted once per color.
+
+    Args:
+        color: RGB color tuple of the block
+
+    Returns:
+        Tuple of (fill, highlight) pygame.Color objects
+    """
+    highlight = tuple(min(c + 40, 255) for c in color)
+    return pygame.Color(*color), pygame.Color(*highlight)
+
 
 class TetrisGame:
     """Main Tetris game class.
@@ -91,6 +155,14 @@ class TetrisGame:
           Conversion: screen_x = GRID_X + grid_x * BLOCK_SIZE
     """
 
+    # Combo tiers as (minimum combo count, text, config color name), highest first
+    _COMBO_TIERS = (
+        (10, "LEGENDARY!", "PURPLE"),
+        (7, "BLAZING!", "RED"),
+        (4, "STREAK!", "ORANGE"),
+        (2, "COMBO!", "YELLOW"),
+    )
+
     def __init__(self, config=None) -> None:
         """Initialize the Tetris game.
 
@@ -130,6 +202,11 @@ class TetrisGame:
         self.combo_display_time = 0
         self.combo_text = ""
         self.combo_tier = ""
+        # Combo tiers with their colors resolved from the config
+        self._combo_tiers: Tuple[Tuple[int, str, Tuple[int, int, int]], ...] = tuple(
+            (threshold, text, getattr(self.config, color_name))
+            for threshold, text, color_name in self._COMBO_TIERS
+        )
 
         # Power-up system
         self.powerup_manager = PowerUpManager(self.config)
@@ -148,6 +225,65 @@ class TetrisGame:
         # Settings
         self.show_ghost = True
 
+        # Row bitmasks of self.grid (see src.bitboard), their per-column "next
+        # filled row" tables, and a copy of the grid they were built from;
+        # rebuilt whenever the grid no longer matches the copy
+        self._grid_rows: Optional[List[int]] = None
+        self._grid_next_filled: NextFilled = ()
+        self._grid_rows_grid: Optional[List[List[Optional[Tuple[int, int, int]]]]] = None
+
+        # Render caches (built lazily on first draw)
+        # Locked blocks only change on lock/clear/rise, so background, grid lines
+        # and placed blocks are drawn once into a surface and blitted per frame
+        self._grid_surface: Optional[pygame.Surface] = None
+        self._grid_surface_rows: Optional[List[List[Optional[Tuple[int, int, int]]]]] = None
+        # One pre-drawn block tile per color, copied wherever a block is drawn
+        self._block_tiles: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        # One pre-drawn sprite per (color, cell layout), i.e. per shape rotation
+        self._piece_sprites: Dict[Tuple[Tuple[int, int, int], Cells], pygame.Surface] = {}
+        # Full-width translucent black overlays of the state screens, per (height, alpha)
+        self._overlays: Dict[Tuple[int, int], pygame.Surface] = {}
+        # Scaled combo text fonts, per font size
+        self._combo_fonts: Dict[int, pygame.font.Font] = {}
+        # Build the paused, game over, demo banner and config menu overlays up front
+        screen_height = self.config.SCREEN_HEIGHT
+        for height, alpha in (
+            (screen_height, 180),
+            (screen_height, 200),
+            (100, 200),
+            (screen_height, 230),
+        ):
+            self.get_overlay(height, alpha)
+        # Rising line warning bar, refilled with the pulsing alpha each frame
+        self._warning_surface = pygame.Surface(
+            (self.config.GRID_WIDTH * self.config.BLOCK_SIZE, 5), pygame.SRCALPHA
+        ).convert_alpha()
+        # Power-up glow scratch surface, cleared and redrawn for each glowing block
+        self._glow_surface = pygame.Surface(
+            (self.config.BLOCK_SIZE - 2, self.config.BLOCK_SIZE - 2), pygame.SRCALPHA
+        ).convert_alpha()
+        # Playfield background and grid lines, drawn once and copied under the
+        # locked blocks whenever the settled grid surface is rebuilt
+        self._grid_background = pygame.Surface(
+            (
+                self.config.GRID_WIDTH * self.config.BLOCK_SIZE + 1,
+                self.config.GRID_HEIGHT * self.config.BLOCK_SIZE + 1,
+            )
+        ).convert()
+        self._draw_grid_background(self._grid_background)
+        # White flash of the clearing animation covering one row's cells, with the
+        # grid lines between them keyed out; faded by its surface alpha each frame
+        block_size = self.config.BLOCK_SIZE
+        self._clear_flash_surface = pygame.Surface(
+            (self.config.GRID_WIDTH * block_size - 2, block_size - 2)
+        ).convert()
+        self._clear_flash_surface.fill(SPRITE_COLORKEY)
+        for x in range(self.config.GRID_WIDTH):
+            self._clear_flash_surface.fill(
+                self.config.WHITE, pygame.Rect(x * block_size, 0, block_size - 2, block_size - 2)
+            )
+        self._clear_flash_surface.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+
         # Rising lines system
         self.rising_timer = 0  # Time accumulated toward next rise
         self.rising_interval = self.config.RISING_INITIAL_INTERVAL
@@ -160,7 +296,7 @@ class TetrisGame:
         if self.config.DEMO_AUTO_START:
             self.state: GameState = DemoState()
         else:
-            self.state: GameState = PlayingState()
+            self.state: GameState = PLAYING_STATE
 
         # Initialize first pieces
         self.next_piece = self.get_random_piece()
@@ -180,12 +316,8 @@ class TetrisGame:
 
         # Assign power-up to one random block if enabled
         if self.powerup_manager.should_spawn_powerup():
-            # Get all block positions in the piece (local coordinates)
-            blocks = []
-            for y, row in enumerate(piece.shape):
-                for x, cell in enumerate(row):
-                    if cell:
-                        blocks.append((x, y))
+            # All block positions in the piece (local coordinates)
+            blocks = piece.cells
 
             if blocks:
                 # Choose one random block to be a power-up
@@ -237,17 +369,26 @@ class TetrisGame:
             Only checks collision with grid blocks if y >= 0.
             Phantom mode power-up allows collision with placed blocks.
         """
-        for x, y in piece.get_blocks():
-            new_x = x + offset_x
-            new_y = y + offset_y
+        # Bind hot lookups to locals; this runs several times per frame
+        grid = self.grid
+        grid_width = self.config.GRID_WIDTH
+        grid_height = self.config.GRID_HEIGHT
+        # Fold the offset into the piece position once, and walk the rotation's
+        # precomputed cell offsets instead of building a block list
+        base_x = piece.x + offset_x
+        base_y = piece.y + offset_y
+
+        for dx, dy in piece.cells:
+            new_x = base_x + dx
+            new_y = base_y + dy
 
             # Check boundaries
-            if new_x < 0 or new_x >= self.config.GRID_WIDTH or new_y >= self.config.GRID_HEIGHT:
+            if new_x < 0 or new_x >= grid_width or new_y >= grid_height:
                 return False
 
             # Check collision with placed blocks
             # Phantom mode allows passing through blocks during placement
-            if new_y >= 0 and self.grid[new_y][new_x] is not None:
+            if new_y >= 0 and grid[new_y][new_x] is not None:
                 if not self.powerup_manager.is_active("phantom_mode"):
                     return False
 
@@ -299,7 +440,7 @@ class TetrisGame:
         """
         if self.current_piece is None:
             return
-        original_shape = [row[:] for row in self.current_piece.shape]
+        original_rotation = self.current_piece.rotation
         self.current_piece.rotate_clockwise()
 
         # Try wall kicks
@@ -311,7 +452,7 @@ class TetrisGame:
                 return
 
         # Rotation failed, restore original shape
-        self.current_piece.shape = original_shape
+        self.current_piece.set_rotation(original_rotation)
 
     def hard_drop(self) -> None:
         """Drop the piece instantly to the bottom and lock it.
@@ -330,9 +471,8 @@ class TetrisGame:
         """
         if self.current_piece is None:
             return
-        drop_distance = 0
-        while self.move_piece(0, 1):
-            drop_distance += 1
+        drop_distance = self.drop_distance(self.current_piece)
+        self.current_piece.y += drop_distance
 
         self.score += drop_distance * self.config.HARD_DROP_BONUS
         self.lock_piece()
@@ -354,10 +494,52 @@ class TetrisGame:
         if self.current_piece is None:
             return None
         ghost = self.current_piece.copy()
-        while self.is_valid_position(ghost, 0, 1):
-            ghost.y += 1
+        ghost.y += self.drop_distance(ghost)
         return ghost
 
+    def grid_rows(self) -> List[int]:
+        """Get the grid as one occupancy bitmask per row (see src.bitboard).
+
+        The masks are rebuilt only when self.grid no longer matches the copy
+        they were built from. Like the settled grid surface, comparing the row
+        lists is a C-level operation that also catches direct edits to
+        self.grid without any explicit invalidation.
+
+        Returns:
+            Row masks, top to bottom; bit x is set when column x is filled.
+            Shared between calls and not to be modified.
+        """
+        if self._grid_rows is None or self.grid != self._grid_rows_grid:
+            self._grid_rows_grid = [row[:] for row in self.grid]
+            self._grid_rows = grid_to_rows(self._grid_rows_grid)
+            self._grid_next_filled = next_filled_rows(self._grid_rows, self.config.GRID_WIDTH)
+        return self._grid_rows
+
+    def drop_distance(self, piece: Tetromino) -> int:
+        """Count the rows a piece can fall straight down from its position.
+
+        Computed per cell from the grid's "next filled row" tables instead of
+        stepping down row by row, with the same rules as is_valid_position:
+        the floor always blocks, placed blocks only outside phantom mode.
+
+        Args:
+            piece: Tetromino to drop (not modified)
+
+        Returns:
+            Number of rows the piece can move down, or 0 if it is off the sides
+        """
+        cells = piece.cells
+        x = piece.x
+        _, min_dx, max_dx = piece_row_masks(cells)
+        if x + min_dx < 0 or x + max_dx >= self.config.GRID_WIDTH:
+            return 0
+        if self.powerup_manager.is_active("phantom_mode"):
+            # Phantom mode passes through placed blocks, down to the floor
+            grid_height: int = self.config.GRID_HEIGHT
+            return grid_height - 1 - piece.y - max(dy for _, dy in cells)
+        self.grid_rows()
+        return fall_distance(self._grid_next_filled, cells, x, piece.y)
+
     def _get_combo_tier_info(self) -> Tuple[str, Tuple[int, int, int]]:
         """Get combo tier text and color based on current combo count.
 
@@ -372,14 +554,9 @@ class TetrisGame:
             - 10+: "LEGENDARY!" (Purple)
         """
         count = self.combo_count
-        if count >= 10:
-            return "LEGENDARY!", self.config.PURPLE
-        if count >= 7:
-            return "BLAZING!", self.config.RED
-        if count >= 4:
-            return "STREAK!", self.config.ORANGE
-        if count >= 2:
-            return "COMBO!", self.config.YELLOW
+        for threshold, text, color in self._combo_tiers:
+            if count >= threshold:
+                return text, color
         return "", self.config.WHITE
 
     def lock_piece(self) -> None:
@@ -412,19 +589,18 @@ class TetrisGame:
             self.powerup_manager.use_powerup("phantom_mode")
 
         # Transfer blocks and power-ups from piece to grid
-        for local_y, row in enumerate(self.current_piece.shape):
-            for local_x, cell in enumerate(row):
-                if cell:
-                    grid_x = self.current_piece.x + local_x
-                    grid_y = self.current_piece.y + local_y
+        piece = self.current_piece
+        for local_x, local_y in piece.cells:
+            grid_x = piece.x + local_x
+            grid_y = piece.y + local_y
 
-                    if grid_y >= 0:
-                        self.grid[grid_y][grid_x] = self.current_piece.color
+            if grid_y >= 0:
+                self.grid[grid_y][grid_x] = piece.color
 
-                        # Transfer power-up if this block has one
-                        if (local_x, local_y) in self.current_piece.powerup_blocks:
-                            powerup_type = self.current_piece.powerup_blocks[(local_x, local_y)]
-                            self.powerup_manager.add_powerup_block(grid_x, grid_y, powerup_type)
+                # Transfer power-up if this block has one
+                if (local_x, local_y) in piece.powerup_blocks:
+                    powerup_type = piece.powerup_blocks[(local_x, local_y)]
+                    self.powerup_manager.add_powerup_block(grid_x, grid_y, powerup_type)
 
         # Reset lock delay timer
         self.lock_delay_timer = 0
@@ -468,11 +644,7 @@ class TetrisGame:
             Lines are not actually removed until finish_clearing_animation()
             is called after the animation completes.
         """
-        lines_to_clear = []
-
-        for y in range(self.config.GRID_HEIGHT):
-            if all(self.grid[y][x] is not None for x in range(self.config.GRID_WIDTH)):
-                lines_to_clear.append(y)
+        lines_to_clear = full_rows(self.grid_rows(), self.config.GRID_WIDTH)
 
         if lines_to_clear:
             # Start animation
@@ -525,11 +697,7 @@ class TetrisGame:
             new_level = self.lines_cleared // self.config.LINES_PER_LEVEL + 1
             if new_level > self.level:
                 self.level = new_level
-                self.fall_speed = max(
-                    self.config.MIN_FALL_SPEED,
-                    self.config.INITIAL_FALL_SPEED
-                    - (self.level - 1) * self.config.LEVEL_SPEED_DECREASE,
-                )
+                self.fall_speed = self.config.fall_speed_for_level(self.level)
 
             # Activate power-ups from cleared lines
             activated_powerups = self.powerup_manager.remove_powerups_in_lines(lines_to_clear)
@@ -554,24 +722,20 @@ class TetrisGame:
 
         Note:
             This is called by LineClearingState when animation completes.
-            Builds a new grid by copying only non-cleared rows, avoiding
-            index shifting issues with deletion. This approach correctly
-            handles any combination of consecutive or non-consecutive lines.
+            Rows are deleted in place from the bottom up, so earlier
+            deletions never shift the index of a row still to be removed.
+            This correctly handles any combination of consecutive or
+            non-consecutive lines.
         """
         if self.clearing_lines:
-            # Create set for O(1) lookup
-            lines_to_clear_set = set(self.clearing_lines)
-            num_lines = len(self.clearing_lines)
-
-            # Build new grid with only non-cleared rows
-            new_grid = []
-            for y in range(self.config.GRID_HEIGHT):
-                if y not in lines_to_clear_set:
-                    new_grid.append(self.grid[y])
+            grid = self.grid
+            lines_to_clear = sorted(set(self.clearing_lines), reverse=True)
+            for y in lines_to_clear:
+                del grid[y]
 
             # Add empty rows at the top
-            empty_rows = [[None for _ in range(self.config.GRID_WIDTH)] for _ in range(num_lines)]
-            self.grid = empty_rows + new_grid
+            width = self.config.GRID_WIDTH
+            grid[:0] = [[None] * width for _ in lines_to_clear]
 
             # Shift power-up blocks down
             self.powerup_manager.shift_powerups_down(self.clearing_lines)
@@ -614,59 +778,84 @@ class TetrisGame:
 
         self.can_hold = False
 
-    def _draw_grid_background(self) -> None:
+    def _draw_grid_background(self, surface: pygame.Surface) -> None:
         """Draw grid background and grid lines.
 
-        Helper method to reduce complexity of draw_grid.
+        Called once at startup to fill the cached background surface.
+
+        Args:
+            surface: Target surface whose (0, 0) is the grid's top-left corner
         """
+        config = self.config
+        block_size = config.BLOCK_SIZE
+        grid_pixel_width = config.GRID_WIDTH * block_size
+        grid_pixel_height = config.GRID_HEIGHT * block_size
+        line_color = config.GRAY
+
         # Draw background
-        grid_rect = pygame.Rect(
-            self.config.GRID_X,
-            self.config.GRID_Y,
-            self.config.GRID_WIDTH * self.config.BLOCK_SIZE,
-            self.config.GRID_HEIGHT * self.config.BLOCK_SIZE,
+        pygame.draw.rect(
+            surface, config.DARK_GRAY, pygame.Rect(0, 0, grid_pixel_width, grid_pixel_height)
         )
-        pygame.draw.rect(self.screen, self.config.DARK_GRAY, grid_rect)
 
         # Draw grid lines
-        for x in range(self.config.GRID_WIDTH + 1):
-            pygame.draw.line(
-                self.screen,
-                self.config.GRAY,
-                (self.config.GRID_X + x * self.config.BLOCK_SIZE, self.config.GRID_Y),
-                (
-                    self.config.GRID_X + x * self.config.BLOCK_SIZE,
-                    self.config.GRID_Y + self.config.GRID_HEIGHT * self.config.BLOCK_SIZE,
-                ),
-            )
+        for x in range(config.GRID_WIDTH + 1):
+            line_x = x * block_size
+            pygame.draw.line(surface, line_color, (line_x, 0), (line_x, grid_pixel_height))
 
-        for y in range(self.config.GRID_HEIGHT + 1):
-            pygame.draw.line(
-                self.screen,
-                self.config.GRAY,
-                (self.config.GRID_X, self.config.GRID_Y + y * self.config.BLOCK_SIZE),
-                (
-                    self.config.GRID_X + self.config.GRID_WIDTH * self.config.BLOCK_SIZE,
-                    self.config.GRID_Y + y * self.config.BLOCK_SIZE,
-                ),
-            )
+        for y in range(config.GRID_HEIGHT + 1):
+            line_y = y * block_size
+            pygame.draw.line(surface, line_color, (0, line_y), (grid_pixel_width, line_y))
 
-    def _draw_placed_blocks(self) -> None:
+    def _draw_placed_blocks(self, surface: pygame.Surface) -> None:
         """Draw blocks that have been locked into the grid.
 
-        Includes power-up glow effects for charged blocks.
-        Helper method to reduce complexity of draw_grid.
+        Helper method to reduce complexity of draw_grid. All block tiles go
+        through a single blits call. Power-up glows are animated, so they are
+        drawn separately every frame.
+
+        Args:
+            surface: Target surface whose (0, 0) is the grid's top-left corner
         """
-        for y in range(self.config.GRID_HEIGHT):
-            for x in range(self.config.GRID_WIDTH):
-                color = self.grid[y][x]
-                if color is not None:
-                    self.draw_block(x, y, color)
+        block_size = self.config.BLOCK_SIZE
+        get_block_tile = self._get_block_tile
 
-                    # Draw power-up glow effect if this is a power-up block
-                    powerup_type = self.powerup_manager.get_powerup_at(x, y)
-                    if powerup_type:
-                        self._draw_powerup_glow(x, y, powerup_type)
+        surface.blits(
+            [
+                (get_block_tile(color), (x * block_size + 1, y * block_size + 1))
+                for y, row in enumerate(self.grid)
+                if any(row)
+                for x, color in enumerate(row)
+                if color is not None
+            ],
+            doreturn=False,
+        )
+
+    def _draw_settled_grid(self) -> None:
+        """Draw the background, grid lines and locked blocks from a cached surface.
+
+        The cache is rebuilt whenever self.grid no longer matches the snapshot it
+        was drawn from. Comparing the row lists is a C-level operation, and it
+        also catches direct edits to self.grid (rising lines, tests) without any
+        explicit invalidation.
+        """
+        if self._grid_surface is None or self.grid != self._grid_surface_rows:
+            if self._grid_surface is None:
+                self._grid_surface = self._grid_background.copy()
+            else:
+                self._grid_surface.blit(self._grid_background, (0, 0))
+            self._draw_placed_blocks(self._grid_surface)
+            self._grid_surface_rows = [row[:] for row in self.grid]
+
+        self.screen.blit(self._grid_surface, (self.config.GRID_X, self.config.GRID_Y))
+
+    def _draw_placed_powerup_glows(self) -> None:
+        """Draw the animated glow of power-up blocks locked into the grid."""
+        grid = self.grid
+        glowing = set()
+        for x, y, powerup_type in self.powerup_manager.powerup_blocks:
+            if (x, y) not in glowing and grid[y][x] is not None:
+                glowing.add((x, y))
+                self._draw_powerup_glow(x, y, powerup_type)
 
     def _draw_clearing_animation(self) -> None:
         """Draw line clearing animation effect.
@@ -679,19 +868,18 @@ class TetrisGame:
         progress = self.clear_animation_time / self.clear_animation_duration
         alpha = int(255 * (1 - progress))
 
-        for y in self.clearing_lines:
-            for x in range(self.config.GRID_WIDTH):
-                rect = pygame.Rect(
-                    self.config.GRID_X + x * self.config.BLOCK_SIZE + 1,
-                    self.config.GRID_Y + y * self.config.BLOCK_SIZE + 1,
-                    self.config.BLOCK_SIZE - 2,
-                    self.config.BLOCK_SIZE - 2,
-                )
-                # Create a surface with alpha for fade effect
-                surf = pygame.Surface((self.config.BLOCK_SIZE - 2, self.config.BLOCK_SIZE - 2))
-                surf.set_alpha(alpha)
-                surf.fill(self.config.WHITE)
-                self.screen.blit(surf, (rect.x, rect.y))
+        config = self.config
+        block_size = config.BLOCK_SIZE
+        left = config.GRID_X + 1
+        grid_y = config.GRID_Y
+
+        # One blit per cleared row; the flash surface spans all of its cells
+        flash = self._clear_flash_surface
+        flash.set_alpha(alpha)
+        self.screen.blits(
+            [(flash, (left, grid_y + y * block_size + 1)) for y in self.clearing_lines],
+            doreturn=False,
+        )
 
     def _draw_ghost_piece(self) -> None:
         """Draw ghost piece showing landing position.
@@ -703,15 +891,19 @@ class TetrisGame:
 
         ghost = self.get_ghost_piece()
         if ghost:
+            block_size = self.config.BLOCK_SIZE
+            grid_x = self.config.GRID_X
+            grid_y = self.config.GRID_Y
+            color = _block_colors(self.current_piece.color)[0]
             for x, y in ghost.get_blocks():
                 if y >= 0:
                     rect = pygame.Rect(
-                        self.config.GRID_X + x * self.config.BLOCK_SIZE + 2,
-                        self.config.GRID_Y + y * self.config.BLOCK_SIZE + 2,
-                        self.config.BLOCK_SIZE - 4,
-                        self.config.BLOCK_SIZE - 4,
+                        grid_x + x * block_size + 2,
+                        grid_y + y * block_size + 2,
+                        block_size - 4,
+                        block_size - 4,
                     )
-                    pygame.draw.rect(self.screen, self.current_piece.color, rect, 2)
+                    pygame.draw.rect(self.screen, color, rect, 2)
 
     def _draw_current_piece(self) -> None:
         """Draw the currently falling piece.
@@ -719,21 +911,121 @@ class TetrisGame:
         Helper method to reduce complexity of draw_grid.
         Also draws power-up glow effects for any blocks with power-ups.
         """
-        if self.current_piece:
-            # Draw each block
-            for local_y, row in enumerate(self.current_piece.shape):
-                for local_x, cell in enumerate(row):
-                    if cell:
-                        grid_x = self.current_piece.x + local_x
-                        grid_y = self.current_piece.y + local_y
+        piece = self.current_piece
+        if piece:
+            config = self.config
+            block_size = config.BLOCK_SIZE
+            position = (config.GRID_X + piece.x * block_size, config.GRID_Y + piece.y * block_size)
+            sprite = self._get_piece_sprite(piece.color, piece.cells)
+
+            if piece.y < 0:
+                # Rows above the grid are hidden while the piece spawns
+                self.screen.set_clip(
+                    pygame.Rect(
+                        config.GRID_X,
+                        config.GRID_Y,
+                        config.GRID_WIDTH * block_size,
+                        config.GRID_HEIGHT * block_size,
+                    )
+                )
+                self.screen.blit(sprite, position)
+                self.screen.set_clip(None)
+            else:
+                self.screen.blit(sprite, position)
+
+            # Draw power-up glow for blocks that carry a power-up
+            for (local_x, local_y), powerup_type in piece.powerup_blocks.items():
+                grid_y = piece.y + local_y
+                if grid_y >= 0:
+                    self._draw_powerup_glow(piece.x + local_x, grid_y, powerup_type)
+
+    def _get_piece_sprite(self, color: Tuple[int, int, int], cells: Cells) -> pygame.Surface:
+        """Get the pre-rendered sprite for a piece layout, drawing it on first use.
+
+        Args:
+            color: Block color of the piece
+            cells: Filled (col, row) offsets of the piece in its current rotation
+
+        Returns:
+            Surface with every block drawn and transparent gaps, origin at the
+            shape's (0, 0)
+        """
+        key = (color, cells)
+        sprite = self._piece_sprites.get(key)
+        if sprite is None:
+            block_size = self.config.BLOCK_SIZE
+            width = max(dx for dx, _ in cells) + 1
+            height = max(dy for _, dy in cells) + 1
+            size = (width * block_size, height * block_size)
+            sprite = self._new_sprite_surface(size)
+            tile = self._get_block_tile(color)
+            for dx, dy in cells:
+                sprite.blit(tile, (dx * block_size + 1, dy * block_size + 1))
+            self._piece_sprites[key] = sprite
+        return sprite
+
+    def _get_block_tile(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get the pre-rendered tile of a single block, drawing it on first use.
+
+        Args:
+            color: RGB color tuple of the block
+
+        Returns:
+            Surface with the block drawn at (0, 0); pixels the block does not
+            cover are transparent
+        """
+        tile = self._block_tiles.get(color)
+        if tile is None:
+            # The highlight lines reach one pixel past the block's fill
+            size = self.config.BLOCK_SIZE - 1
+            tile = self._new_sprite_surface((size, size))
+            self._render_block(tile, 0, 0, color)
+            self._block_tiles[color] = tile
+        return tile
+
+    def _new_sprite_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Create a blank, fully transparent surface for a cached block sprite.
 
-                        if grid_y >= 0:
-                            self.draw_block(grid_x, grid_y, self.current_piece.color)
+        Args:
+            size: Width and height in pixels
+
+        Returns:
+            Surface in the display's pixel format, color-keyed or with per-pixel
+            alpha depending on USE_ALPHA_BLOCKS
+        """
+        if self.config.USE_ALPHA_BLOCKS:
+            sprite = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            sprite.fill((0, 0, 0, 0))
+        else:
+            # Opaque surface in the display's pixel format with the gaps keyed out
+            sprite = pygame.Surface(size).convert()
+            sprite.fill(SPRITE_COLORKEY)
+            sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return sprite
+
+    def get_overlay(self, height: int, alpha: int) -> pygame.Surface:
+        """Get a full-width translucent black overlay, filling it on first use.
+
+        The overlay carries per-pixel alpha in the display's pixel format,
+        so blitting it every frame takes SDL's fast alpha blitter rather
+        than a format conversion or the surface-alpha path.
+
+        Args:
+            height: Overlay height in pixels
+            alpha: Overlay opacity (0-255)
 
-                            # Draw power-up glow if this block has a power-up
-                            if (local_x, local_y) in self.current_piece.powerup_blocks:
-                                powerup_type = self.current_piece.powerup_blocks[(local_x, local_y)]
-                                self._draw_powerup_glow(grid_x, grid_y, powerup_type)
+        Returns:
+            Cached overlay surface to blit at the top of the screen
+        """
+        key = (height, alpha)
+        overlay = self._overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(
+                (self.config.SCREEN_WIDTH, height), pygame.SRCALPHA
+            ).convert_alpha()
+            overlay.fill((*self.config.BLACK, alpha))
+            self._overlays[key] = overlay
+        return overlay
 
     def _draw_powerup_glow(self, x: int, y: int, powerup_type: str) -> None:
         """Draw animated rainbow gradient glow effect around a power-up block.
@@ -749,22 +1041,14 @@ class TetrisGame:
         # Calculate pulsing alpha and rainbow hue based on time
         time_ms = pygame.time.get_ticks()
         pulse_speed = self.config.POWER_UP_GLOW_ANIMATION_SPEED
-        pulse = (1 + pygame.math.Vector2(1, 0).rotate(time_ms * pulse_speed / 10).x) / 2
-        alpha = int(100 + 155 * pulse)
+        alpha = PULSE_ALPHAS[int(time_ms * pulse_speed / 10) % 360]
 
-        # Rainbow gradient effect - cycle through hues
-        hue = (time_ms / 20 + x * 30 + y * 30) % 360  # Creates moving rainbow pattern
+        # Rainbow gradient effect - cycle through hues, offset per cell for a moving pattern
+        rainbow_color = RAINBOW_COLORS[int(time_ms / 20 + x * 30 + y * 30) % 360]
 
-        # Convert HSV to RGB for rainbow effect
-        import colorsys
-
-        r, g, b = colorsys.hsv_to_rgb(hue / 360.0, 1.0, 1.0)
-        rainbow_color = (int(r * 255), int(g * 255), int(b * 255))
-
-        # Create glow surface with rainbow gradient
-        glow_surface = pygame.Surface(
-            (self.config.BLOCK_SIZE - 2, self.config.BLOCK_SIZE - 2), pygame.SRCALPHA
-        )
+        # Clear the shared glow surface for the rainbow gradient
+        glow_surface = self._glow_surface
+        glow_surface.fill((0, 0, 0, 0))
 
         # Draw rainbow border glow with multiple layers for gradient effect
         for layer in range(3):
@@ -796,22 +1080,14 @@ class TetrisGame:
         # Calculate pulsing alpha and rainbow hue based on time
         time_ms = pygame.time.get_ticks()
         pulse_speed = self.config.POWER_UP_GLOW_ANIMATION_SPEED
-        pulse = (1 + pygame.math.Vector2(1, 0).rotate(time_ms * pulse_speed / 10).x) / 2
-        alpha = int(100 + 155 * pulse)
+        alpha = PULSE_ALPHAS[int(time_ms * pulse_speed / 10) % 360]
 
         # Rainbow gradient effect
-        hue = (time_ms / 20) % 360
-
-        # Convert HSV to RGB for rainbow effect
-        import colorsys
+        rainbow_color = RAINBOW_COLORS[int(time_ms / 20) % 360]
 
-        r, g, b = colorsys.hsv_to_rgb(hue / 360.0, 1.0, 1.0)
-        rainbow_color = (int(r * 255), int(g * 255), int(b * 255))
-
-        # Create glow surface
-        glow_surface = pygame.Surface(
-            (self.config.BLOCK_SIZE - 2, self.config.BLOCK_SIZE - 2), pygame.SRCALPHA
-        )
+        # Clear the shared glow surface
+        glow_surface = self._glow_surface
+        glow_surface.fill((0, 0, 0, 0))
 
         # Draw rainbow border glow
         for layer in range(2):  # Fewer layers for preview
@@ -846,8 +1122,8 @@ class TetrisGame:
             All positions are converted from grid space to screen space
             using GRID_X, GRID_Y, and BLOCK_SIZE offsets.
         """
-        self._draw_grid_background()
-        self._draw_placed_blocks()
+        self._draw_settled_grid()
+        self._draw_placed_powerup_glows()
         self._draw_clearing_animation()
         self._draw_ghost_piece()
         self._draw_current_piece()
@@ -870,18 +1146,32 @@ class TetrisGame:
             Coordinates are in grid space and are automatically converted
             to screen space. 1-pixel border is inset from grid lines.
         """
-        rect = pygame.Rect(
-            self.config.GRID_X + x * self.config.BLOCK_SIZE + 1,
-            self.config.GRID_Y + y * self.config.BLOCK_SIZE + 1,
-            self.config.BLOCK_SIZE - 2,
-            self.config.BLOCK_SIZE - 2,
+        config = self.config
+        block_size = config.BLOCK_SIZE
+        self.screen.blit(
+            self._get_block_tile(color),
+            (config.GRID_X + x * block_size + 1, config.GRID_Y + y * block_size + 1),
         )
-        pygame.draw.rect(self.screen, color, rect)
+
+    def _render_block(
+        self, surface: pygame.Surface, left: int, top: int, color: Tuple[int, int, int]
+    ) -> None:
+        """Render one block with 3D highlighting at a pixel position.
+
+        Args:
+            surface: Surface to draw on
+            left: Pixel x of the block's top-left corner (inside the grid line)
+            top: Pixel y of the block's top-left corner (inside the grid line)
+            color: RGB color tuple of the block
+        """
+        block_size = self.config.BLOCK_SIZE
+        fill, highlight = _block_colors(color)
+        rect = pygame.Rect(left, top, block_size - 2, block_size - 2)
+        pygame.draw.rect(surface, fill, rect)
 
         # Add highlight for 3D effect
-        highlight = tuple(min(c + 40, 255) for c in color)
-        pygame.draw.line(self.screen, highlight, (rect.left, rect.top), (rect.right, rect.top), 2)
-        pygame.draw.line(self.screen, highlight, (rect.left, rect.top), (rect.left, rect.bottom), 2)
+        pygame.draw.line(surface, highlight, (left, top), (rect.right, top), 2)
+        pygame.draw.line(surface, highlight, (left, top), (left, rect.bottom), 2)
 
     def draw_piece_preview(self, piece: Optional[Tetromino], x: int, y: int, title: str) -> None:
         """Draw a piece preview box for next or hold piece.
@@ -904,7 +1194,7 @@ class TetrisGame:
             Piece is centered within 120x100 pixel box.
         """
         # Draw title
-        title_text = self.small_font.render(title, True, self.config.WHITE)
+        title_text = render_text(self.small_font, title, self.config.WHITE)
         self.screen.blit(title_text, (x, y - 30))
 
         # Draw box
@@ -914,26 +1204,21 @@ class TetrisGame:
 
         # Draw piece centered in box
         if piece:
-            offset_x = x + 60 - len(piece.shape[0]) * self.config.BLOCK_SIZE // 2
-            offset_y = y + 50 - len(piece.shape) * self.config.BLOCK_SIZE // 2
-
-            for row_idx, row in enumerate(piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        rect = pygame.Rect(
-                            offset_x + col_idx * self.config.BLOCK_SIZE,
-                            offset_y + row_idx * self.config.BLOCK_SIZE,
-                            self.config.BLOCK_SIZE - 2,
-                            self.config.BLOCK_SIZE - 2,
-                        )
-                        pygame.draw.rect(self.screen, piece.color, rect)
-
-                        # Draw power-up glow if this block has a power-up
-                        if (col_idx, row_idx) in piece.powerup_blocks:
-                            self._draw_preview_powerup_glow(
-                                offset_x + col_idx * self.config.BLOCK_SIZE,
-                                offset_y + row_idx * self.config.BLOCK_SIZE,
-                            )
+            block_size = self.config.BLOCK_SIZE
+            width, height = piece.bounds
+            offset_x = x + 60 - width * block_size // 2
+            offset_y = y + 50 - height * block_size // 2
+
+            fill = _block_colors(piece.color)[0]
+            for col_idx, row_idx in piece.cells:
+                block_x = offset_x + col_idx * block_size
+                block_y = offset_y + row_idx * block_size
+                rect = pygame.Rect(block_x, block_y, block_size - 2, block_size - 2)
+                pygame.draw.rect(self.screen, fill, rect)
+
+                # Draw power-up glow if this block has a power-up
+                if (col_idx, row_idx) in piece.powerup_blocks:
+                    self._draw_preview_powerup_glow(block_x, block_y)
 
     def draw_ui(self) -> None:
         """Draw the user interface elements.
@@ -949,15 +1234,15 @@ class TetrisGame:
             Draws text and preview boxes to self.screen
         """
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, self.config.WHITE)
+        score_text = render_text(self.font, f"Score: {self.score}", self.config.WHITE)
         self.screen.blit(score_text, (50, 100))
 
         # Level
-        level_text = self.font.render(f"Level: {self.level}", True, self.config.WHITE)
+        level_text = render_text(self.font, f"Level: {self.level}", self.config.WHITE)
         self.screen.blit(level_text, (50, 150))
 
         # Lines
-        lines_text = self.font.render(f"Lines: {self.lines_cleared}", True, self.config.WHITE)
+        lines_text = render_text(self.font, f"Lines: {self.lines_cleared}", self.config.WHITE)
         self.screen.blit(lines_text, (50, 200))
 
         # Combo display with animation
@@ -998,7 +1283,9 @@ class TetrisGame:
 
             # Render combo text with scaling
             font_size = int(self.config.COMBO_BASE_FONT_SIZE * scale)
-            combo_font = pygame.font.Font(None, font_size)
+            combo_font = self._combo_fonts.get(font_size)
+            if combo_font is None:
+                combo_font = self._combo_fonts[font_size] = pygame.font.Font(None, font_size)
             combo_surface = combo_font.render(self.combo_text, True, tier_color)
             combo_surface.set_alpha(alpha)
 
@@ -1045,7 +1332,7 @@ class TetrisGame:
         )
 
         for i, control in enumerate(controls):
-            control_text = self.small_font.render(control, True, self.config.WHITE)
+            control_text = render_text(self.small_font, control, self.config.WHITE)
             self.screen.blit(control_text, (50, 400 + i * 30))
 
         # Draw rising lines UI elements
@@ -1063,13 +1350,13 @@ class TetrisGame:
             return
 
         # Title
-        title_text = self.small_font.render("POWER-UPS", True, self.config.WHITE)
+        title_text = render_text(self.small_font, "POWER-UPS", self.config.WHITE)
         self.screen.blit(title_text, (580, 380))
 
         # Draw each active power-up
         y_pos = 410
         for _, display_text, color in active_powerups:
-            powerup_text = self.small_font.render(display_text, True, color)
+            powerup_text = render_text(self.small_font, display_text, color)
             self.screen.blit(powerup_text, (580, y_pos))
             y_pos += 25
 
@@ -1118,21 +1405,30 @@ class TetrisGame:
         # Find the bottom-most non-empty line
         bottom_line = None
         for y in range(self.config.GRID_HEIGHT - 1, -1, -1):
-            if any(self.grid[y][x] is not None for x in range(self.config.GRID_WIDTH)):
+            row = self.grid[y]
+            if row.count(None) != len(row):
                 bottom_line = y
                 break
 
         if bottom_line is not None:
-            # Remove power-ups in this line
-            self.powerup_manager.remove_powerups_in_lines([bottom_line])
-
             # Remove the line
             self.grid.pop(bottom_line)
             # Add empty line at top
             self.grid.insert(0, [None for _ in range(self.config.GRID_WIDTH)])
 
-            # Shift remaining power-ups down
-            self.powerup_manager.shift_powerups_down([bottom_line])
+            # Remove power-ups in this line and shift the remaining ones down
+            self.powerup_manager.clear_and_shift([bottom_line])
+
+    def get_effective_fall_speed(self) -> int:
+        """Get the time between automatic falls, including power-up effects.
+
+        Returns:
+            fall_speed in milliseconds, doubled (50% slower falling) while the
+            time dilator power-up is active
+        """
+        if "time_dilator" in self.powerup_manager.active_powerups:
+            return self.fall_speed * 2
+        return self.fall_speed
 
     def calculate_rising_interval(self) -> int:
         """Calculate the rising line interval based on current level and mode.
@@ -1156,11 +1452,7 @@ class TetrisGame:
             return self.config.RISING_SURVIVAL_INTERVAL
 
         # Pressure mode: decrease interval with level
-        interval = (
-            self.config.RISING_INITIAL_INTERVAL
-            - (self.level - 1) * self.config.RISING_INTERVAL_DECREASE
-        )
-        return max(interval, self.config.RISING_MIN_INTERVAL)
+        return self.config.rising_interval_for_level(self.level)
 
     def _generate_rising_line(self) -> List[Optional[Tuple[int, int, int]]]:
         """Generate a rising line with random holes.
@@ -1194,7 +1486,8 @@ class TetrisGame:
             push them out of bounds.
         """
         # Check if top row has any blocks
-        return any(self.grid[0][x] is not None for x in range(self.config.GRID_WIDTH))
+        top_row = self.grid[0]
+        return top_row.count(None) != len(top_row)
 
     def trigger_rising_line(self) -> None:
         """Trigger a rising line event.
@@ -1231,13 +1524,8 @@ class TetrisGame:
         if self.current_piece:
             self.current_piece.y -= 1
 
-        # Shift power-ups up
-        # Note: Power-ups in the top row are lost
-        new_powerup_blocks = []
-        for x, y, powerup_type in self.powerup_manager.powerup_blocks:
-            if y > 0:  # Only keep blocks that aren't pushed off the top
-                new_powerup_blocks.append((x, y - 1, powerup_type))
-        self.powerup_manager.powerup_blocks = new_powerup_blocks
+        # Shift power-ups up (those in the top row are lost)
+        self.powerup_manager.shift_powerups_up()
 
         # Start animation
         self.rising_animation_active = True
@@ -1346,15 +1634,15 @@ class TetrisGame:
                     self.screen, self.config.GRAY, (bar_x, bar_y, fill_width, bar_height)
                 )
 
-                label = self.small_font.render(
-                    "Manual Rise (R) - Cooldown", True, self.config.WHITE
+                label = render_text(
+                    self.small_font, "Manual Rise (R) - Cooldown", self.config.WHITE
                 )
             else:
                 # Ready to use
                 pygame.draw.rect(
                     self.screen, self.config.GREEN, (bar_x, bar_y, bar_width, bar_height)
                 )
-                label = self.small_font.render("Manual Rise (R) - Ready!", True, self.config.WHITE)
+                label = render_text(self.small_font, "Manual Rise (R) - Ready!", self.config.WHITE)
         else:
             # Show time until next rise
             progress = self.rising_timer / self.rising_interval
@@ -1367,8 +1655,8 @@ class TetrisGame:
             # Label
             mode_name = "PRESSURE" if self.config.RISING_MODE == "pressure" else "SURVIVAL"
             time_left = max(0, self.rising_interval - self.rising_timer) / 1000
-            label = self.small_font.render(
-                f"{mode_name} - Next Rise: {time_left:.1f}s", True, self.config.WHITE
+            label = render_text(
+                self.small_font, f"{mode_name} - Next Rise: {time_left:.1f}s", self.config.WHITE
             )
 
         # Draw label above bar
@@ -1388,21 +1676,20 @@ class TetrisGame:
 
         # Pulsing effect
         time_ms = pygame.time.get_ticks()
-        pulse = (1 + pygame.math.Vector2(1, 0).rotate(time_ms / 5).x) / 2
-        alpha = int(100 + 155 * pulse)
+        alpha = PULSE_ALPHAS[time_ms // 5 % 360]
 
         # Draw warning bar at bottom of grid
-        warning_height = 5
-        warning_rect = pygame.Rect(
-            self.config.GRID_X,
-            self.config.GRID_Y + self.config.GRID_HEIGHT * self.config.BLOCK_SIZE - warning_height,
-            self.config.GRID_WIDTH * self.config.BLOCK_SIZE,
-            warning_height,
-        )
-
-        warning_surface = pygame.Surface((warning_rect.width, warning_rect.height), pygame.SRCALPHA)
+        warning_surface = self._warning_surface
         warning_surface.fill((*self.config.RED, alpha))
-        self.screen.blit(warning_surface, (warning_rect.x, warning_rect.y))
+        self.screen.blit(
+            warning_surface,
+            (
+                self.config.GRID_X,
+                self.config.GRID_Y
+                + self.config.GRID_HEIGHT * self.config.BLOCK_SIZE
+                - warning_surface.get_height(),
+            ),
+        )
 
     def reset_game(self) -> None:
         """Reset the game to initial state.
@@ -1451,14 +1738,14 @@ class TetrisGame:
         self.next_piece = self.get_random_piece()
         self.hold_piece = None
         self.can_hold = True
-        self.state = PlayingState()
+        self.state = PLAYING_STATE
         self.spawn_new_piece()
 
     def handle_input(self, event: pygame.event.Event) -> None:
         """Handle keyboard input by delegating to current state.
 
         Args:
-            event: Pygame event to process (should be KEYDOWN event)
+            event: Pygame event to process (only KEYDOWN events are handled)
 
         Side effects:
             Delegates to self.state.handle_input() which may modify game state
@@ -1517,6 +1804,9 @@ class TetrisGame:
         # Delegate state-specific drawing to current state
         self.state.draw(self)
 
+        # Present the whole frame: the glows, warning bar, combo text and
+        # power-up timers change somewhere on screen nearly every frame, and the
+        # state overlays cover all of it, so dirty rects would rarely be small
         pygame.display.flip()
 
     def run(self) -> None:
@@ -1535,26 +1825,36 @@ class TetrisGame:
             QUIT event: Exits game loop
             KEYDOWN ESC: Exits game loop
             Other KEYDOWN: Delegates to handle_input()
+            IGNORED_EVENT_TYPES: Blocked, so SDL never queues them
+            Other types: Dropped from the queue without being processed
         """
         running = True
 
+        # Keep high-rate input the game ignores (mouse motion, key releases, ...)
+        # out of the queue instead of iterating over it in Python every frame
+        pygame.event.set_blocked(IGNORED_EVENT_TYPES)
+
         while running:
             delta_time = self.clock.tick(60)
 
-            for event in pygame.event.get():
+            # Dequeue the handled events in one batch and discard the rest,
+            # so leftovers neither reach Python nor fill up the queue
+            events = pygame.event.get(HANDLED_EVENT_TYPES)
+            pygame.event.clear(pump=False)
+
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        # Only quit from PlayingState, DemoState, or GameOverState
-                        # ConfigMenuState and PausedState should handle ESC themselves
-                        if isinstance(self.state, (PlayingState, DemoState, GameOverState)):
-                            running = False
-                        else:
-                            # Let the state handle ESC (ConfigMenuState, PausedState)
-                            self.handle_input(event)
+                elif event.key == pygame.K_ESCAPE:
+                    # Only quit from PlayingState, DemoState, or GameOverState
+                    # ConfigMenuState and PausedState should handle ESC themselves
+                    if isinstance(self.state, (PlayingState, DemoState, GameOverState)):
+                        running = False
                     else:
+                        # Let the state handle ESC (ConfigMenuState, PausedState)
                         self.handle_input(event)
+                else:
+                    self.handle_input(event)
 
             self.update(delta_time)
             self.draw()
@@ -2,9 +2,17 @@
 Tetromino (Tetris piece) class and related functionality.
 """
 
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
-from src.config import GameConfig
+from src.config import (
+    SHAPE_BOUNDS,
+    SHAPE_CELLS,
+    SHAPE_ROTATIONS,
+    Cells,
+    GameConfig,
+    shape_cells,
+    shape_rotations,
+)
 
 
 class Tetromino:
@@ -16,7 +24,11 @@ class Tetromino:
 
     Attributes:
         type: Shape type identifier ("I", "O", "T", "S", "Z", "J", "L")
-        shape: 2D list representing the piece's block pattern
+        shape: 2D matrix representing the piece's block pattern (shared, immutable
+               when taken from the rotation tables)
+        cells: Filled (col, row) offsets of shape, kept in sync when shape changes
+        bounds: (width, height) of shape, kept in sync when shape changes
+        rotation: Number of clockwise quarter turns from the spawn orientation (0-3)
         color: RGB color tuple for rendering
         x: Grid column position (grid space, not screen pixels)
         y: Grid row position (grid space, not screen pixels)
@@ -43,44 +55,100 @@ class Tetromino:
         if config is None:
             config = GameConfig
         self.type = shape_type
-        self.shape = [row[:] for row in config.SHAPES[shape_type]]
+        if config.SHAPES is GameConfig.SHAPES:
+            self._rotations = SHAPE_ROTATIONS[shape_type]
+            self._rotation_cells = SHAPE_CELLS[shape_type]
+            self._rotation_bounds = SHAPE_BOUNDS[shape_type]
+        else:
+            # Custom shape set: build this piece's tables on the spot
+            self._build_rotation_tables(config.SHAPES[shape_type])
+        self.set_rotation(0)
         self.color = config.COLORS[shape_type]
-        self.x = config.GRID_WIDTH // 2 - len(self.shape[0]) // 2
+        self.x = config.GRID_WIDTH // 2 - self._rotation_bounds[0][0] // 2
         self.y = 0
         self.config = config
         # Power-up blocks: dict mapping (local_x, local_y) to powerup_type
         # Local coordinates are relative to the shape, not grid position
         self.powerup_blocks = {}
 
+    @property
+    def shape(self) -> Sequence[Sequence[int]]:
+        """2D matrix representing the piece's block pattern."""
+        return self._shape
+
+    @shape.setter
+    def shape(self, value: Sequence[Sequence[int]]) -> None:
+        # The assigned matrix becomes this piece's spawn orientation, so rotating
+        # turns it rather than the shape type's built-in pattern
+        self._build_rotation_tables(value)
+        self.set_rotation(0)
+        self._shape = value
+
+    def _build_rotation_tables(self, shape: Sequence[Sequence[int]]) -> None:
+        """Precompute this piece's rotations, cell offsets and bounds from a matrix.
+
+        Args:
+            shape: 2D pattern of the orientation to use as rotation 0
+        """
+        self._rotations = shape_rotations(shape)
+        # Collision and drawing only care about filled blocks, so keep their
+        # offsets precomputed instead of scanning the matrix every time
+        self._rotation_cells = tuple(shape_cells(matrix) for matrix in self._rotations)
+        self._rotation_bounds = tuple((len(matrix[0]), len(matrix)) for matrix in self._rotations)
+
+    def set_rotation(self, rotation: int) -> None:
+        """Switch the piece to a rotation from its precomputed tables.
+
+        Args:
+            rotation: Clockwise quarter turns from the spawn orientation (taken modulo 4)
+
+        Side effects:
+            Updates self.shape, self.cells, self.bounds and self.rotation
+        """
+        rotation %= 4
+        self._shape = self._rotations[rotation]
+        self.cells: Cells = self._rotation_cells[rotation]
+        self.bounds: Tuple[int, int] = self._rotation_bounds[rotation]
+        self.rotation = rotation
+
+    def rotated_cells(self, turns: int) -> Cells:
+        """Get the filled-cell offsets after extra clockwise turns, without rotating.
+
+        Args:
+            turns: Clockwise quarter turns from the current rotation
+
+        Returns:
+            Precomputed (col, row) offsets of that orientation
+        """
+        return self._rotation_cells[(self.rotation + turns) % 4]
+
     def rotate_clockwise(self) -> None:
         """Rotate the piece 90 degrees clockwise.
 
-        Performs matrix transposition and row reversal to achieve
-        clockwise rotation. Modifies the shape in place.
+        Looks up the next orientation in the precomputed rotation tables.
 
         Side effects:
-            Updates self.shape with the rotated pattern
+            Updates self.shape, self.cells and self.rotation
 
         Note:
             Does not check for collision - use TetrisGame.rotate_piece()
             which includes wall kick logic.
         """
-        self.shape = [list(row) for row in zip(*self.shape[::-1])]
+        self.set_rotation(self.rotation + 1)
 
     def rotate_counterclockwise(self) -> None:
         """Rotate the piece 90 degrees counterclockwise.
 
-        Performs matrix transposition and column reversal to achieve
-        counterclockwise rotation. Modifies the shape in place.
+        Looks up the previous orientation in the precomputed rotation tables.
 
         Side effects:
-            Updates self.shape with the rotated pattern
+            Updates self.shape, self.cells and self.rotation
 
         Note:
             Currently unused in gameplay (only clockwise rotation is used)
             but provided for completeness.
         """
-        self.shape = [list(row) for row in zip(*self.shape)][::-1]
+        self.set_rotation(self.rotation - 1)
 
     def get_blocks(self) -> List[Tuple[int, int]]:
         """Get list of block positions for this piece.
@@ -96,12 +164,9 @@ class Tetromino:
             Coordinates are in grid space (0 to GRID_WIDTH-1, 0 to GRID_HEIGHT-1).
             Blocks may have negative y values when piece spawns above grid.
         """
-        blocks = []
-        for y, row in enumerate(self.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    blocks.append((self.x + x, self.y + y))
-        return blocks
+        x = self.x
+        y = self.y
+        return [(x + dx, y + dy) for dx, dy in self.cells]
 
     def copy(self) -> "Tetromino":
         """Create a deep copy of this tetromino.
@@ -113,11 +178,17 @@ class Tetromino:
             New Tetromino instance with same type, shape, position, and config
 
         Note:
-            Shape is deep copied so modifications to the copy won't
-            affect the original. Power-up blocks are also copied.
+            Rotation tables are immutable and shared, including those built
+            from a shape assigned directly; that assigned matrix itself is
+            deep copied. Power-up blocks are also copied.
         """
         new_piece = Tetromino(self.type, self.config)
-        new_piece.shape = [row[:] for row in self.shape]
+        new_piece._rotations = self._rotations
+        new_piece._rotation_cells = self._rotation_cells
+        new_piece._rotation_bounds = self._rotation_bounds
+        new_piece.set_rotation(self.rotation)
+        if self._shape is not self._rotations[self.rotation]:
+            new_piece._shape = [list(row) for row in self._shape]
         new_piece.x = self.x
         new_piece.y = self.y
         new_piece.powerup_blocks = dict(self.powerup_blocks)  # Copy powerup blocks
@@ -0,0 +1,236 @@
+"""
+Test suite for the row-bitmask board kernels
+"""
+
+import random
+from typing import Sequence
+
+from src.bitboard import (
+    PieceMasks,
+    _popcount_fallback,
+    count_cells,
+    count_near_full_rows,
+    fall_distance,
+    full_rows,
+    grid_to_rows,
+    landing_row,
+    next_filled_rows,
+    pack_board,
+    piece_fits,
+    piece_row_masks,
+    place_piece,
+    popcount,
+    rows_to_columns,
+)
+from src.config import SHAPE_CELLS, GameConfig
+
+WIDTH = GameConfig.GRID_WIDTH
+HEIGHT = GameConfig.GRID_HEIGHT
+FILLED = (255, 0, 0)
+
+
+def empty_grid() -> list:
+    """Create an empty grid of the default size."""
+    return [[None] * WIDTH for _ in range(HEIGHT)]
+
+
+def drop_row(rows: Sequence[int], masks: PieceMasks, x: int, width: int) -> int:
+    """Reference drop: step a piece down from row 0 in column x until it rests.
+
+    Matches the step-by-step drop of the game: the piece moves down while the
+    next row fits, then the resting position itself must fit.
+
+    Args:
+        rows: Board row masks
+        masks: Piece footprint from piece_row_masks
+        x: Piece column
+        width: Board width in columns
+
+    Returns:
+        Landing row of the piece, or -1 if it cannot be placed in this column
+    """
+    row_masks, min_dx, max_dx = masks
+    if x + min_dx < 0 or x + max_dx >= width:
+        return -1
+    shifted = [(dy, mask << x) for dy, mask in row_masks]
+    height = len(rows)
+
+    y = 0
+    while True:
+        below = y + 1
+        for dy, mask in shifted:
+            row = below + dy
+            if row >= height or (row >= 0 and rows[row] & mask):
+                break
+        else:
+            y = below
+            continue
+        break
+
+    for dy, mask in shifted:
+        row = y + dy
+        if row >= height or (row >= 0 and rows[row] & mask):
+            return -1
+    return y
+
+
+class TestBitboard:
+    """Test board conversion and evaluation kernels"""
+
+    def test_grid_to_rows(self) -> None:
+        """Test each filled column sets its bit in the row mask"""
+        grid = empty_grid()
+        grid[HEIGHT - 1][0] = FILLED
+        grid[HEIGHT - 1][3] = FILLED
+        rows = grid_to_rows(grid)
+        assert len(rows) == HEIGHT
+        assert rows[HEIGHT - 1] == 0b1001
+        assert all(row == 0 for row in rows[:-1])
+
+    def test_grid_to_rows_full_row(self) -> None:
+        """Test a full row packs to all column bits"""
+        grid = empty_grid()
+        grid[HEIGHT - 1] = [FILLED] * WIDTH
+        grid[HEIGHT - 2][WIDTH - 1] = FILLED
+        rows = grid_to_rows(grid)
+        assert rows[HEIGHT - 1] == (1 << WIDTH) - 1
+        assert rows[HEIGHT - 2] == 1 << (WIDTH - 1)
+
+    def test_piece_row_masks(self) -> None:
+        """Test the T piece footprint as row masks"""
+        row_masks, min_dx, max_dx = piece_row_masks(SHAPE_CELLS["T"][0])
+        assert row_masks == ((0, 0b010), (1, 0b111))
+        assert (min_dx, max_dx) == (0, 2)
+
+    def test_full_rows(self) -> None:
+        """Test only completely filled rows are reported"""
+        rows = [0] * HEIGHT
+        rows[5] = (1 << WIDTH) - 1
+        rows[6] = (1 << WIDTH) - 2
+        rows[19] = (1 << WIDTH) - 1
+        assert full_rows(rows, WIDTH) == [5, 19]
+
+    def test_popcount(self) -> None:
+        """Test bit counting (native and fallback) and cell counting"""
+        for value in (0, 1, 0b1011, (1 << WIDTH) - 1, 1 << 63):
+            expected = bin(value).count("1")
+            assert popcount(value) == expected
+            assert _popcount_fallback(value) == expected
+        assert count_cells([0b11, 0, 0b1000000001]) == 4
+
+    def test_count_near_full_rows(self) -> None:
+        """Test rows missing at most one column are counted"""
+        full = (1 << WIDTH) - 1
+        rows = [0] * HEIGHT
+        rows[0] = full
+        rows[1] = full & ~0b1
+        rows[2] = full & ~0b11
+        rows[3] = full & ~(1 << (WIDTH - 1))
+        assert count_near_full_rows(rows, WIDTH) == 3
+
+    def test_rows_to_columns(self) -> None:
+        """Test column masks count rows up from the floor"""
+        grid = empty_grid()
+        grid[HEIGHT - 1][0] = FILLED
+        grid[HEIGHT - 3][0] = FILLED
+        grid[0][WIDTH - 1] = FILLED
+        columns = rows_to_columns(grid_to_rows(grid), WIDTH)
+        assert columns[0] == 0b101
+        assert columns[WIDTH - 1] == 1 << (HEIGHT - 1)
+        assert all(column == 0 for column in columns[1:-1])
+
+    def test_drop_row_lands_on_stack(self) -> None:
+        """Test pieces land on the floor or on top of blocks"""
+        rows = [0] * HEIGHT
+        masks = piece_row_masks(SHAPE_CELLS["O"][0])
+        assert drop_row(rows, masks, 0, WIDTH) == HEIGHT - 2
+
+        rows[HEIGHT - 1] = 0b1
+        assert drop_row(rows, masks, 0, WIDTH) == HEIGHT - 3
+
+    def test_drop_row_rejects_walls(self) -> None:
+        """Test placements outside the side walls are invalid"""
+        rows = [0] * HEIGHT
+        masks = piece_row_masks(SHAPE_CELLS["I"][0])
+        assert drop_row(rows, masks, -1, WIDTH) == -1
+        assert drop_row(rows, masks, WIDTH - 3, WIDTH) == -1
+        assert drop_row(rows, masks, WIDTH - 4, WIDTH) == HEIGHT - 1
+
+    def test_piece_fits(self) -> None:
+        """Test footprints are checked against walls, floor, blocks and open top rows"""
+        rows = [0] * HEIGHT
+        rows[HEIGHT - 1] = 0b10
+        masks = piece_row_masks(SHAPE_CELLS["O"][0])
+        assert piece_fits(rows, masks, 0, HEIGHT - 3, WIDTH)
+        assert not piece_fits(rows, masks, 0, HEIGHT - 2, WIDTH)
+        assert piece_fits(rows, masks, 2, HEIGHT - 2, WIDTH)
+        assert not piece_fits(rows, masks, -1, 0, WIDTH)
+        assert not piece_fits(rows, masks, WIDTH - 1, 0, WIDTH)
+        assert piece_fits(rows, masks, 0, -2, WIDTH)
+
+        # A leading empty column lets the piece sit at x = -1
+        assert piece_fits(rows, piece_row_masks(((1, 0), (1, 1))), -1, 0, WIDTH)
+
+    def test_pack_board_metrics(self) -> None:
+        """Test a packed board carries heights, cells, full and near-full rows"""
+        full = (1 << WIDTH) - 1
+        rows = [0] * HEIGHT
+        rows[HEIGHT - 1] = full
+        rows[HEIGHT - 2] = full & ~0b1
+        rows, heights, filled, lines, near_full, _ = pack_board(rows, WIDTH)
+        assert len(rows) == HEIGHT
+        assert heights == (1,) + (2,) * (WIDTH - 1)
+        assert filled == 2 * WIDTH - 1
+        assert lines == (HEIGHT - 1,)
+        assert near_full == 2
+
+    def test_place_piece_matches_repacking(self) -> None:
+        """Test patched metrics equal packing the board with the piece placed"""
+        full = (1 << WIDTH) - 1
+        rows = [0] * HEIGHT
+        rows[HEIGHT - 1] = full & ~0b1111
+        rows[HEIGHT - 3] = 0b100000
+        board = pack_board(rows, WIDTH)
+        for shape_cells in SHAPE_CELLS.values():
+            for cells in shape_cells:
+                for x in range(-1, WIDTH):
+                    placed = place_piece(board, cells, x, WIDTH)
+                    if placed is None:
+                        assert drop_row(board[0], piece_row_masks(cells), x, WIDTH) == -1
+                        continue
+                    y, heights, filled, lines, near_full = placed
+                    expected_rows = list(rows)
+                    for dx, dy in cells:
+                        expected_rows[y + dy] |= 1 << (x + dx)
+                    expected = pack_board(expected_rows, WIDTH)
+                    assert (tuple(heights), filled, lines, near_full) == expected[1:5]
+
+    def test_landing_row_matches_drop_row(self) -> None:
+        """Test the table lookup lands pieces exactly where stepping does"""
+        rng = random.Random(7)
+        for _ in range(50):
+            # Random junk including floating blocks and overhangs near the top
+            rows = [rng.getrandbits(WIDTH) if rng.random() < 0.4 else 0 for _ in range(HEIGHT)]
+            next_filled = next_filled_rows(rows, WIDTH)
+            for shape_cells in SHAPE_CELLS.values():
+                for cells in shape_cells:
+                    masks = piece_row_masks(cells)
+                    for x in range(-2, WIDTH):
+                        expected = drop_row(rows, masks, x, WIDTH)
+                        assert landing_row(rows, next_filled, cells, x, WIDTH) == expected
+
+    def test_fall_distance_matches_stepping(self) -> None:
+        """Test the table lookup gives the stepped fall distance from any start row"""
+        rng = random.Random(11)
+        for _ in range(30):
+            rows = [rng.getrandbits(WIDTH) if rng.random() < 0.4 else 0 for _ in range(HEIGHT)]
+            next_filled = next_filled_rows(rows, WIDTH)
+            for shape_cells in SHAPE_CELLS.values():
+                for cells in shape_cells:
+                    masks = piece_row_masks(cells)
+                    for x in range(-masks[1], WIDTH - masks[2]):
+                        for y in range(-2, HEIGHT - max(dy for _, dy in cells)):
+                            expected = 0
+                            while piece_fits(rows, masks, x, y + expected + 1, WIDTH):
+                                expected += 1
+                            assert fall_distance(next_filled, cells, x, y) == expected
@@ -44,6 +44,19 @@ class TestPowerUpManager:
         # With 100% spawn chance, should always return True
         assert manager.should_spawn_powerup()
 
+    def test_spawn_follows_runtime_toggle(self) -> None:
+        """Test toggling charged blocks after creation takes effect immediately"""
+
+        class ToggledConfig(TestPowerUpConfig):
+            pass
+
+        manager = PowerUpManager(ToggledConfig)
+        ToggledConfig.CHARGED_BLOCKS_ENABLED = False
+        assert not manager.should_spawn_powerup()
+
+        ToggledConfig.CHARGED_BLOCKS_ENABLED = True
+        assert manager.should_spawn_powerup()
+
     def test_get_random_powerup_type(self) -> None:
         """Test getting random power-up type"""
         manager = PowerUpManager(GameConfig)
@@ -120,6 +133,62 @@ class TestPowerUpManager:
         # Block at y=15 is below both lines, no shift (already below cleared lines)
         assert (6, 15, "time_dilator") in manager.powerup_blocks
 
+    def test_assigned_powerup_blocks_are_indexed(self) -> None:
+        """Test assigning the block list directly keeps the lookups in sync"""
+        manager = PowerUpManager(GameConfig)
+        manager.add_powerup_block(0, 2, "line_bomb")
+        manager.powerup_blocks = [(1, 5, "score_amplifier")]
+
+        assert manager.get_powerup_at(1, 5) == "score_amplifier"
+        assert manager.get_powerup_at(0, 2) is None
+        assert manager.get_powerups_in_line(5) == ["score_amplifier"]
+        assert manager.remove_powerups_in_lines([5]) == ["score_amplifier"]
+        assert manager.powerup_blocks == []
+
+    def test_clear_and_shift_matches_remove_then_shift(self) -> None:
+        """Test the fused clear matches removing and then shifting power-ups"""
+        blocks = [
+            (2, 3, "time_dilator"),
+            (4, 5, "line_bomb"),
+            (4, 8, "score_amplifier"),
+            (6, 10, "phantom_mode"),
+            (6, 15, "time_dilator"),
+        ]
+        fused = PowerUpManager(GameConfig)
+        separate = PowerUpManager(GameConfig)
+        for block in blocks:
+            fused.add_powerup_block(*block)
+            separate.add_powerup_block(*block)
+
+        activated = fused.clear_and_shift([10, 5])
+        assert activated == separate.remove_powerups_in_lines([10, 5])
+        separate.shift_powerups_down([10, 5])
+        assert fused.powerup_blocks == separate.powerup_blocks
+        assert fused.get_powerup_at(4, 9) == "score_amplifier"
+        assert fused.get_powerups_in_line(5) == ["time_dilator"]
+
+    def test_lookups_follow_block_changes(self) -> None:
+        """Test cell and line lookups stay in sync as blocks are shifted and removed"""
+        manager = PowerUpManager(GameConfig)
+        manager.add_powerup_block(2, 3, "time_dilator")
+        manager.add_powerup_block(4, 8, "score_amplifier")
+
+        manager.shift_powerups_down([5])
+        assert manager.get_powerup_at(2, 3) is None
+        assert manager.get_powerup_at(2, 4) == "time_dilator"
+        assert manager.get_powerups_in_line(4) == ["time_dilator"]
+
+        assert manager.remove_powerups_in_lines([4]) == ["time_dilator"]
+        assert manager.get_powerup_at(2, 4) is None
+        assert manager.get_powerups_in_line(4) == []
+
+        manager.shift_powerups_up()
+        assert manager.get_powerup_at(4, 7) == "score_amplifier"
+
+        manager.clear_all()
+        assert manager.get_powerup_at(4, 7) is None
+        assert manager.get_powerups_in_line(7) == []
+
     def test_activate_duration_powerup(self) -> None:
         """Test activating duration-based power-up"""
         manager = PowerUpManager(GameConfig)
@@ -149,6 +218,16 @@ class TestPowerUpManager:
         manager.update(6000)
         assert "time_dilator" not in manager.active_powerups
 
+    def test_update_expires_durations_and_keeps_uses(self) -> None:
+        """Test timers expiring on the same tick are all removed while uses never decay"""
+        manager = PowerUpManager(GameConfig)
+        manager.activate_powerup("time_dilator")
+        manager.activate_powerup("score_amplifier")
+        manager.activate_powerup("line_bomb")
+
+        manager.update(60000)
+        assert manager.active_powerups == {"line_bomb": 1}
+
     def test_is_active(self) -> None:
         """Test checking if power-up is active"""
         manager = PowerUpManager(GameConfig)
@@ -177,6 +256,51 @@ class TestPowerUpManager:
             assert isinstance(color, tuple)
             assert len(color) == 3
 
+    def test_active_powerups_display_text(self) -> None:
+        """Test display names, remaining time/uses and colors of active power-ups"""
+        manager = PowerUpManager(GameConfig)
+        manager.activate_powerup("time_dilator")
+        manager.activate_powerup("line_bomb")
+
+        colors = {name: settings["color"] for name, settings in GameConfig.POWER_UP_TYPES.items()}
+        assert manager.get_active_powerups_display() == [
+            ("time_dilator", "Time Dilator: 11s", colors["time_dilator"]),
+            ("line_bomb", "Line Bomb: 1x", colors["line_bomb"]),
+        ]
+
+    def test_unconfigured_active_powerup_is_tolerated(self) -> None:
+        """Test an active type missing from the config neither decays nor breaks display"""
+        manager = PowerUpManager(GameConfig)
+        manager.active_powerups["mystery_boost"] = 3
+
+        manager.update(1000)
+        assert manager.active_powerups["mystery_boost"] == 3
+        assert manager.get_active_powerups_display() == [
+            ("mystery_boost", "Mystery Boost", (255, 255, 255))
+        ]
+        assert not manager.use_powerup("mystery_boost")
+
+    def test_active_powerups_display_refreshes_on_change(self) -> None:
+        """Test the display list is reused until a shown second or use count changes"""
+        manager = PowerUpManager(GameConfig)
+        manager.activate_powerup("time_dilator")
+        manager.update(1)
+        display_info = manager.get_active_powerups_display()
+        assert display_info[0][1] == "Time Dilator: 10s"
+
+        manager.update(500)
+        assert manager.get_active_powerups_display() is display_info
+
+        manager.update(500)
+        display_info = manager.get_active_powerups_display()
+        assert display_info[0][1] == "Time Dilator: 9s"
+
+        manager.activate_powerup("line_bomb")
+        assert manager.get_active_powerups_display()[1][1] == "Line Bomb: 1x"
+
+        manager.clear_all()
+        assert manager.get_active_powerups_display() == []
+
     def test_clear_all(self) -> None:
         """Test clearing all power-up data"""
         manager = PowerUpManager(GameConfig)
@@ -187,6 +311,11 @@ class TestPowerUpManager:
 
         assert len(manager.powerup_blocks) == 0
         assert len(manager.active_powerups) == 0
+        assert not manager.is_active("score_amplifier")
+
+        # Replacing the dict is seen too
+        manager.active_powerups = {"score_amplifier": 1000}
+        assert manager.is_active("score_amplifier")
 
 
 class TestTetrisGameWithPowerUps:
@@ -234,6 +363,16 @@ class TestTetrisGameWithPowerUps:
         # because effective speed is 2x
         assert game.current_piece is not None
 
+    def test_effective_fall_speed_follows_time_dilator(self, game: TetrisGame) -> None:
+        """Test the effective fall speed is doubled only while time dilator is active"""
+        assert game.get_effective_fall_speed() == game.fall_speed
+
+        game.powerup_manager.activate_powerup("time_dilator")
+        assert game.get_effective_fall_speed() == game.fall_speed * 2
+
+        game.powerup_manager.update(game.config.POWER_UP_TYPES["time_dilator"]["duration"])
+        assert game.get_effective_fall_speed() == game.fall_speed
+
     def test_score_amplifier_doubles_score(self, game: TetrisGame) -> None:
         """Test that score amplifier doubles line clear score"""
         # Set up a line to clear
@@ -364,6 +503,18 @@ class TestPowerUpOnFallingPieces:
             copied_piece = piece.copy()
             assert copied_piece.powerup_blocks == piece.powerup_blocks
 
+    def test_powerup_glows_reuse_one_surface(self, game: TetrisGame) -> None:
+        """Test block and preview glows are drawn through the shared glow surface"""
+        glow_surface = game._glow_surface
+        game.screen.fill(TestPowerUpConfig.BLACK)
+        game._draw_powerup_glow(0, 0, "time_dilator")
+        game._draw_preview_powerup_glow(600, 100)
+
+        assert game._glow_surface is glow_surface
+        border = (TestPowerUpConfig.GRID_X + 1, TestPowerUpConfig.GRID_Y + 1)
+        assert game.screen.get_at(border)[:3] != TestPowerUpConfig.BLACK
+        assert game.screen.get_at((600, 100))[:3] != TestPowerUpConfig.BLACK
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -7,7 +7,7 @@ from typing import Generator
 import pygame
 import pytest
 
-from src.config import GameConfig
+from src.config import SHAPE_BOUNDS, SHAPE_CELLS, SHAPE_ROTATIONS, GameConfig
 from src.game_states import (
     ConfigMenuState,
     DemoState,
@@ -15,8 +15,18 @@ from src.game_states import (
     LineClearingState,
     PausedState,
     PlayingState,
+    centered_text,
+    render_text,
+)
+from src.tetris import (
+    COLORS,
+    GRID_HEIGHT,
+    GRID_WIDTH,
+    PULSE_ALPHAS,
+    RAINBOW_COLORS,
+    SHAPES,
+    TetrisGame,
 )
-from src.tetris import COLORS, GRID_HEIGHT, GRID_WIDTH, SHAPES, TetrisGame
 from src.tetromino import Tetromino
 
 
@@ -51,18 +61,18 @@ class TestTetromino:
     def test_tetromino_rotation_clockwise(self) -> None:
         """Test clockwise rotation"""
         piece = Tetromino("T")
-        original_shape = [row[:] for row in piece.shape]
+        original_shape = [list(row) for row in piece.shape]
         piece.rotate_clockwise()
         # Shape should change after rotation
-        assert piece.shape != original_shape
+        assert [list(row) for row in piece.shape] != original_shape
 
     def test_tetromino_rotation_counterclockwise(self) -> None:
         """Test counterclockwise rotation"""
         piece = Tetromino("T")
-        original_shape = [row[:] for row in piece.shape]
+        original_shape = [list(row) for row in piece.shape]
         piece.rotate_counterclockwise()
         # Shape should change after rotation
-        assert piece.shape != original_shape
+        assert [list(row) for row in piece.shape] != original_shape
 
     def test_tetromino_copy(self) -> None:
         """Test copying a tetromino"""
@@ -90,6 +100,98 @@ class TestTetromino:
             assert isinstance(block, tuple)
             assert len(block) == 2
 
+    def test_cells_follow_rotation(self) -> None:
+        """Test precomputed cells match the shape matrix in every rotation"""
+        for shape_type in SHAPES:
+            piece = Tetromino(shape_type)
+            for rotation in range(4):
+                expected = [
+                    (x, y)
+                    for y, row in enumerate(piece.shape)
+                    for x, cell in enumerate(row)
+                    if cell
+                ]
+                assert piece.rotation == rotation
+                assert list(piece.cells) == expected
+                assert piece.cells == SHAPE_CELLS[shape_type][rotation]
+                assert SHAPE_BOUNDS[shape_type][rotation] == (
+                    len(piece.shape[0]),
+                    len(piece.shape),
+                )
+                assert piece.bounds == SHAPE_BOUNDS[shape_type][rotation]
+                piece.rotate_clockwise()
+            assert piece.rotation == 0
+
+        # Assigning a shape directly keeps the bounds in sync too
+        piece = Tetromino("T")
+        piece.shape = ((1, 1), (1, 1), (1, 0))
+        assert piece.bounds == (2, 3)
+
+    def test_rotated_cells_match_rotation(self) -> None:
+        """Test rotated_cells looks ahead without rotating the piece"""
+        for shape_type in SHAPES:
+            piece = Tetromino(shape_type)
+            piece.rotate_clockwise()
+            for turns in range(4):
+                expected = SHAPE_CELLS[shape_type][(1 + turns) % 4]
+                assert piece.rotated_cells(turns) == expected
+            assert piece.rotation == 1
+
+    def test_assigned_shape_rotates(self) -> None:
+        """Test rotating and copying a piece keep a shape assigned to it"""
+        piece = Tetromino("T")
+        piece.rotate_clockwise()
+        piece.shape = [[1, 1], [1, 1], [1, 0]]
+        assert piece.rotation == 0
+
+        copied = piece.copy()
+        assert copied.shape == [[1, 1], [1, 1], [1, 0]]
+        assert copied.shape is not piece.shape
+
+        piece.rotate_clockwise()
+        assert [list(row) for row in piece.shape] == [[1, 1, 1], [0, 1, 1]]
+        assert piece.cells == ((0, 0), (1, 0), (2, 0), (1, 1), (2, 1))
+        assert piece.bounds == (3, 2)
+        piece.rotate_counterclockwise()
+        assert [list(row) for row in piece.shape] == [[1, 1], [1, 1], [1, 0]]
+
+        copied.rotate_clockwise()
+        assert copied.cells == piece.rotated_cells(1)
+
+    def test_failed_kick_restores_assigned_shape(self) -> None:
+        """Test a rotation with no valid kick keeps the piece's assigned shape"""
+        pygame.init()
+        game = TetrisGame(TestConfig)
+        piece = game.current_piece
+        piece.shape = [[1, 1, 1, 1]]
+        piece.x, piece.y = 0, 5
+        # Wall off every cell the upright bar or its kicks could use
+        for y in range(2, 10):
+            for x in range(GRID_WIDTH):
+                if y != 5:
+                    game.grid[y][x] = COLORS["Z"]
+        cells = piece.cells
+
+        game.rotate_piece()
+        assert piece.cells == cells
+        assert (piece.x, piece.y) == (0, 5)
+        pygame.quit()
+
+    def test_rotation_tables(self) -> None:
+        """Test rotation tables follow the clockwise rule and spawn dimensions"""
+        for shape_type, shape in SHAPES.items():
+            assert SHAPE_BOUNDS[shape_type][0] == (len(shape[0]), len(shape))
+            expected = [list(row) for row in shape]
+            for rotation in range(4):
+                assert [list(row) for row in SHAPE_ROTATIONS[shape_type][rotation]] == expected
+                expected = [list(row) for row in zip(*expected[::-1])]
+
+            piece = Tetromino(shape_type)
+            piece.rotate_counterclockwise()
+            assert piece.shape is SHAPE_ROTATIONS[shape_type][3]
+            piece.rotate_clockwise()
+            assert piece.shape is SHAPE_ROTATIONS[shape_type][0]
+
 
 class TestTetrisGame:
     """Test the TetrisGame class"""
@@ -103,6 +205,35 @@ class TestTetrisGame:
         yield game
         pygame.quit()
 
+    def test_run_blocks_ignored_events(
+        self, game: TetrisGame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the game loop blocks unhandled event types and still sees QUIT"""
+        from src.tetris import IGNORED_EVENT_TYPES
+
+        blocked = []
+        monkeypatch.setattr(
+            pygame,
+            "quit",
+            lambda: blocked.extend(map(pygame.event.get_blocked, IGNORED_EVENT_TYPES)),
+        )
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        game.run()
+        assert blocked and all(blocked)
+
+    def test_run_handles_keys_and_drops_other_events(
+        self, game: TetrisGame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the game loop handles KEYDOWN and QUIT and discards other queued events"""
+        leftover = []
+        monkeypatch.setattr(pygame, "quit", lambda: leftover.extend(pygame.event.get()))
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_p}))
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        game.run()
+        assert isinstance(game.state, PausedState)
+        assert leftover == []
+
     def test_game_initialization(self, game: TetrisGame) -> None:
         """Test game initializes correctly"""
         assert game.score == 0
@@ -171,6 +302,23 @@ class TestTetrisGame:
         assert ghost.y >= game.current_piece.y
         assert ghost.x == game.current_piece.x
 
+    def test_ghost_and_hard_drop_follow_grid_edits(self, game: TetrisGame) -> None:
+        """Test landing rows use the current grid, and phantom mode passes through blocks"""
+        game.current_piece = Tetromino("O", TestConfig)
+        piece = game.current_piece
+        assert game.get_ghost_piece().y == GRID_HEIGHT - 2
+
+        game.grid[GRID_HEIGHT - 5][piece.x] = COLORS["I"]
+        assert game.get_ghost_piece().y == GRID_HEIGHT - 7
+
+        game.powerup_manager.activate_powerup("phantom_mode")
+        assert game.get_ghost_piece().y == GRID_HEIGHT - 2
+
+        game.powerup_manager.clear_all()
+        game.hard_drop()
+        assert game.grid[GRID_HEIGHT - 6][piece.x] == piece.color
+        assert game.score == (GRID_HEIGHT - 7) * TestConfig.HARD_DROP_BONUS
+
     def test_scoring_single_line(self, game: TetrisGame) -> None:
         """Test scoring for single line clear"""
         # Fill bottom row except one column
@@ -366,9 +514,16 @@ class TestGameLogic:
         game.grid[1][0] = COLORS["T"]  # Should drop to line 5
         game.grid[3][1] = COLORS["S"]  # Should drop to line 6
 
+        grid = game.grid
+        marker_row = game.grid[1]
+
         game.clear_lines()
         game.finish_clearing_animation()
 
+        # Rows are removed in place; surviving rows move without being copied
+        assert game.grid is grid
+        assert game.grid[5] is marker_row
+
         # Verify 5 lines cleared
         assert game.lines_cleared == 5
 
@@ -501,6 +656,64 @@ class TestGameLogic:
         # Level 2 should give more points for same line clear
         assert score_level_2 > score_level_1
 
+    def test_grid_lines_are_drawn_once(
+        self, game: TetrisGame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test redrawing the settled grid and clear flash reuses the startup surfaces"""
+        game.draw_grid()
+        # Block tiles are drawn on first use of each color
+        game._get_block_tile(COLORS["I"])
+        game._get_block_tile(COLORS["O"])
+        lines: list = []
+        surfaces: list = []
+        monkeypatch.setattr(pygame.draw, "line", lambda *args: lines.append(args))
+        monkeypatch.setattr(pygame, "Surface", lambda *args: surfaces.append(args))
+
+        game.grid[GRID_HEIGHT - 1][0] = COLORS["I"]
+        game.draw_grid()
+        for x in range(GRID_WIDTH):
+            game.grid[GRID_HEIGHT - 2][x] = COLORS["O"]
+        game.clear_lines()
+        game.draw_grid()
+
+        assert not [args for args in lines if args[1] == game.config.GRAY]
+        assert not surfaces
+        # Grid line at the left edge, then the locked block next to it
+        origin = (
+            game.config.GRID_X,
+            game.config.GRID_Y + (GRID_HEIGHT - 1) * game.config.BLOCK_SIZE,
+        )
+        assert game.screen.get_at(origin)[:3] == game.config.GRAY
+        inside = (origin[0] + game.config.BLOCK_SIZE // 2, origin[1] + game.config.BLOCK_SIZE // 2)
+        assert game.screen.get_at(inside)[:3] != game.config.DARK_GRAY
+
+    def test_clear_flash_covers_cells_not_grid_lines(self, game: TetrisGame) -> None:
+        """Test the row-wide clear flash whitens each cell and keeps the grid lines"""
+        for x in range(GRID_WIDTH):
+            game.grid[GRID_HEIGHT - 1][x] = COLORS["I"]
+        game.clear_lines()
+        game.clear_animation_time = 0
+        game.current_piece = None
+        game.draw_grid()
+
+        block_size = game.config.BLOCK_SIZE
+        top = game.config.GRID_Y + (GRID_HEIGHT - 1) * block_size
+        for x in range(GRID_WIDTH):
+            left = game.config.GRID_X + x * block_size
+            center = (left + block_size // 2, top + block_size // 2)
+            assert game.screen.get_at(center)[:3] == game.config.WHITE
+            assert game.screen.get_at((left, top + block_size // 2))[:3] == game.config.GRAY
+
+    def test_cached_surfaces_use_display_format(self, game: TetrisGame) -> None:
+        """Test surfaces blitted every frame are created in the display's pixel format"""
+        screen = game.screen
+        for surface in (game._grid_background, game._clear_flash_surface):
+            assert surface.get_bitsize() == screen.get_bitsize()
+            assert surface.get_masks()[:3] == screen.get_masks()[:3]
+        for surface in (game._glow_surface, game._warning_surface, game.get_overlay(100, 200)):
+            assert surface.get_flags() & pygame.SRCALPHA
+            assert surface.get_masks()[:3] == screen.get_masks()[:3]
+
 
 class TestConstants:
     """Test game constants are valid"""
@@ -525,6 +738,16 @@ class TestConstants:
         assert GRID_WIDTH == 10
         assert GRID_HEIGHT == 20
 
+    def test_glow_lookup_tables(self) -> None:
+        """Test the rainbow and pulse tables span a full cycle per degree"""
+        assert len(RAINBOW_COLORS) == len(PULSE_ALPHAS) == 360
+        assert RAINBOW_COLORS[0] == (255, 0, 0)
+        assert RAINBOW_COLORS[120] == (0, 255, 0)
+        assert RAINBOW_COLORS[240] == (0, 0, 255)
+        assert PULSE_ALPHAS[0] == 255
+        assert PULSE_ALPHAS[180] == 100
+        assert min(PULSE_ALPHAS) == 100
+
 
 class TestGameStates:
     """Test the State Pattern implementation"""
@@ -563,6 +786,35 @@ class TestGameStates:
         # Should be back to playing
         assert isinstance(game.state, PlayingState)
 
+    def test_playing_state_key_dispatch(self, game: TetrisGame) -> None:
+        """Test bound keys reach their handler and unbound keys are ignored"""
+        show_ghost = game.show_ghost
+        game.handle_input(pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_g}))
+        assert game.show_ghost is not show_ghost
+
+        piece_x = game.current_piece.x
+        game.handle_input(pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_z}))
+        assert game.current_piece.x == piece_x
+        assert isinstance(game.state, PlayingState)
+
+    def test_handle_input_ignores_non_keydown_events(self, game: TetrisGame) -> None:
+        """Test key releases and mouse events passed to handle_input are ignored"""
+        piece_x = game.current_piece.x
+        game.handle_input(pygame.event.Event(pygame.KEYUP, {"key": pygame.K_LEFT}))
+        game.handle_input(pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (0, 0)}))
+        assert game.current_piece.x == piece_x
+        assert isinstance(game.state, PlayingState)
+
+    def test_pause_toggle_reuses_shared_states(self, game: TetrisGame) -> None:
+        """Test pausing and resuming switch between the shared state instances"""
+        from src.game_states import PAUSED_STATE, PLAYING_STATE
+
+        event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_p})
+        game.handle_input(event)
+        assert game.state is PAUSED_STATE
+        game.handle_input(event)
+        assert game.state is PLAYING_STATE
+
     def test_game_over_state_transition(self, game: TetrisGame) -> None:
         """Test transitioning to game over state"""
         # Set game over condition
@@ -645,6 +897,62 @@ class TestGameStates:
         # But state should have processed the input
         assert isinstance(game.state, PlayingState)
 
+    def test_state_overlays_are_cached(self, game: TetrisGame) -> None:
+        """Test state overlays are built with the game and reused every draw"""
+        overlays = dict(game._overlays)
+        assert len(overlays) == 4
+
+        paused = PausedState()
+        paused.draw(game)
+        paused.draw(game)
+        overlay = game.get_overlay(TestConfig.SCREEN_HEIGHT, 180)
+        assert overlay is overlays[(TestConfig.SCREEN_HEIGHT, 180)]
+        assert overlay.get_at((0, 0)) == (0, 0, 0, 180)
+        assert overlay.get_size() == (TestConfig.SCREEN_WIDTH, TestConfig.SCREEN_HEIGHT)
+
+        DemoState().draw(game)
+        GameOverState().draw(game)
+        ConfigMenuState().draw(game)
+        assert game.get_overlay(100, 200).get_size() == (TestConfig.SCREEN_WIDTH, 100)
+        assert game._overlays == overlays
+
+    def test_state_texts_are_shared_between_instances(self, game: TetrisGame) -> None:
+        """Test static state texts are rendered once per font for all instances"""
+        DemoState().draw(game)
+        font, banner = DemoState._banner
+        assert font is game.font
+        assert banner.get_size() == (TestConfig.SCREEN_WIDTH, 100)
+        assert banner is not game.get_overlay(100, 200)
+
+        DemoState().draw(game)
+        assert DemoState._banner[1] is banner
+
+    def test_centered_texts_are_converted_once(self, game: TetrisGame) -> None:
+        """Test a memoized text is converted and centered once and placed at any height"""
+        text = render_text(game.small_font, "Use UP/DOWN to navigate", TestConfig.GRAY)
+        surface, (x, y) = centered_text(text, game, 100)
+        assert y == 100
+        assert x == TestConfig.SCREEN_WIDTH // 2 - text.get_width() // 2
+        assert centered_text(text, game, 200) == (surface, (x, 200))
+
+    def test_game_over_score_rerenders_on_change(self, game: TetrisGame) -> None:
+        """Test texts are memoized and the final score is re-rendered only when it changes"""
+        white = TestConfig.WHITE
+        assert render_text(game.font, "GAME OVER", white) is render_text(
+            game.font, "GAME OVER", white
+        )
+
+        game_over = GameOverState()
+        game.score = 100
+        game_over.draw(game)
+        score_draw = game_over._score_draw
+        game_over.draw(game)
+        assert game_over._score_draw is score_draw
+
+        game.score = 200
+        game_over.draw(game)
+        assert game_over._score_draw is not score_draw
+
 
 class TestGameConfig:
     """Test the GameConfig class and config-based initialization"""
@@ -698,6 +1006,56 @@ class TestGameConfig:
 
         pygame.quit()
 
+    def test_piece_sprite_transparency_modes(self) -> None:
+        """Test opaque (color-keyed) and alpha piece sprites both keep gaps transparent"""
+        for use_alpha in (False, True):
+            pygame.init()
+
+            class SpriteConfig(TestConfig):  # pylint: disable=too-few-public-methods
+                """Configuration selecting the sprite caching mode"""
+
+                USE_ALPHA_BLOCKS = use_alpha
+
+            game = TetrisGame(SpriteConfig)
+            block_size = SpriteConfig.BLOCK_SIZE
+            sprite = game._get_piece_sprite(COLORS["T"], SHAPE_CELLS["T"][0])
+            assert bool(sprite.get_flags() & pygame.SRCALPHA) == use_alpha
+            assert (sprite.get_colorkey() is None) == use_alpha
+
+            target = pygame.Surface(sprite.get_size())
+            target.fill(GameConfig.WHITE)
+            target.blit(sprite, (0, 0))
+            # T spawns as .X. / XXX: the top-left cell is a gap, the center is a block
+            assert target.get_at((block_size // 2, block_size // 2))[:3] == GameConfig.WHITE
+            center = (block_size + block_size // 2, block_size + block_size // 2)
+            assert target.get_at(center)[:3] == COLORS["T"]
+
+            pygame.quit()
+
+    def test_block_tiles_match_direct_rendering(self) -> None:
+        """Test a cached block tile blits the same pixels as drawing the block directly"""
+        for use_alpha in (False, True):
+            pygame.init()
+
+            class TileConfig(TestConfig):  # pylint: disable=too-few-public-methods
+                """Configuration selecting the sprite caching mode"""
+
+                USE_ALPHA_BLOCKS = use_alpha
+
+            game = TetrisGame(TileConfig)
+            size = TileConfig.BLOCK_SIZE + 2
+            for color in COLORS.values():
+                direct = pygame.Surface((size, size))
+                direct.fill(GameConfig.DARK_GRAY)
+                game._render_block(direct, 1, 1, color)
+                tiled = pygame.Surface((size, size))
+                tiled.fill(GameConfig.DARK_GRAY)
+                tiled.blit(game._get_block_tile(color), (1, 1))
+                assert pygame.image.tobytes(direct, "RGB") == pygame.image.tobytes(tiled, "RGB")
+            assert game._get_block_tile(COLORS["T"]) is game._get_block_tile(COLORS["T"])
+
+            pygame.quit()
+
     def test_config_values_are_correct(self) -> None:
         """Test that GameConfig has all expected values"""
         # Display settings
@@ -730,6 +1088,35 @@ class TestGameConfig:
         assert GameConfig.COMBO_FONT_SCALE_MAX == 1.8
         assert GameConfig.COMBO_Y_OFFSET == 30
 
+    def test_level_timing_tables(self) -> None:
+        """Test per-level fall speed and rising interval lookups"""
+
+        class FastConfig(GameConfig):  # pylint: disable=too-few-public-methods
+            """Custom configuration with a steep speed curve"""
+
+            INITIAL_FALL_SPEED = 500
+            LEVEL_SPEED_DECREASE = 150
+            MIN_FALL_SPEED = 120
+
+        for level in range(1, 30):
+            assert GameConfig.fall_speed_for_level(level) == max(
+                GameConfig.MIN_FALL_SPEED,
+                GameConfig.INITIAL_FALL_SPEED - (level - 1) * GameConfig.LEVEL_SPEED_DECREASE,
+            )
+            assert GameConfig.rising_interval_for_level(level) == max(
+                GameConfig.RISING_MIN_INTERVAL,
+                GameConfig.RISING_INITIAL_INTERVAL
+                - (level - 1) * GameConfig.RISING_INTERVAL_DECREASE,
+            )
+
+        assert [FastConfig.fall_speed_for_level(level) for level in range(1, 6)] == [
+            500,
+            350,
+            200,
+            120,
+            120,
+        ]
+
     def test_scoring_with_custom_config(self) -> None:
         """Test that custom config affects scoring"""
         pygame.init()
@@ -1016,6 +1403,124 @@ class TestDemoMode:
         assert isinstance(score, float)
         assert score > float("-inf")
 
+    def test_demo_resumes_after_line_clear(
+        self, game_no_demo: TetrisGame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the demo state and its AI survive the line clearing animation"""
+        # The demo forces rising lines on; restore the shared config afterwards
+        rising_enabled = game_no_demo.config.RISING_LINES_ENABLED
+        monkeypatch.setattr(game_no_demo.config, "RISING_LINES_ENABLED", rising_enabled)
+        demo = DemoState()
+        game_no_demo.state = demo
+        demo.update(0, game_no_demo)
+        ai = demo.ai
+        assert ai is not None
+
+        for x in range(game_no_demo.config.GRID_WIDTH):
+            game_no_demo.grid[game_no_demo.config.GRID_HEIGHT - 1][x] = COLORS["I"]
+        game_no_demo.clear_lines()
+        assert isinstance(game_no_demo.state, LineClearingState)
+
+        game_no_demo.state.update(game_no_demo.clear_animation_duration, game_no_demo)
+        assert game_no_demo.state is demo
+        assert demo.ai is ai
+        assert demo.previous_rising_state == rising_enabled
+
+    def test_demo_sets_up_once(
+        self, game_no_demo: TetrisGame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the AI and the saved rising lines setting survive later updates"""
+        monkeypatch.setattr(game_no_demo.config, "RISING_LINES_ENABLED", False)
+        demo = DemoState()
+        demo.update(0, game_no_demo)
+        ai = demo.ai
+
+        demo.update(16, game_no_demo)
+        assert demo.ai is ai
+        assert demo.previous_rising_state is False
+        assert game_no_demo.config.RISING_LINES_ENABLED is True
+
+    def test_demo_ai_moves_keep_schedule(
+        self, game_no_demo: TetrisGame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test frame overshoot carries over to the AI's next move instead of being dropped"""
+        rising_enabled = game_no_demo.config.RISING_LINES_ENABLED
+        monkeypatch.setattr(game_no_demo.config, "RISING_LINES_ENABLED", rising_enabled)
+        game_no_demo.fall_speed = 10_000
+        demo = DemoState()
+        demo.update(0, game_no_demo)
+        ai = demo.ai
+        assert ai is not None
+
+        moves = []
+        monkeypatch.setattr(type(ai), "make_next_move", lambda _: moves.append(demo.clock_ms))
+        monkeypatch.setattr(type(ai), "get_movement_delay", lambda _: 100)
+        demo.next_move_at = 0
+        for _ in range(5):
+            demo.update(60, game_no_demo)
+
+        # Due at 0, 100, 200 and 300, each on the first frame at or after it
+        assert moves == [60, 120, 240, 300]
+
+    def test_fall_time_keeps_overshoot(self, game_no_demo: TetrisGame) -> None:
+        """Test the time past a fall counts toward the next one"""
+        game_no_demo.fall_time = 0
+        game_no_demo.state.update(game_no_demo.fall_speed + 30, game_no_demo)
+        assert game_no_demo.fall_time == 30
+
+    def test_demo_ai_placement_memo_follows_grid(self, game_no_demo: TetrisGame) -> None:
+        """Test memoized placement scores are reused only while the grid is unchanged"""
+        from src.demo_ai import DemoAI
+
+        ai = DemoAI(game_no_demo)
+        piece = Tetromino("O", game_no_demo.config)
+        first_score, first_grid = ai.evaluate_placement(piece, 0, 0)
+        assert ai.evaluate_placement(piece, 0, 0) == (first_score, first_grid)
+
+        # A block under the landing spot changes where the piece rests
+        game_no_demo.grid[game_no_demo.config.GRID_HEIGHT - 1][0] = COLORS["I"]
+        score, grid = ai.evaluate_placement(piece, 0, 0)
+        assert score != first_score
+        assert grid is not None
+        assert grid[game_no_demo.config.GRID_HEIGHT - 2][0] == COLORS["O"]
+
+    def test_demo_ai_reuses_board_until_grid_changes(self, game_no_demo: TetrisGame) -> None:
+        """Test the packed grid is reused for an unchanged grid and rebuilt after edits"""
+        from src.demo_ai import DemoAI
+
+        ai = DemoAI(game_no_demo)
+        board = ai._game_board()
+        assert ai._game_board() is board
+
+        game_no_demo.grid[game_no_demo.config.GRID_HEIGHT - 1][0] = COLORS["I"]
+        rebuilt = ai._game_board()
+        assert rebuilt is not board
+        assert rebuilt[0][-1] == 1
+
+    def test_demo_ai_incremental_scores_match_full_evaluation(
+        self, game_no_demo: TetrisGame
+    ) -> None:
+        """Test patched per-placement metrics score like a full grid evaluation"""
+        from src.demo_ai import DemoAI
+
+        config = game_no_demo.config
+        bottom = config.GRID_HEIGHT - 1
+        # Bottom row one short of full, an overhang with a hole, and a tall column
+        for x in range(config.GRID_WIDTH - 1):
+            game_no_demo.grid[bottom][x] = COLORS["I"]
+        game_no_demo.grid[bottom - 2][3] = COLORS["T"]
+        for y in range(bottom - 5, bottom):
+            game_no_demo.grid[y][0] = COLORS["L"]
+
+        ai = DemoAI(game_no_demo)
+        for shape_type in ("I", "T", "S"):
+            piece = Tetromino(shape_type, config)
+            for rotation in range(4):
+                for x in range(config.GRID_WIDTH):
+                    score, grid = ai.evaluate_placement(piece, x, rotation)
+                    if grid is not None:
+                        assert score == ai._evaluate_grid_state(grid)
+
     def test_demo_ai_finds_best_move(self, game_no_demo: TetrisGame) -> None:
         """Test demo AI can find best move"""
         from src.demo_ai import DemoAI
@@ -1028,6 +1533,49 @@ class TestDemoMode:
         assert 0 <= rotation < 4
         assert isinstance(use_hold, bool)
 
+    def test_demo_ai_caches_moves_per_position(self, game_no_demo: TetrisGame) -> None:
+        """Test find_best_move reuses results only for an identical position"""
+        from src.demo_ai import DemoAI
+
+        ai = DemoAI(game_no_demo)
+        move = ai.find_best_move()
+        assert ai.find_best_move() == move
+        assert len(ai._move_cache) == 1
+
+        # Any change to the position is a new search
+        game_no_demo.grid[game_no_demo.config.GRID_HEIGHT - 1][0] = COLORS["I"]
+        ai.find_best_move()
+        game_no_demo.can_hold = not game_no_demo.can_hold
+        ai.find_best_move()
+        game_no_demo.powerup_manager.add_powerup_block(0, 5, "line_bomb")
+        ai.find_best_move()
+        assert len(ai._move_cache) == 4
+
+    def test_demo_ai_skips_repeated_rotations(
+        self, game_no_demo: TetrisGame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test symmetric pieces only search their distinct footprints inside the walls"""
+        from src.demo_ai import DemoAI
+
+        evaluated = []
+        evaluate_placement_score = DemoAI.evaluate_placement_score
+
+        def record(ai, piece, x, rotation):
+            evaluated.append((piece.type, x, rotation))
+            return evaluate_placement_score(ai, piece, x, rotation)
+
+        monkeypatch.setattr(DemoAI, "evaluate_placement_score", record)
+        ai = DemoAI(game_no_demo)
+        width = game_no_demo.config.GRID_WIDTH
+
+        assert ai._evaluate_piece_placements(Tetromino("O", game_no_demo.config))[2] == 0
+        assert evaluated == [("O", x, 0) for x in range(width - 1)]
+
+        evaluated.clear()
+        ai._evaluate_piece_placements(Tetromino("I", game_no_demo.config))
+        assert {rotation for _, _, rotation in evaluated} == {0, 1}
+        assert len(evaluated) == (width - 3) + width
+
     def test_demo_ai_prefers_line_clears(self, game_no_demo: TetrisGame) -> None:
         """Test demo AI prefers moves that clear lines"""
         from src.demo_ai import DemoAI
@@ -1119,6 +1667,18 @@ class TestDemoMode:
         assert isinstance(game.state, DemoState)
         pygame.quit()
 
+    def test_game_over_without_demo_stays(self, game_no_demo: TetrisGame) -> None:
+        """Test game over only waits for restart when demo after game over is disabled"""
+        game_no_demo.game_over = True
+        game_over = GameOverState()
+        game_no_demo.state = game_over
+
+        game_over.update(TestConfig.DEMO_GAME_OVER_DELAY + 1000, game_no_demo)
+        game_over.update(TestConfig.DEMO_GAME_OVER_DELAY + 1000, game_no_demo)
+
+        assert game_no_demo.state is game_over
+        assert game_over.game_over_time == 0
+
 
 class TestConfigMenu:
     """Test the configuration menu functionality"""
@@ -1139,6 +1699,30 @@ class TestConfigMenu:
         assert config_state.current_difficulty == "medium"
         assert len(config_state.options) == 5  # Updated: now includes rising_lines
 
+    def test_config_menu_preselects_current_difficulty(
+        self, game: TetrisGame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the menu opens on the difficulty matching the configured fall speed"""
+        hard_speed = GameConfig.DIFFICULTY_SETTINGS["hard"]["initial_speed"]
+        monkeypatch.setattr(GameConfig, "INITIAL_FALL_SPEED", hard_speed)
+        assert ConfigMenuState().current_difficulty == "hard"
+
+        monkeypatch.setattr(GameConfig, "INITIAL_FALL_SPEED", 1)
+        assert ConfigMenuState().current_difficulty == "medium"
+
+    def test_reopened_menu_is_shared_and_reset(self, game: TetrisGame) -> None:
+        """Test the menu key reopens the shared menu from its first option"""
+        event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_m})
+        game.handle_input(event)
+        menu = game.state
+        assert isinstance(menu, ConfigMenuState)
+        menu.selected_option = 3
+
+        game.state = PlayingState()
+        game.handle_input(event)
+        assert game.state is menu
+        assert menu.selected_option == 0
+
     def test_config_menu_state_transition(self, game: TetrisGame) -> None:
         """Test transitioning to config menu state"""
         game.state = ConfigMenuState()
@@ -1279,6 +1863,45 @@ class TestConfigMenu:
         # Should return to playing state
         assert isinstance(game.state, PlayingState)
 
+    def test_menu_labels_rerender_on_change(self, game: TetrisGame) -> None:
+        """Test menu labels are reused across frames and rebuilt when the menu changes"""
+        config_state = ConfigMenuState()
+        config_state.draw(game)
+        labels = config_state._label_draws
+        assert len(labels) == 10
+
+        config_state.draw(game)
+        assert config_state._label_draws is labels
+
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN)
+        config_state.handle_input(event, game)
+        config_state.draw(game)
+        assert config_state._label_draws is not labels
+
+
+class TestEntryPoint:
+    """Test the console script / python -m entry point"""
+
+    def test_version_matches_package(self, capsys: pytest.CaptureFixture) -> None:
+        """Test --version reports the package version and exits without starting the game"""
+        from src import __version__
+        from src.__main__ import main
+
+        with pytest.raises(SystemExit) as exit_info:
+            main(["--version"])
+        assert exit_info.value.code == 0
+        assert capsys.readouterr().out.strip().endswith(__version__)
+
+    def test_unknown_arguments_are_ignored(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test arguments passed through by a launcher still start the game"""
+        import src.tetris
+        from src.__main__ import main
+
+        started = []
+        monkeypatch.setattr(src.tetris, "main", lambda: started.append(True))
+        main(["-psn_0_12345", "--launcher-flag"])
+        assert started == [True]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
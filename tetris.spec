@@ -3,17 +3,31 @@
 PyInstaller spec file for Tetris Ultimate Edition
 
 This spec file creates a standalone Windows executable that includes all necessary
-modules and dependencies. The executable is packaged as a single file with the
-console window hidden for a polished user experience.
+modules and dependencies, with the console window hidden for a polished user experience.
+
+By default the build is a one-folder bundle: the executable sits next to its
+libraries and starts without extracting an archive to a temp directory on every
+launch. Set TETRIS_ONEFILE=1 to produce a single self-extracting file for
+distribution instead.
 
 Build with: pyinstaller tetris.spec
-Output: dist/tetris.exe
+Output: dist/tetris/tetris.exe (onedir) or dist/tetris.exe (TETRIS_ONEFILE=1)
 """
 import os
 import pygame
+import PyInstaller
 
 block_cipher = None
 
+# Onefile bundles self-extract on every start; only build them when asked to
+onefile = os.environ.get('TETRIS_ONEFILE', '') == '1'
+
+# Strip asserts and docstrings from bundled bytecode (-OO). The option exists since
+# PyInstaller 6.6; older versions (e.g. the Wine build image) simply skip it.
+analysis_options = {}
+if tuple(int(part) for part in PyInstaller.__version__.split('.')[:2]) >= (6, 6):
+    analysis_options['optimize'] = 2
+
 # Get pygame data directory to include font files
 pygame_data_dir = os.path.dirname(pygame.__file__)
 
@@ -37,29 +51,65 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    **analysis_options,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='tetris',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,  # Set to True for debugging; False hides console window for production
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon=None,  # Add path to .ico file if available
-)
+# UPX-packed binaries have to be decompressed in memory every time the game starts.
+# Leave them unpacked: the bundle grows by a few MB but launches faster.
+use_upx = False
+
+if onefile:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        [],
+        name='tetris',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=use_upx,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=False,  # Set to True for debugging; False hides console window for production
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon=None,  # Add path to .ico file if available
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='tetris',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=use_upx,
+        console=False,  # Set to True for debugging; False hides console window for production
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon=None,  # Add path to .ico file if available
+    )
+
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        strip=False,
+        upx=use_upx,
+        upx_exclude=[],
+        name='tetris',
+    )